@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+asyncio front end for the registrar
+
+AsyncPractiscoreRegistrar wraps a PractiscoreRegistrar so matches can be
+probed and registered alongside other asyncio work. Selenium has no async
+API, so browser steps run in worker threads, at most BROWSER_CONCURRENCY
+(default 2) at a time - one when the browser is reused. Match pages are
+probed over HTTP, at most PROBE_CONCURRENCY (default 8) at a time, with
+aiohttp when it is installed and the requests session in a thread
+otherwise. Both go through the registrar's rate controller and deadline,
+and state and the run report are shared with the sync registrar.
+
+    python async_registrar.py    # one run_check with concurrent probes
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def aiohttp_available() -> bool:
+    try:
+        import aiohttp  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class AsyncPractiscoreRegistrar:
+    def __init__(self, registrar=None, probe_concurrency: int = None, browser_concurrency: int = None,
+                 use_aiohttp: Optional[bool] = None):
+        if registrar is None:
+            from match_registrar import PractiscoreRegistrar
+            registrar = PractiscoreRegistrar()
+        self.sync = registrar
+        browsers = browser_concurrency or int(os.getenv('BROWSER_CONCURRENCY', 2))
+        # The reused browser can only do one thing at a time
+        self.browser_limit = asyncio.Semaphore(1 if registrar.reuse_browser else browsers)
+        self.probe_limit = asyncio.Semaphore(probe_concurrency or int(os.getenv('PROBE_CONCURRENCY', 8)))
+        self.use_aiohttp = aiohttp_available() if use_aiohttp is None else use_aiohttp
+        self._http = None
+
+    async def __aenter__(self) -> "AsyncPractiscoreRegistrar":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        await asyncio.to_thread(self.sync.close_browser)
+
+    async def _browser(self, function, *args, **kwargs):
+        """Run a blocking browser step in a worker thread, within the browser limit"""
+        async with self.browser_limit:
+            return await asyncio.to_thread(function, *args, **kwargs)
+
+    async def get_available_matches(self) -> List[Dict]:
+        return await self._browser(self.sync.get_available_matches)
+
+    async def login(self) -> bool:
+        """Log in with a browser and share its cookies with the HTTP session the probes use"""
+        sync = self.sync
+        driver, logged_in = await self._browser(sync._open_probe_driver)
+        if driver is not None:
+            # login() has already copied the cookies to the session
+            await self._browser(sync._release_driver, driver)
+        return logged_in
+
+    async def _fetch(self, url: str) -> tuple:
+        """(status code, body) of a GET with the registrar's headers and login cookies"""
+        sync = self.sync
+        if not self.use_aiohttp:
+            response = await asyncio.to_thread(sync.session.get, url, timeout=sync.deadline.clamp(30))
+            return response.status_code, response.text
+
+        import aiohttp
+        if self._http is None:
+            self._http = aiohttp.ClientSession(headers=dict(sync.session.headers),
+                                               cookies={c.name: c.value for c in sync.session.cookies})
+        await asyncio.to_thread(sync.rate.acquire, url, sync.deadline)
+        async with self._http.get(url, timeout=aiohttp.ClientTimeout(total=sync.deadline.clamp(30))) as response:
+            text = await response.text()
+        sync.rate.on_status(url, response.status, response.headers.get('Retry-After'))
+        return response.status, text
+
+    async def probe(self, match: Dict, browser: bool = False) -> str:
+        """Registration status of a match - over HTTP, or in a browser if asked"""
+        from match_registrar import paid_title_indicator, probe_page_status
+
+        sync = self.sync
+        title, url = match.get('title', ''), match.get('url', '')
+        if paid_title_indicator(title):
+            return "paid_match"
+        if browser:
+            return await self._browser(sync.check_registration_status, url, title)
+        async with self.probe_limit:
+            try:
+                status_code, text = await self._fetch(sync._full_url(url))
+            except Exception as e:
+                logger.warning(f"Probe of {title} failed: {e}")
+                return "error"
+        if status_code != 200:
+            return "error"
+        return probe_page_status(text, sync._session_logged_in)
+
+    async def register(self, match: Dict) -> bool:
+        """Register for a match and record the outcome"""
+        title, url = match.get('title', ''), match.get('url', '')
+        success = await self._browser(self.sync.register_for_match, url)
+        await asyncio.to_thread(self.sync.record_registration, title, url, success)
+        return success
+
+    async def run_check(self, keep_browser: bool = False) -> Dict[str, str]:
+        """run_check with every due match probed at once; returns the probed statuses"""
+        from deadline import DeadlineExceeded
+        from match_forecast import describe_prediction
+
+        sync = self.sync
+        await asyncio.to_thread(sync._start_run)
+        statuses = {}
+        try:
+            # Log in alongside the club page, as the sync pipeline does, so probes see registrations
+            matches, logged_in = await asyncio.gather(self.get_available_matches(), self.login())
+            if not logged_in:
+                logger.warning("Not logged in - already-registered matches can't be told apart")
+            if not matches:
+                logger.info("No matching events found")
+                return statuses
+            sync.state.update_catalog(matches)
+
+            due = []
+            for match in sync.filter_by_date(matches):
+                title, url = match.get('title', 'Unknown'), match.get('url', '')
+                if sync.state.is_registered(url):
+                    logger.info(f"✅ Already registered (match state): {title}")
+                elif not sync.scheduler.should_probe(title, url, sync.state.get(url)):
+                    logger.info(f"⏳ Probe of {title} deferred - {describe_prediction(sync.forecaster.predict(title, url))}")
+                    sync.report.section('scheduler').setdefault('deferred', []).append(title)
+                else:
+                    if sync.scheduler.in_window(title, url):
+                        sync.rate.boost(sync.base_url)
+                    due.append(match)
+
+            # Gathered in priority order, so the most valuable open matches take the registration slots
+            due = sync.prioritizer.rank(due, sync.report.section('priority'))
+            logger.info(f"Probing {len(due)} matches concurrently")
+            selected = 0
+            registrations = []
+            for match, status in zip(due, await asyncio.gather(*(self.probe(match) for match in due))):
+                title, url = match.get('title', 'Unknown'), match.get('url', '')
+                logger.info(f"{title}: {status}")
+                statuses[title] = status
+                sync.state.record_status(url, title, status)
+                sync.report.section('results')[title] = status
+                if status == "paid_match":
+                    await asyncio.to_thread(sync.notify_paid_match, title, url)
+                elif status == "open":
+                    blocked = sync.registration_blocked(title, url, selected)
+                    if blocked:
+                        logger.info(f"🟢 Registration is open for {title} but not registering: {blocked}")
+                    else:
+                        selected += 1
+                        registrations.append(self.register(match))
+            await asyncio.gather(*registrations)
+        except DeadlineExceeded as e:
+            logger.error(f"⏰ Run deadline of {sync.deadline.seconds:.0f}s reached during {e.phase} - stopping")
+            sync.report.section('deadline')['exceeded_in'] = e.phase
+        finally:
+            await asyncio.to_thread(sync._finish_run, keep_browser)
+        return statuses
+
+async def _main() -> None:
+    async with AsyncPractiscoreRegistrar() as registrar:
+        await registrar.run_check()
+
+if __name__ == "__main__":
+    from logging_setup import setup_logging
+
+    setup_logging()
+    asyncio.run(_main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark - runs the registrar against the local PractiScore stand-in
+
+Reports wall time, page loads and browser starts for run_check, login and
+register_for_match, and compares them against a stored baseline.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+from practiscore_standin import StandinServer
+
+BASELINE_PATH = 'bench_baseline.json'
+
+BENCH_ENV = {
+    'PRACTISCORE_USERNAME': 'bench@example.com',
+    'PRACTISCORE_PASSWORD': 'bench-password',
+    'REGISTRATION_FIRST_NAME': 'Bench',
+    'REGISTRATION_LAST_NAME': 'Shooter',
+    'REGISTRATION_EMAIL': 'bench@example.com',
+    'REGISTRATION_POWER_FACTOR': 'minor',
+    'TARGET_MATCH_NAME': 'NSPS',
+}
+
+
+def _prepare_environment(server: StandinServer) -> None:
+    """Point the registrar at the stand-in and make sure no real notifications go out"""
+    os.environ.update(BENCH_ENV)
+    os.environ['PRACTISCORE_BASE_URL'] = server.url
+    os.environ['RUN_REPORT_PATH'] = os.path.join(tempfile.gettempdir(), 'bench_run_report.json')
+    for name in ['GITHUB_TOKEN', 'TWILIO_ACCOUNT_SID', 'TWILIO_AUTH_TOKEN', 'TWILIO_FROM_NUMBER']:
+        os.environ.pop(name, None)
+
+
+def _measure(registrar, operation) -> dict:
+    start = time.perf_counter()
+    result = operation()
+    wall = time.perf_counter() - start
+    return {
+        'wall_time': round(wall, 3),
+        'page_loads': registrar.report.counters.get('page_loads', 0),
+        'browser_starts': registrar.report.counters.get('browser_starts', 0),
+        'result': result,
+    }
+
+
+def bench_run_check(server: StandinServer) -> dict:
+    from match_registrar import PractiscoreRegistrar
+    registrar = PractiscoreRegistrar()
+    return _measure(registrar, registrar.run_check)
+
+
+def bench_login(server: StandinServer) -> dict:
+    from match_registrar import PractiscoreRegistrar
+    registrar = PractiscoreRegistrar()
+
+    def login():
+        driver = registrar._new_driver()
+        try:
+            return registrar.login(driver)
+        finally:
+            registrar._release_driver(driver)
+
+    return _measure(registrar, login)
+
+
+def bench_register_for_match(server: StandinServer) -> dict:
+    from match_registrar import PractiscoreRegistrar
+    registrar = PractiscoreRegistrar()
+    target = next(m for m in server.matches if m['status'] == 'open')
+    return _measure(registrar, lambda: registrar.register_for_match(f"/{target['slug']}/register"))
+
+
+BENCHMARKS = {
+    'run_check': bench_run_check,
+    'login': bench_login,
+    'register_for_match': bench_register_for_match,
+}
+
+
+def run_benchmarks(scenario: str, latency: float, cloudflare: int, full: bool, selected=None) -> dict:
+    """Run the selected benchmarks against a fresh stand-in; returns {name: metrics}"""
+    results = {}
+    with StandinServer(latency=latency, cloudflare_challenges=cloudflare, full_rosters=full) as server:
+        _prepare_environment(server)
+        for name, bench in BENCHMARKS.items():
+            if selected and name not in selected:
+                continue
+            server.reset()
+            print(f"⏱️  [{scenario}] {name}...")
+            results[name] = bench(server)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return a list of regression descriptions (empty if none)"""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if metrics['wall_time'] > base['wall_time'] * (1 + tolerance):
+            regressions.append(f"{name}: wall time {metrics['wall_time']}s vs baseline {base['wall_time']}s")
+        for counter in ['page_loads', 'browser_starts']:
+            if metrics[counter] > base[counter]:
+                regressions.append(f"{name}: {counter} {metrics[counter]} vs baseline {base[counter]}")
+    return regressions
+
+
+def print_results(scenario: str, results: dict, baseline: dict) -> None:
+    print(f"\n📊 Scenario: {scenario}")
+    print("=" * 80)
+    print(f"{'benchmark':<22}{'wall (s)':>10}{'base (s)':>10}{'loads':>8}{'base':>6}{'starts':>8}{'base':>6}")
+    for name, metrics in results.items():
+        base = baseline.get(name, {})
+        print(f"{name:<22}{metrics['wall_time']:>10.2f}{base.get('wall_time', float('nan')):>10.2f}"
+              f"{metrics['page_loads']:>8}{base.get('page_loads', '-'):>6}"
+              f"{metrics['browser_starts']:>8}{base.get('browser_starts', '-'):>6}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline end-to-end registrar benchmark")
+    parser.add_argument('--scenario', default='default', help="Name used to store/compare the baseline")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds of latency per stand-in response")
+    parser.add_argument('--cloudflare', type=int, default=0, help="Cloudflare challenges to serve on the club page")
+    parser.add_argument('--full', action='store_true', help="Serve every open match as full")
+    parser.add_argument('--only', nargs='*', choices=list(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed wall time regression (fraction)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scenario, args.latency, args.cloudflare, args.full, args.only)
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    baseline = baselines.get(args.scenario, {})
+
+    print_results(args.scenario, results, baseline)
+
+    if args.save_baseline:
+        baselines[args.scenario] = {
+            name: {k: v for k, v in metrics.items() if k != 'result'} for name, metrics in results.items()
+        }
+        with open(args.baseline, 'w') as f:
+            json.dump(baselines, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nℹ️  No baseline for scenario '{args.scenario}' - run with --save-baseline to store one")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Regressions:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
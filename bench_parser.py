@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Parser microbenchmarks over synthetic large club pages
+
+Times club page parsing (parse_match_elements) and status classification
+(paid_title_indicator + classify_match_page) without a browser, and tracks
+peak memory with tracemalloc.
+"""
+
+import sys
+import time
+import logging
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List, Dict
+
+from practiscore_standin import StandinServer, club_page_html, match_page, match_slug
+from match_registrar import parse_match_elements, paid_title_indicator, classify_match_page
+
+SIZES = [100, 1000, 10000]
+
+MATCH_NAMES = [
+    "NSPS Run & Gun",
+    "NSPS Practice with Purpose",
+    "NSPS Run & Gun - with USPSA Classifiers",
+    "Tri-County Outlaw Match",
+    "Lakeshore Steel Challenge",
+]
+
+STATUSES = ['open', 'not_open', 'full', 'closed']
+
+
+def synthetic_matches(count: int) -> List[Dict]:
+    """Generate a club's match history - mostly past matches, like a long-lived club page"""
+    today = datetime.now()
+    matches = []
+    for i in range(count):
+        name = MATCH_NAMES[i % len(MATCH_NAMES)]
+        date = today + timedelta(days=30 - i)
+        title = f"{name} {date.strftime('%m/%d/%y')} #{i}"
+        matches.append({'title': title, 'slug': match_slug(title), 'status': STATUSES[i % len(STATUSES)]})
+    return matches
+
+
+def _timed(func, repeat: int):
+    """Best wall time over repeat runs, plus tracemalloc peak of one run"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def bench_parse(count: int, repeat: int) -> Dict:
+    html = club_page_html(synthetic_matches(count))
+    seconds, peak, matches = _timed(lambda: parse_match_elements(html, 'NSPS'), repeat)
+    return {
+        'entries': count,
+        'page_bytes': len(html),
+        'matched': len(matches),
+        'seconds': seconds,
+        'matches_per_second': count / seconds,
+        'peak_mb': peak / 1024 / 1024,
+    }
+
+
+def bench_classify(count: int, repeat: int) -> Dict:
+    matches = synthetic_matches(count)
+    standin = StandinServer(matches=matches)
+    pages = [(m['title'], match_page(standin, m, None)) for m in matches]
+
+    def classify():
+        statuses = {}
+        for title, page_source in pages:
+            status = "paid_match" if paid_title_indicator(title) else classify_match_page(page_source)
+            statuses[status] = statuses.get(status, 0) + 1
+        return statuses
+
+    seconds, peak, statuses = _timed(classify, repeat)
+    return {
+        'entries': count,
+        'statuses': statuses,
+        'seconds': seconds,
+        'matches_per_second': count / seconds,
+        'peak_mb': peak / 1024 / 1024,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Parser microbenchmarks over synthetic club pages")
+    parser.add_argument('--sizes', type=int, nargs='*', default=SIZES, help="Match entries per page")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed repetitions (best is reported)")
+    parser.add_argument('--with-logging', action='store_true',
+                        help="Keep the registrar's INFO logging enabled while parsing")
+    args = parser.parse_args(argv)
+
+    if not args.with_logging:
+        logging.getLogger('match_registrar').setLevel(logging.WARNING)
+
+    print("📄 Club page parsing (parse_match_elements)")
+    print(f"{'entries':>8}{'page KB':>10}{'matched':>9}{'seconds':>10}{'matches/s':>12}{'peak MB':>9}")
+    for size in args.sizes:
+        r = bench_parse(size, args.repeat)
+        print(f"{r['entries']:>8}{r['page_bytes'] / 1024:>10.0f}{r['matched']:>9}{r['seconds']:>10.3f}"
+              f"{r['matches_per_second']:>12.0f}{r['peak_mb']:>9.1f}")
+
+    print("\n🏷️  Status classification (paid_title_indicator + classify_match_page)")
+    print(f"{'entries':>8}{'seconds':>10}{'matches/s':>12}{'peak MB':>9}  statuses")
+    for size in args.sizes:
+        r = bench_classify(size, args.repeat)
+        print(f"{r['entries']:>8}{r['seconds']:>10.3f}{r['matches_per_second']:>12.0f}{r['peak_mb']:>9.1f}  {r['statuses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark - import time of the registrar and the CLI entry points
+
+Runs each target in a fresh interpreter with `python -X importtime` and reports
+the total import time, the slowest top-level imports and whether any heavy
+dependency (selenium, bs4, requests) was pulled in at startup.
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+from typing import Dict, List
+
+HEAVY_MODULES = ['selenium', 'bs4', 'requests', 'pytz', 'urllib3']
+
+TARGETS = {
+    'import match_registrar': [sys.executable, '-X', 'importtime', '-c', 'import match_registrar'],
+    'import notifications': [sys.executable, '-X', 'importtime', '-c', 'import notifications'],
+    'match_registrar.py --help': [sys.executable, '-X', 'importtime', 'match_registrar.py', '--help'],
+    'show_available_matches.py --help': [sys.executable, '-X', 'importtime', 'show_available_matches.py', '--help'],
+}
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Parse `-X importtime` lines into {module, self_us, cumulative_us, depth} dicts"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        except ValueError:
+            continue
+        name = name.rstrip()[1:]  # one space separates the column from the indented name
+        rows.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip())) // 2,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+        })
+    return rows
+
+
+def measure(command: List[str], repeat: int) -> Dict:
+    """Best wall time and the import profile of the fastest run"""
+    env = dict(os.environ, PRACTISCORE_USERNAME='bench', PRACTISCORE_PASSWORD='bench')
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True, env=env)
+        wall = time.perf_counter() - start
+        if best is None or wall < best['wall']:
+            best = {'wall': wall, 'stderr': result.stderr}
+    rows = parse_importtime(best['stderr'])
+    top_level = [r for r in rows if r['depth'] == 0]
+    return {
+        'wall': best['wall'],
+        'import_us': sum(r['cumulative_us'] for r in top_level),
+        'slowest': sorted(top_level, key=lambda r: -r['cumulative_us'])[:5],
+        'heavy': sorted({r['module'].split('.')[0] for r in rows} & set(HEAVY_MODULES)),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure startup and import time of the entry points")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per target (fastest is reported)")
+    parser.add_argument('--strict', action='store_true', help="Fail if a heavy module is imported at startup")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, command in TARGETS.items():
+        result = measure(command, args.repeat)
+        print(f"\n🚀 {name}")
+        print(f"   wall: {result['wall'] * 1000:.0f} ms, imports: {result['import_us'] / 1000:.1f} ms")
+        for row in result['slowest']:
+            print(f"   {row['cumulative_us'] / 1000:>8.1f} ms  {row['module']}")
+        if result['heavy']:
+            print(f"   ⚠️  heavy modules imported at startup: {', '.join(result['heavy'])}")
+            failed = True
+        else:
+            print("   ✅ no heavy modules imported at startup")
+
+    return 1 if failed and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
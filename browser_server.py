@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Long-lived local Chrome that short-lived tools attach to
+
+`python browser_server.py start` launches headless Chrome with a remote
+debugging port and a persistent profile (so the PractiScore login sticks).
+PractiscoreRegistrar attaches to it through `debuggerAddress` instead of
+launching its own browser, and falls back to a local launch when no server
+is running. BROWSER_SERVER=off disables attaching.
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+import subprocess
+import urllib.request
+from typing import Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+CHROME_PATHS = [
+    '/snap/bin/chromium',
+    '/usr/bin/google-chrome',
+    '/opt/hostedtoolcache/setup-chrome/chrome/stable/x64/chrome',
+    '/usr/bin/chromium-browser',
+    '/usr/bin/chrome'
+]
+
+DEFAULT_PORT = 9222
+STATE_FILE = os.getenv('BROWSER_SERVER_STATE', '.browser_server.json')
+PROFILE_DIR = os.getenv('BROWSER_SERVER_PROFILE', os.path.abspath('.browser_profile'))
+
+SERVER_ARGS = [
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=VizDisplayCompositor',
+    '--window-size=1920,1080',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
+    '--no-first-run',
+    '--no-default-browser-check',
+]
+
+def find_chrome_binary() -> Optional[str]:
+    """First Chrome/Chromium binary found in the expected locations"""
+    for chrome_path in CHROME_PATHS:
+        if os.path.exists(chrome_path):
+            return chrome_path
+    return None
+
+def _read_state() -> Optional[Dict]:
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+def _devtools_version(port: int, timeout: float = 1.0) -> Optional[Dict]:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=timeout) as response:
+            return json.load(response)
+    except Exception:
+        return None
+
+def server_status() -> Optional[Dict]:
+    """State of the running server, or None if it is not running"""
+    state = _read_state()
+    if not state or not _pid_alive(state['pid']):
+        return None
+    version = _devtools_version(state['port'])
+    if not version:
+        return None
+    return dict(state, browser=version.get('Browser', ''))
+
+def server_address() -> Optional[str]:
+    """host:port to attach to, or None if attaching is disabled or no server is running"""
+    if os.getenv('BROWSER_SERVER', 'on').lower() in ('0', 'off', 'false'):
+        return None
+    status = server_status()
+    return f"127.0.0.1:{status['port']}" if status else None
+
+def start_server(port: int = DEFAULT_PORT, wait: float = 15.0) -> Dict:
+    """Launch Chrome with remote debugging (no-op if already running)"""
+    status = server_status()
+    if status:
+        return status
+
+    chrome = find_chrome_binary()
+    if not chrome:
+        raise RuntimeError("No Chrome binary found in expected locations")
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    command = [chrome, f'--remote-debugging-port={port}', f'--user-data-dir={PROFILE_DIR}'] + SERVER_ARGS
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    state = {'pid': process.pid, 'port': port, 'started_at': time.time(), 'profile': PROFILE_DIR}
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f)
+
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        if _devtools_version(port):
+            logger.info(f"🌐 Browser server running on port {port} (pid {process.pid})")
+            return server_status()
+        time.sleep(0.2)
+    stop_server()
+    raise RuntimeError(f"Chrome did not open the debugging port {port} within {wait:.0f}s")
+
+def stop_server() -> bool:
+    """Stop the server's process group; returns True if something was stopped"""
+    state = _read_state()
+    stopped = False
+    if state and _pid_alive(state['pid']):
+        try:
+            os.killpg(state['pid'], signal.SIGTERM)
+            stopped = True
+        except OSError:
+            pass
+    if os.path.exists(STATE_FILE):
+        os.remove(STATE_FILE)
+    return stopped
+
+def login_server() -> bool:
+    """Log the server's browser in to PractiScore so attached tools start logged in"""
+    from match_registrar import PractiscoreRegistrar
+
+    registrar = PractiscoreRegistrar()
+    driver = registrar._new_driver()
+    try:
+        return registrar.login(driver)
+    finally:
+        registrar._release_driver(driver)
+
+if __name__ == "__main__":
+    from logging_setup import setup_logging
+
+    parser = argparse.ArgumentParser(description="Manage the long-lived local Chrome")
+    parser.add_argument('command', choices=['start', 'status', 'stop'])
+    parser.add_argument('--port', type=int, default=int(os.getenv('BROWSER_SERVER_PORT', DEFAULT_PORT)))
+    parser.add_argument('--login', action='store_true', help="Log in to PractiScore after starting")
+    args = parser.parse_args()
+    setup_logging()
+
+    if args.command == 'start':
+        try:
+            status = start_server(args.port)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ Browser server running: pid {status['pid']}, port {status['port']}, {status['browser']}")
+        if args.login:
+            print("🔐 Logged in" if login_server() else "❌ Login failed")
+    elif args.command == 'status':
+        status = server_status()
+        if status:
+            uptime = (time.time() - status['started_at']) / 60
+            print(f"🟢 Running: pid {status['pid']}, port {status['port']}, {status['browser']}, up {uptime:.0f} min")
+        else:
+            print("⚪ Not running - tools will launch their own browser")
+    else:
+        print("🛑 Stopped" if stop_server() else "⚪ Not running")
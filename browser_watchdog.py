@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Memory watchdog for a browser that is reused across many navigations
+
+ManagedDriver wraps a WebDriver for daemon-style runs. Every few navigations
+it samples the RSS of the browser process tree from /proc. When a renderer
+grows too large or a tab has served too many navigations the tab is recycled;
+when the whole tree passes its limit or the navigation count is reached the
+browser is restarted and the session restored from cookies.
+"""
+
+import os
+import logging
+from typing import Dict, Optional, Callable
+
+from process_info import read_proc, process_tree
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def tree_memory(pid: int) -> Dict[str, float]:
+    """RSS in MB of a browser process tree, split into renderers and everything else"""
+    memory = {'browser_mb': 0.0, 'renderers_mb': 0.0, 'largest_renderer_mb': 0.0, 'processes': 0}
+    if not os.path.isdir('/proc'):
+        return memory
+    for process in process_tree(pid):
+        statm = read_proc(process, 'statm')
+        if not statm:
+            continue
+        rss_mb = int(statm.split()[1]) * PAGE_SIZE / 1024 / 1024
+        cmdline = read_proc(process, 'cmdline') or ''
+        memory['processes'] += 1
+        if '--type=renderer' in cmdline:
+            memory['renderers_mb'] += rss_mb
+            memory['largest_renderer_mb'] = max(memory['largest_renderer_mb'], rss_mb)
+        else:
+            memory['browser_mb'] += rss_mb
+    memory['total_mb'] = memory['browser_mb'] + memory['renderers_mb']
+    return memory
+
+def driver_root_pid(driver) -> Optional[int]:
+    """Root pid of the driver's process tree (chromedriver)
+    
+    None when attached to the browser server: its tree is shared with every other tab,
+    and restarting an attached driver only replaces our tab, so its RSS is no limit of ours.
+    """
+    if getattr(driver, '_matchreg_attached', False):
+        return None
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    return process.pid if process else None
+
+class ManagedDriver:
+    """A long-lived driver that recycles tabs and restarts itself to bound memory"""
+
+    def __init__(self, start_driver: Callable, stop_driver: Callable, restore_url: str, report=None):
+        self._start_driver = start_driver
+        self._stop_driver = stop_driver
+        self.restore_url = restore_url
+        self.report = report
+        self.max_total_mb = float(os.getenv('BROWSER_MAX_RSS_MB', 1500))
+        self.max_renderer_mb = float(os.getenv('BROWSER_MAX_RENDERER_RSS_MB', 600))
+        self.max_navigations = int(os.getenv('BROWSER_MAX_NAVIGATIONS', 200))
+        self.max_tab_navigations = int(os.getenv('TAB_MAX_NAVIGATIONS', 50))
+        self.sample_every = int(os.getenv('WATCHDOG_SAMPLE_EVERY', 5))
+        self.stats = {'restarts': 0, 'tab_recycles': 0, 'navigations': 0, 'peak_rss_mb': 0.0, 'samples': 0}
+        self.driver = self._start_driver()
+        self._navigations = 0
+        self._tab_navigations = 0
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def get(self, url: str) -> None:
+        self.driver.get(url)
+        self._navigations += 1
+        self._tab_navigations += 1
+        self.stats['navigations'] += 1
+        if self._navigations % self.sample_every == 0 or self._navigations >= self.max_navigations:
+            self.check()
+
+    def sample(self) -> Dict[str, float]:
+        pid = driver_root_pid(self.driver)
+        memory = tree_memory(pid) if pid else {'total_mb': 0.0, 'largest_renderer_mb': 0.0}
+        self.stats['samples'] += 1
+        self.stats['peak_rss_mb'] = round(max(self.stats['peak_rss_mb'], memory.get('total_mb', 0.0)), 1)
+        return memory
+
+    def check(self) -> None:
+        """Sample memory and recycle or restart if a limit is reached"""
+        memory = self.sample()
+        logger.debug("Browser memory: %.0f MB total, largest renderer %.0f MB",
+                     memory.get('total_mb', 0.0), memory.get('largest_renderer_mb', 0.0))
+        if self._navigations >= self.max_navigations or memory.get('total_mb', 0.0) > self.max_total_mb:
+            self.restart(f"{self._navigations} navigations, {memory.get('total_mb', 0.0):.0f} MB")
+        elif (self._tab_navigations >= self.max_tab_navigations
+              or memory.get('largest_renderer_mb', 0.0) > self.max_renderer_mb):
+            self.recycle_tab()
+        self._publish()
+
+    def recycle_tab(self) -> None:
+        """Replace the current tab with a fresh one (drops the old renderer's memory)"""
+        old_handle = self.driver.current_window_handle
+        current_url = self.driver.current_url
+        self.driver.switch_to.new_window('tab')
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        if current_url.startswith('http'):
+            self.driver.get(current_url)
+        self._tab_navigations = 0
+        self.stats['tab_recycles'] += 1
+        logger.info("♻️  Recycled browser tab")
+
+    def restart(self, reason: str) -> None:
+        """Restart the browser and restore the session from cookies"""
+        logger.info(f"🔄 Restarting browser ({reason})")
+        try:
+            cookies = self.driver.get_cookies()
+            current_url = self.driver.current_url
+        except Exception:
+            cookies, current_url = [], ''
+        self._stop_driver(self.driver)
+        self.driver = self._start_driver()
+        self._navigations = 0
+        self._tab_navigations = 0
+        self.stats['restarts'] += 1
+        if cookies:
+            # Cookies can only be set for the domain that is currently loaded
+            self.driver.get(self.restore_url)
+            for cookie in cookies:
+                cookie.pop('sameSite', None)
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception as e:
+                    logger.debug("Could not restore cookie %s: %s", cookie.get('name'), e)
+        if current_url.startswith('http'):
+            self.driver.get(current_url)
+
+    def _publish(self) -> None:
+        if self.report is not None:
+            self.report.sections['browser_watchdog'] = dict(self.stats)
+
+    def close(self) -> None:
+        self._publish()
+        self._stop_driver(self.driver)
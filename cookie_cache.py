@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of the PractiScore login cookies
+
+After a browser login the cookies are written to COOKIE_CACHE_PATH
+(default .practiscore_cookies.json, owner-readable only). The next process
+loads them into the requests session and the browser, so chained commands
+do not log in again. COOKIE_CACHE=off disables the cache.
+"""
+
+import os
+import json
+import time
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COOKIE_PATH = '.practiscore_cookies.json'
+
+def cookie_cache_path():
+    """Path of the cookie cache, or None if it is disabled"""
+    if os.getenv('COOKIE_CACHE', 'on').lower() in ('0', 'off', 'false'):
+        return None
+    return os.getenv('COOKIE_CACHE_PATH', DEFAULT_COOKIE_PATH)
+
+def load_cookies(path: str) -> List[Dict]:
+    """Unexpired cookies from the cache (empty if there is none)"""
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return []
+    now = time.time()
+    return [cookie for cookie in cached.get('cookies', []) if cookie.get('expiry', now + 1) > now]
+
+def save_cookies(path: str, cookies: List[Dict]) -> None:
+    """Write cookies to the cache, readable by the owner only"""
+    tmp_path = f"{path}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'saved_at': time.time(), 'cookies': cookies}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save cookies to {path}: {e}")
+
+def clear_cookies(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Overall time limit for a run
+
+A Deadline is created per run from RUN_DEADLINE_SECONDS (0 = no limit) and
+passed through navigation, login, probing, registration and notification.
+Every wait is clamped to the remaining budget. Once the budget is spent the
+next check raises DeadlineExceeded, naming the phase that ran out of time.
+"""
+
+import os
+import time
+import inspect
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class DeadlineExceeded(BaseException):
+    """Raised when a run's deadline has passed
+
+    A BaseException (like KeyboardInterrupt) so that the broad `except Exception`
+    blocks around each step let it through and the run stops instead of moving on.
+    """
+
+    def __init__(self, phase: str):
+        super().__init__(f"run deadline reached during {phase}")
+        self.phase = phase
+
+class Deadline:
+    def __init__(self, seconds: Optional[float] = None):
+        self.seconds = seconds or None
+        self.started = time.monotonic()
+        self.expires_at = self.started + seconds if seconds else None
+        self._local = threading.local()
+
+    @property
+    def phase(self) -> str:
+        """Work in progress on this thread (login and the club page fetch overlap)"""
+        return getattr(self._local, 'phase', 'startup')
+
+    @phase.setter
+    def phase(self, name: str) -> None:
+        self._local.phase = name
+
+    @classmethod
+    def from_env(cls) -> "Deadline":
+        return cls(float(os.getenv('RUN_DEADLINE_SECONDS', 0)))
+
+    def remaining(self) -> float:
+        """Seconds left (infinite without a limit)"""
+        if self.expires_at is None:
+            return float('inf')
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has passed"""
+        if self.expired():
+            raise DeadlineExceeded(self.phase)
+
+    def clamp(self, step: float) -> float:
+        """A step timeout cut down to the remaining budget"""
+        return min(step, self.remaining())
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for at most the remaining budget, then check it"""
+        time.sleep(self.clamp(seconds))
+        self.check()
+
+    @contextmanager
+    def phase_of(self, name: str):
+        """Name the work in progress, for the report if the deadline is reached"""
+        previous, self.phase = self.phase, name
+        self.check()
+        try:
+            yield self
+        finally:
+            self.phase = previous
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+def in_phase(name: str):
+    """Run a registrar method as a named phase of the registrar's deadline"""
+    def decorator(method):
+        if inspect.isgeneratorfunction(method):
+            # The phase lasts until the generator is exhausted or closed
+            @functools.wraps(method)
+            def generator(self, *args, **kwargs):
+                with self.deadline.phase_of(name):
+                    yield from method(self, *args, **kwargs)
+            return generator
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.deadline.phase_of(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
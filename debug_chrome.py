@@ -8,6 +8,7 @@ import sys
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from browser_server import CHROME_PATHS, server_status
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,14 +22,15 @@ def debug_chrome():
     logger.info(f"Python version: {sys.version}")
     logger.info(f"DISPLAY: {os.environ.get('DISPLAY', 'Not set')}")
     
+    # Check the long-lived browser server the registrar attaches to
+    status = server_status()
+    if status:
+        logger.info(f"Browser server: running (pid {status['pid']}, port {status['port']}, {status['browser']})")
+    else:
+        logger.info("Browser server: not running (tools launch their own Chrome)")
+    
     # Check Chrome binary locations
-    chrome_paths = [
-        '/snap/bin/chromium',
-        '/usr/bin/google-chrome', 
-        '/opt/hostedtoolcache/setup-chrome/chrome/stable/x64/chrome',
-        '/usr/bin/chromium-browser',
-        '/usr/bin/chrome'
-    ]
+    chrome_paths = CHROME_PATHS
     
     for chrome_path in chrome_paths:
         exists = os.path.exists(chrome_path)
@@ -96,5 +98,13 @@ def debug_chrome():
         return False
 
 if __name__ == "__main__":
-    success = debug_chrome()
+    import argparse
+    from profiling import add_profile_arguments, profile_mode, trace_webdriver_enabled, run_profiled
+    
+    parser = argparse.ArgumentParser(description="Debug Chrome driver setup")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    
+    success = run_profiled("debug_chrome", debug_chrome,
+                           mode=profile_mode(args), trace_webdriver=trace_webdriver_enabled(args))
     sys.exit(0 if success else 1)
\ No newline at end of file
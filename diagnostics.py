@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Failure diagnostics written in the background
+
+When a registration fails or ends unclear, the page is captured - screenshot,
+DOM, console log and network log - and handed to a writer thread that
+compresses it into one .tar.gz per failure under DIAGNOSTICS_DIR (default
+diagnostics/). Only the newest DIAGNOSTICS_KEEP bundles (default 20) are kept.
+The caller only pays for reading the page from the browser; compression and
+disk I/O never hold up the registration path. DIAGNOSTICS=off disables it.
+
+Bundles are scrubbed before they are written: cookie and authorization
+headers are dropped, form input values are masked and the login and
+registration details from the environment are replaced wherever they appear.
+The network log is not captured - its requests carry the session cookies.
+"""
+
+import io
+import os
+import re
+import json
+import time
+import queue
+import tarfile
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIAGNOSTICS_DIR = 'diagnostics'
+SECRET_HEADERS = ('set-cookie', 'cookie', 'authorization', 'proxy-authorization')
+# Personal and login details masked wherever they show up in a bundle
+REDACTED_VARIABLES = ('PRACTISCORE_USERNAME', 'PRACTISCORE_PASSWORD', 'REGISTRATION_FIRST_NAME',
+                      'REGISTRATION_LAST_NAME', 'REGISTRATION_EMAIL')
+MASK = '***'
+
+INPUT_VALUE = re.compile(r'(<input\b[^>]*?\bvalue\s*=\s*)("[^"]*"|\'[^\']*\')', re.IGNORECASE)
+TEXTAREA_TEXT = re.compile(r'(<textarea\b[^>]*>).*?(</textarea>)', re.IGNORECASE | re.DOTALL)
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')[:60]
+
+def _read(name: str, read):
+    """A piece of the page from the driver, or None if this driver can't provide it"""
+    try:
+        return read()
+    except Exception as e:
+        logger.debug(f"Diagnostics: no {name}: {e}")
+        return None
+
+def scrub_headers(headers: Dict) -> Dict:
+    """Response headers without cookies or credentials"""
+    return {name: value for name, value in headers.items() if name.lower() not in SECRET_HEADERS}
+
+def scrub_html(html: str) -> str:
+    """Page with every form input value and textarea masked"""
+    html = INPUT_VALUE.sub(lambda m: f'{m.group(1)}"{MASK}"', html)
+    return TEXTAREA_TEXT.sub(lambda m: f'{m.group(1)}{MASK}{m.group(2)}', html)
+
+class DiagnosticsRecorder:
+    def __init__(self, directory: Optional[str], keep: int = 20, queue_size: int = 8,
+                 redact: List[str] = ()):
+        self.directory = directory
+        self.keep = keep
+        self.redact = sorted({value for value in redact if value and len(value) > 2}, key=len, reverse=True)
+        # Whole words only, so a first name like "Pat" leaves "Patch" alone
+        self._redact_pattern = (re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, self.redact)) + r')(?!\w)')
+                                if self.redact else None)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {'captured': 0, 'written': 0, 'dropped': 0, 'write_errors': 0}
+
+    @classmethod
+    def from_env(cls) -> "DiagnosticsRecorder":
+        enabled = os.getenv('DIAGNOSTICS', 'on').lower() not in ('0', 'off', 'false')
+        directory = os.getenv('DIAGNOSTICS_DIR', DEFAULT_DIAGNOSTICS_DIR) if enabled else None
+        return cls(directory, keep=int(os.getenv('DIAGNOSTICS_KEEP', 20)),
+                   redact=[os.getenv(name, '') for name in REDACTED_VARIABLES])
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def capture(self, reason: str, driver=None, context: Dict = None, response=None) -> None:
+        """Snapshot a browser page (or an HTTP response) and queue it to be written"""
+        if not self.enabled:
+            return
+        bundle = {'reason': reason, 'captured_at': time.time(), 'context': context or {}, 'files': {}}
+        files = bundle['files']
+        if driver is not None:
+            bundle['context']['url'] = _read('URL', lambda: driver.current_url)
+            files['screenshot.png'] = _read('screenshot', lambda: driver.get_screenshot_as_png())
+            files['page.html'] = _read('DOM', lambda: driver.page_source)
+            files['console.json'] = _read('console log', lambda: driver.get_log('browser'))
+        if response is not None:
+            bundle['context'].update({'url': response.url, 'status': response.status_code})
+            files['response.html'] = response.text
+            files['headers.json'] = scrub_headers(dict(response.headers))
+
+        self.stats['captured'] += 1
+        bundle['sequence'] = self.stats['captured']
+        self._start()
+        try:
+            self._queue.put_nowait(bundle)
+        except queue.Full:
+            # Never wait for the writer; a burst of failures only loses the extra captures
+            self.stats['dropped'] += 1
+            logger.warning(f"Diagnostics queue full - dropped capture for {reason}")
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='diagnostics', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            bundle = self._queue.get()
+            try:
+                path = self._write(bundle)
+                self.stats['written'] += 1
+                logger.info(f"🩺 Diagnostics for {bundle['reason']} written to {path}")
+                self._prune()
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                logger.warning(f"Could not write diagnostics: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, bundle: Dict) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(bundle['captured_at']))
+        name = f"{stamp}-{bundle['sequence']:03d}-{_slug(bundle['reason'])}"
+        path = os.path.join(self.directory, f"{name}.tar.gz")
+        members = {'meta.json': {k: v for k, v in bundle.items() if k != 'files'}}
+        members.update({k: v for k, v in bundle['files'].items() if v is not None})
+        members = {member: self._scrub(member, content) for member, content in members.items()}
+
+        tmp_path = f"{path}.tmp"
+        with tarfile.open(tmp_path, 'w:gz') as archive:
+            for member, content in members.items():
+                data = content.encode() if isinstance(content, str) else content
+                info = tarfile.TarInfo(f"{name}/{member}")
+                info.size = len(data)
+                info.mtime = int(bundle['captured_at'])
+                archive.addfile(info, io.BytesIO(data))
+        os.replace(tmp_path, path)
+        return path
+
+    def _scrub(self, member: str, content):
+        """Bundle member with form values and personal details masked (screenshots are left as they are)"""
+        if isinstance(content, bytes):
+            return content
+        text = content if isinstance(content, str) else json.dumps(content, indent=2, default=str)
+        if member.endswith('.html'):
+            text = scrub_html(text)
+        if self._redact_pattern:
+            text = self._redact_pattern.sub(MASK, text)
+        return text
+
+    def _prune(self) -> None:
+        """Keep only the newest bundles"""
+        bundles = sorted(f for f in os.listdir(self.directory) if f.endswith('.tar.gz'))
+        for old in bundles[:max(0, len(bundles) - self.keep)]:
+            os.remove(os.path.join(self.directory, old))
+
+    def flush(self, timeout: float = 30) -> bool:
+        """Wait (up to timeout) for queued captures to be written; True if they all were"""
+        # Queue.join has no timeout, so wait for it on a helper thread
+        waiter = threading.Thread(target=self._queue.join, name='diagnostics-flush', daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        return not waiter.is_alive()
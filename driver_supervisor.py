@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Timeouts and process cleanup for the Chrome drivers a run starts
+
+Every session gets a page-load and script timeout so a hung page can't
+stall a step. The chromedriver and Chrome process tree of each driver is
+recorded when it starts; stopping a driver quits it with a time limit and
+kills whatever of the tree is still running. Chrome started by a run carries
+--matchreg-owner=<pid>, and each chromedriver's pid is recorded with the run's
+pid in DRIVER_PID_PATH (default .matchreg_drivers.json), so trees left behind
+by an earlier run that crashed are found and killed when the next run starts.
+Processes this tool did not start are never touched.
+"""
+
+import os
+import json
+import time
+import signal
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from process_info import children_map, read_proc, process_tree
+
+logger = logging.getLogger(__name__)
+
+OWNER_SWITCH = '--matchreg-owner='
+DEFAULT_PID_PATH = '.matchreg_drivers.json'
+
+def owner_argument() -> str:
+    """Chrome switch naming this process as the browser's owner"""
+    return f"{OWNER_SWITCH}{os.getpid()}"
+
+def _alive(pid: int) -> bool:
+    stat = read_proc(pid, 'stat')
+    # A zombie has exited and only waits for its parent to collect it
+    return bool(stat) and stat[stat.rfind(')') + 2:].split()[0] != 'Z'
+
+def _parent(pid: int) -> Optional[int]:
+    stat = read_proc(pid, 'stat')
+    return int(stat[stat.rfind(')') + 2:].split()[1]) if stat else None
+
+def _cmdline(pid: int) -> str:
+    return (read_proc(pid, 'cmdline') or '').replace('\0', ' ')
+
+def _owner(cmdline: str) -> Optional[int]:
+    start = cmdline.find(OWNER_SWITCH)
+    if start < 0:
+        return None
+    value = cmdline[start + len(OWNER_SWITCH):].split(' ', 1)[0]
+    return int(value) if value.isdigit() else None
+
+def kill_tree(pids: List[int], grace: float = 2.0) -> int:
+    """SIGTERM the processes, SIGKILL the ones still running after the grace period; returns how many were running"""
+    running = [pid for pid in pids if pid != os.getpid() and _alive(pid)]
+    for pid in running:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline and any(_alive(pid) for pid in running):
+        time.sleep(0.05)
+    for pid in running:
+        if _alive(pid):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    return len(running)
+
+def find_orphans(recorded: Dict[int, int] = None) -> List[List[int]]:
+    """Process trees of Chrome browsers and chromedrivers whose owning run has exited
+
+    recorded maps chromedriver pids to the pid of the run that started them.
+    """
+    if not os.path.isdir('/proc'):
+        return []
+    roots = set()
+    for pids in children_map().values():
+        for pid in pids:
+            cmdline = _cmdline(pid)
+            owner = _owner(cmdline)
+            if owner is None or '--type=' in cmdline or _alive(owner):
+                continue
+            parent = _parent(pid)
+            roots.add(parent if parent and 'chromedriver' in _cmdline(parent) else pid)
+    # A chromedriver left behind by a run that crashed before its Chrome started (the
+    # name check guards against the pid having been reused)
+    for pid, owner in (recorded or {}).items():
+        if _alive(pid) and not _alive(owner) and 'chromedriver' in _cmdline(pid):
+            roots.add(pid)
+    return [process_tree(root) for root in sorted(roots)]
+
+class DriverSupervisor:
+    """Applies session timeouts and makes sure stopped drivers leave no processes behind"""
+
+    def __init__(self):
+        self.page_load_timeout = float(os.getenv('PAGE_LOAD_TIMEOUT_SECONDS', 45))
+        self.script_timeout = float(os.getenv('SCRIPT_TIMEOUT_SECONDS', 30))
+        self.quit_timeout = float(os.getenv('DRIVER_QUIT_TIMEOUT_SECONDS', 10))
+        self.pid_path = os.getenv('DRIVER_PID_PATH', DEFAULT_PID_PATH)
+        self._pid_lock = threading.Lock()
+        self._reaped_at_startup = False
+        self.stats = {'sessions': 0, 'orphans_reaped': 0, 'processes_killed': 0, 'hung_quits': 0}
+
+    def track(self, driver, root_pid: Optional[int]) -> None:
+        """Set the session timeouts and remember the driver's process tree"""
+        try:
+            driver.set_page_load_timeout(self.page_load_timeout)
+            driver.set_script_timeout(self.script_timeout)
+        except Exception as e:
+            logger.debug(f"Could not set driver timeouts: {e}")
+        self.stats['sessions'] += 1
+        if root_pid and os.path.isdir('/proc'):
+            # Kept on the driver so wrappers (recording, watchdog) reach it too
+            driver._matchreg_tree = process_tree(root_pid)
+            self._update_records(lambda records: records.update({root_pid: os.getpid()}))
+
+    def stop(self, driver, stop) -> None:
+        """Run stop(driver) (quit or disconnect) within the quit timeout, then kill what is left of its tree"""
+        tree = getattr(driver, '_matchreg_tree', None) or []
+        if tree and _alive(tree[0]):
+            # Renderers started since the driver was tracked
+            tree = list(dict.fromkeys(tree + process_tree(tree[0])))
+
+        worker = threading.Thread(target=self._quietly, args=(stop, driver), daemon=True)
+        worker.start()
+        worker.join(self.quit_timeout)
+        if worker.is_alive():
+            self.stats['hung_quits'] += 1
+            logger.warning(f"🧟 Driver did not quit within {self.quit_timeout:.0f}s - killing its processes")
+
+        killed = kill_tree(tree)
+        if killed:
+            self.stats['processes_killed'] += killed
+            logger.info(f"🧹 Killed {killed} leftover driver process(es)")
+        if tree:
+            self._update_records(lambda records: records.pop(tree[0], None))
+
+    @staticmethod
+    def _quietly(stop, driver) -> None:
+        try:
+            stop(driver)
+        except Exception:
+            pass
+
+    def reap_orphans(self) -> int:
+        """Kill browser trees left by earlier runs (once per process); returns the processes killed"""
+        if self._reaped_at_startup:
+            return 0
+        self._reaped_at_startup = True
+        killed = sum(kill_tree(tree) for tree in find_orphans(self._load_records()))
+        if killed:
+            self.stats['orphans_reaped'] += killed
+            logger.warning(f"🧹 Reaped {killed} orphaned Chrome/chromedriver process(es) from an earlier run")
+        def forget_finished(records):
+            # Only drivers of runs still going stay recorded
+            for pid, owner in list(records.items()):
+                if not _alive(owner) or not _alive(pid):
+                    del records[pid]
+        self._update_records(forget_finished)
+        return killed
+
+    def _load_records(self) -> Dict[int, int]:
+        """Recorded chromedriver pid -> pid of the run that started it"""
+        try:
+            with open(self.pid_path) as f:
+                return {int(pid): int(owner) for pid, owner in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _update_records(self, change) -> None:
+        """Apply change to the recorded driver pids and save them"""
+        with self._pid_lock:
+            records = self._load_records()
+            change(records)
+            try:
+                if records:
+                    with open(self.pid_path, 'w') as f:
+                        json.dump({str(pid): owner for pid, owner in records.items()}, f)
+                elif os.path.exists(self.pid_path):
+                    os.remove(self.pid_path)
+            except OSError as e:
+                logger.debug(f"Could not save driver pids to {self.pid_path}: {e}")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Logging setup for the match registration tools
+
+Nothing is configured at import time - entry points call setup_logging()
+explicitly, so importing the registrar never opens the log file.
+
+Records are handed to a QueueHandler and written by a QueueListener thread,
+so callers never block on disk or console I/O. The log file rotates by size
+and rotated files are gzip-compressed, which bounds disk use to roughly
+MATCHREG_LOG_MAX_BYTES for the live file plus MATCHREG_LOG_BACKUPS compressed
+backups. MATCHREG_LOG_FORMAT=json writes one JSON object per line.
+"""
+
+import os
+import json
+import gzip
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = 'match_registrar.log'
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+_configured = False
+_listener = None
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+def log_file_path() -> str:
+    """Path of the log file (MATCHREG_LOG_FILE or match_registrar.log)"""
+    return os.getenv('MATCHREG_LOG_FILE', DEFAULT_LOG_FILE)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any `extra=` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+def _file_handler(log_file: str) -> logging.Handler:
+    handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=int(os.getenv('MATCHREG_LOG_MAX_BYTES', DEFAULT_MAX_BYTES)),
+        backupCount=int(os.getenv('MATCHREG_LOG_BACKUPS', DEFAULT_BACKUPS)),
+        encoding='utf-8',
+        delay=True,
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+def setup_logging(level: int = None, log_file: str = None, console: bool = True, json_format: bool = None) -> None:
+    """Route the root logger through a background queue to the file and console handlers (only once)"""
+    global _configured, _listener
+    if _configured:
+        return
+
+    if level is None:
+        level = getattr(logging, os.getenv('MATCHREG_LOG_LEVEL', 'INFO').upper(), logging.INFO)
+    if json_format is None:
+        json_format = os.getenv('MATCHREG_LOG_FORMAT', 'text').lower() == 'json'
+
+    handlers = [_file_handler(log_file or log_file_path())]
+    if console:
+        handlers.append(logging.StreamHandler())
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _configured = True
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
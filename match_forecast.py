@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Registration-open forecasting and probe scheduling
+
+Each match's first-seen-open time (and the last time it was seen not open) is
+kept in the state store. Per match type, the offset between opening and the
+match date is fairly stable, so upcoming matches get a predicted opening
+window. The scheduler probes often around that window and backs off before it.
+The time from opening to a full roster is kept the same way, to tell which
+match types fill fastest.
+"""
+
+import os
+import time
+import logging
+from statistics import median
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from match_info import match_type, parse_match_date
+
+logger = logging.getLogger(__name__)
+
+MIN_SAMPLES = 2
+MIN_WINDOW_HOURS = 6.0
+
+class OpenTimeForecaster:
+    def __init__(self, state, min_samples: int = MIN_SAMPLES):
+        self.state = state
+        self.min_samples = min_samples
+
+    def observations(self) -> Dict[str, List[float]]:
+        """Hours between registration opening and the match date, per match type"""
+        offsets = {}
+        for url, entry in self.state.data['matches'].items():
+            first_open = entry.get('first_open_at')
+            if not first_open:
+                continue
+            match_date = parse_match_date(entry.get('title', ''), url)
+            if not match_date:
+                continue
+            last_closed = entry.get('last_not_open_at')
+            if not last_closed or last_closed > first_open:
+                # Already open when first seen - the opening time is unknown
+                continue
+            # Opening happened somewhere between the two probes
+            opened = (last_closed + first_open) / 2
+            offsets.setdefault(match_type(entry.get('title', ''), url), []).append(
+                (match_date.timestamp() - opened) / 3600)
+        return offsets
+
+    def predict(self, match_title: str, match_url: str) -> Optional[Dict]:
+        """Predicted opening time and window for a match, or None without enough history"""
+        match_date = parse_match_date(match_title, match_url)
+        if not match_date:
+            return None
+        kind = match_type(match_title, match_url)
+        offsets = self.observations().get(kind, [])
+        if len(offsets) < self.min_samples:
+            return None
+
+        typical = median(offsets)
+        spread = median(abs(offset - typical) for offset in offsets)
+        half_window = max(MIN_WINDOW_HOURS, 2 * spread) * 3600
+        opens_at = match_date.timestamp() - typical * 3600
+        return {
+            'type': kind,
+            'samples': len(offsets),
+            'opens_at': opens_at,
+            'window_start': opens_at - half_window,
+            'window_end': opens_at + half_window,
+        }
+
+    def fill_hours(self, kind: str) -> Optional[float]:
+        """Typical hours from registration opening to a full roster for a match type, or None without enough history"""
+        hours = []
+        for url, entry in self.state.data['matches'].items():
+            first_open, first_full = entry.get('first_open_at'), entry.get('first_full_at')
+            if first_open and first_full and first_full >= first_open and match_type(entry.get('title', ''), url) == kind:
+                hours.append((first_full - first_open) / 3600)
+        return median(hours) if len(hours) >= self.min_samples else None
+
+class ProbeScheduler:
+    """Decides when a not-yet-open match is worth another page load"""
+
+    def __init__(self, forecaster: OpenTimeForecaster, near_interval: float = None,
+                 far_interval: float = None, default_interval: float = None):
+        self.forecaster = forecaster
+        self.enabled = os.getenv('PROBE_SCHEDULING', 'on').lower() not in ('0', 'off', 'false')
+        self.near_interval = near_interval or float(os.getenv('PROBE_NEAR_MINUTES', 15)) * 60
+        self.far_interval = far_interval or float(os.getenv('PROBE_FAR_HOURS', 72)) * 3600
+        # Without a prediction, probe every run (the original behavior)
+        self.default_interval = default_interval if default_interval is not None else 0.0
+        # A scheduled run may start a little before the exact due time
+        self.tolerance = 5 * 60
+
+    def next_probe_at(self, match_title: str, match_url: str, entry: Dict) -> float:
+        """Earliest time the match should be probed again"""
+        checked_at = entry.get('checked_at')
+        status = entry.get('status')
+        if not self.enabled or not checked_at or entry.get('registered_at') or status not in ('not_open', 'unknown'):
+            return checked_at or 0.0
+
+        prediction = self.forecaster.predict(match_title, match_url)
+        if not prediction:
+            return checked_at + self.default_interval
+
+        now = time.time()
+        window_start = prediction['window_start']
+        if now >= window_start - self.near_interval:
+            return checked_at + self.near_interval
+        # Back off while the window is far away, but never sleep past its start
+        interval = min(max((window_start - now) / 2, self.near_interval), self.far_interval)
+        return min(checked_at + interval, window_start)
+
+    def in_window(self, match_title: str, match_url: str) -> bool:
+        """Whether now falls inside the match's predicted opening window"""
+        prediction = self.forecaster.predict(match_title, match_url)
+        if not prediction:
+            return False
+        return prediction['window_start'] - self.near_interval <= time.time() <= prediction['window_end']
+
+    def should_probe(self, match_title: str, match_url: str, entry: Dict) -> bool:
+        return self.next_probe_at(match_title, match_url, entry) <= time.time() + self.tolerance
+
+    def next_wakeup(self, catalog: List[Dict], state) -> Optional[float]:
+        """Earliest due probe across the catalog (None if nothing is waiting to open)"""
+        due = [
+            self.next_probe_at(m.get('title', ''), m.get('url', ''), state.get(m.get('url', '')))
+            for m in catalog
+            if state.get(m.get('url', '')).get('status') in ('not_open', 'unknown')
+        ]
+        return min(due) if due else None
+
+def describe_prediction(prediction: Optional[Dict]) -> str:
+    """Human readable prediction for logs and plans"""
+    if not prediction:
+        return "no opening prediction yet"
+    opens = datetime.fromtimestamp(prediction['opens_at'])
+    return (f"predicted to open around {opens:%m/%d %H:%M} "
+            f"(±{(prediction['window_end'] - prediction['opens_at']) / 3600:.0f}h, "
+            f"{prediction['samples']} past {prediction['type']} matches)")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Match metadata derived from titles and URLs - match type, match date and date filtering
+"""
+
+import os
+import re
+from datetime import datetime
+from typing import Optional
+
+# "NSPS Run & Gun 07/28/25" / "/nsps-run-gun-07-28-25/register"
+TITLE_DATE_PATTERN = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})\b')
+SLUG_DATE_PATTERN = re.compile(r'(?<!\d)(\d{1,2})-(\d{1,2})-(\d{2}|\d{4})(?!\d)')
+
+MATCH_TYPES = {
+    'run_gun': ['run & gun', 'run and gun', 'run-gun', 'run gun'],
+    'pwp': ['practice with purpose', 'practice-with-purpose'],
+}
+
+def match_type(match_title: str, match_url: str = '') -> str:
+    """Classify a match as run_gun, pwp or other"""
+    text = f"{match_title} {match_url}".lower()
+    for name, keywords in MATCH_TYPES.items():
+        if any(keyword in text for keyword in keywords):
+            return name
+    return 'other'
+
+def local_timezone():
+    """The configured TIMEZONE (defaults to America/Chicago)"""
+    import pytz
+    return pytz.timezone(os.getenv('TIMEZONE', 'America/Chicago'))
+
+def _build_date(month: str, day: str, year: str, tz) -> Optional[datetime]:
+    year_value = int(year)
+    if year_value < 100:
+        year_value += 2000
+    try:
+        return tz.localize(datetime(year_value, int(month), int(day)))
+    except ValueError:
+        return None
+
+def parse_match_date(match_title: str, match_url: str = '') -> Optional[datetime]:
+    """Match date (local midnight, timezone-aware) from the title or slug, or None"""
+    tz = local_timezone()
+    found = TITLE_DATE_PATTERN.search(match_title or '')
+    if found:
+        date = _build_date(*found.groups(), tz)
+        if date:
+            return date
+    found = SLUG_DATE_PATTERN.search(match_url or '')
+    if found:
+        return _build_date(*found.groups(), tz)
+    return None
+
+def days_until_match(match_title: str, match_url: str = '', now: datetime = None) -> Optional[int]:
+    """Days from today until the match date (negative once it has passed), or None without a date"""
+    match_date = parse_match_date(match_title, match_url)
+    if match_date is None:
+        return None
+    now = now or datetime.now(local_timezone())
+    return (match_date.date() - now.astimezone(match_date.tzinfo).date()).days
+
+def date_filter_reason(match_title: str, match_url: str = '', horizon_days: int = 0,
+                       now: datetime = None) -> Optional[str]:
+    """Why a match should not be probed because of its date, or None (undated matches are kept)"""
+    days = days_until_match(match_title, match_url, now)
+    if days is None:
+        return None
+    if days < 0:
+        return "match date has passed"
+    if horizon_days and days > horizon_days:
+        return f"more than {horizon_days} days out"
+    return None
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Priority ranking for the matches a run probes and registers for
+
+Each candidate gets a score from its match type (PRIORITY_TYPE_WEIGHTS,
+default run_gun=3,pwp=2,other=1), how soon it is (PRIORITY_DATE_WEIGHT),
+how fast its type has filled up before (PRIORITY_FILL_WEIGHT, from the
+forecaster's history) and preference keywords in the title
+(PRIORITY_KEYWORDS, e.g. "steel=2,night=-1"). Candidates wait in a heap, so
+the most valuable and most contested match is probed - and registered for -
+first when the per-run limit, request budget or deadline cuts a run short.
+MATCH_PRIORITY=off keeps the club page order.
+"""
+
+import os
+import heapq
+import itertools
+import threading
+from typing import Dict, List, Optional
+
+from match_info import match_type, days_until_match
+
+DEFAULT_TYPE_WEIGHTS = 'run_gun=3,pwp=2,other=1'
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """'run_gun=3, steel=-1' -> {'run_gun': 3.0, 'steel': -1.0}"""
+    weights = {}
+    for item in text.split(','):
+        name, _, value = item.partition('=')
+        if name.strip():
+            weights[name.strip().lower()] = float(value or 1)
+    return weights
+
+class MatchPrioritizer:
+    def __init__(self, forecaster=None):
+        self.forecaster = forecaster
+        self.enabled = os.getenv('MATCH_PRIORITY', 'on').lower() not in ('0', 'off', 'false')
+        self.type_weights = parse_weights(os.getenv('PRIORITY_TYPE_WEIGHTS', DEFAULT_TYPE_WEIGHTS))
+        self.keywords = parse_weights(os.getenv('PRIORITY_KEYWORDS', ''))
+        self.date_weight = float(os.getenv('PRIORITY_DATE_WEIGHT', 2))
+        self.fill_weight = float(os.getenv('PRIORITY_FILL_WEIGHT', 2))
+
+    def components(self, match_title: str, match_url: str = '') -> Dict[str, float]:
+        """Score parts for a match: type, date, fill and keywords"""
+        kind = match_type(match_title, match_url)
+        parts = {'type': self.type_weights.get(kind, 0.0)}
+        days = days_until_match(match_title, match_url)
+        # Full weight for a match today, half for one a week out
+        parts['date'] = self.date_weight * 7 / (7 + max(days, 0)) if days is not None else 0.0
+        fill_hours = self.forecaster.fill_hours(kind) if self.forecaster else None
+        # Full weight for a type that fills at once, half for one that takes a day
+        parts['fill'] = self.fill_weight * 24 / (24 + fill_hours) if fill_hours is not None else 0.0
+        title = match_title.lower()
+        parts['keywords'] = sum((weight for keyword, weight in self.keywords.items() if keyword in title), 0.0)
+        return parts
+
+    def score(self, match_title: str, match_url: str = '') -> float:
+        if not self.enabled:
+            return 0.0
+        return round(sum(self.components(match_title, match_url).values()), 3)
+
+    def rank(self, matches: List[Dict], scores: Dict[str, float] = None) -> List[Dict]:
+        """Matches highest priority first (club page order among equals)"""
+        ranked = self.queue(scores)
+        for match in matches:
+            ranked.put(match)
+        return [ranked.get() for _ in matches]
+
+    def queue(self, scores: Dict[str, float] = None) -> "CandidateQueue":
+        """An empty candidate queue; each candidate's score is kept in scores (title -> score)"""
+        return CandidateQueue(self, scores)
+
+class CandidateQueue:
+    """Thread-safe heap of candidate matches, drained like a queue.Queue ending in a None sentinel"""
+
+    def __init__(self, prioritizer: MatchPrioritizer, scores: Dict[str, float] = None):
+        self.prioritizer = prioritizer
+        self._heap = []
+        self._order = itertools.count()  # keeps club page order among equal scores
+        self._closed = False
+        self._ready = threading.Condition()
+        self._taken = {}  # id of a taken match -> its heap entry, for exchange
+        self.scores = scores if scores is not None else {}
+
+    def _entry(self, match: Dict) -> tuple:
+        title = match.get('title', '')
+        score = self.prioritizer.score(title, match.get('url', ''))
+        self.scores[title] = score
+        return -score, next(self._order), match
+
+    def put(self, match: Optional[Dict]) -> None:
+        """Add a candidate; None closes the queue"""
+        with self._ready:
+            if match is None:
+                self._closed = True
+            else:
+                heapq.heappush(self._heap, self._entry(match))
+            self._ready.notify_all()
+
+    def get(self) -> Optional[Dict]:
+        """Highest priority candidate, waiting for one; None once closed and drained"""
+        with self._ready:
+            self._ready.wait_for(lambda: self._heap or self._closed)
+            if not self._heap:
+                return None
+            entry = heapq.heappop(self._heap)
+            self._taken[id(entry[2])] = entry
+            return entry[2]
+
+    def exchange(self, match: Dict) -> Dict:
+        """Put a taken candidate back and take the best one - after a wait more may have arrived"""
+        with self._ready:
+            entry = heapq.heappushpop(self._heap, self._taken.pop(id(match), None) or self._entry(match))
+            self._taken[id(entry[2])] = entry
+            return entry[2]
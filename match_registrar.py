@@ -7,37 +7,173 @@ Automatically registers for NSPS Run & Gun matches at North Shore Practical Shoo
 import os
 import time
 import json
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
+from urllib.parse import urlparse, urljoin
 
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+# selenium, bs4, requests and notifications are imported where they are used so
+# that importing this module (and offline commands) stays fast
 from dotenv import load_dotenv
-import pytz
-from notifications import NotificationManager
+from browser_server import find_chrome_binary, server_address
+from cookie_cache import cookie_cache_path, load_cookies, save_cookies, clear_cookies
+from deadline import Deadline, DeadlineExceeded, in_phase
+from diagnostics import DiagnosticsRecorder
+from driver_supervisor import DriverSupervisor, owner_argument
+from logging_setup import setup_logging
+from match_forecast import OpenTimeForecaster, ProbeScheduler, describe_prediction
+from match_info import match_type, date_filter_reason, days_until_match
+from match_priority import CandidateQueue, MatchPrioritizer
+from match_state import MatchStateStore
+from network_capture import (network_capture_enabled, enable_performance_logging, start_capture,
+                             json_responses, matches_from_json, registration_status_from_json)
+from rate_control import RateController, rate_limited_session
+from replay import (record_path, replay_path, Recorder, RecordingDriver, ReplayArchive, ReplayDriver,
+                    ReplayServer, NullNotifier, record_session)
+from registration_form import (parse_registration_form, schema_template, schema_for_match,
+                               same_shape, build_form_data, is_match_template)
+from run_report import RunReport
+from step_timeouts import StepTimeouts, wait_until_stable
 
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('match_registrar.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Keywords in a match title that indicate a paid match
+PAID_TITLE_INDICATORS = [
+    "classifier",
+    "classifiers", 
+    "uspsa classifier",
+    "level ii",
+    "level 2",
+    "$",  # Dollar sign in title
+    "fee",
+    "cost",
+    "sanctioned"
+]
+
+# Keywords on a match page that indicate payment is required
+PAID_PAGE_INDICATORS = ["payment", "credit card", "paypal", "stripe", "fee:", "cost:", "$"]
+
+# Phrases on a match page shown to a shooter who is already registered
+REGISTERED_PAGE_INDICATORS = ["already registered", "you are registered", "unregister", "withdraw", "cancel registration"]
+
+def parse_match_elements(page_source: str, target_match: str) -> List[Dict]:
+    """Parse the club page HTML into match dicts whose text contains target_match"""
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(page_source, 'html.parser')
+    matches = []
+    
+    # Find match containers (this will need to be adjusted based on actual HTML structure)
+    match_elements = soup.find_all(['div', 'a'], class_=lambda x: x and any(
+        keyword in str(x).lower() for keyword in ['match', 'event', 'competition']
+    ))
+    
+    logger.info("Found %d potential match elements", len(match_elements))
+    
+    # %-style arguments so nothing is formatted in this loop unless the level is enabled
+    for i, element in enumerate(match_elements):
+        element_text = element.get_text().strip()
+        logger.debug("Element %d: %.100s...", i, element_text)  # First 100 chars
+        
+        if target_match.lower() in element_text.lower():
+            match_data = {
+                'title': element_text,
+                'url': element.get('href', ''),
+                'element': str(element)
+            }
+            matches.append(match_data)
+            logger.info("Matched element: %.100s...", element_text)
+    
+    return matches
+
+def next_page_url(page_source: str, page_url: str) -> Optional[str]:
+    """Absolute URL of a listing's next page (rel="next" or a "Next" link), or None"""
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(page_source, 'html.parser')
+    link = soup.find('a', rel='next') or soup.find(
+        'a', string=lambda text: text and text.strip().lower() in ('next', 'next ›', 'next »', '›', '»'))
+    if not link or not link.get('href'):
+        return None
+    return urljoin(page_url, link['href'])
+
+def paid_title_indicator(match_title: str) -> Optional[str]:
+    """Return the paid-match keyword found in a title, or None for free matches"""
+    title_lower = match_title.lower()
+    for indicator in PAID_TITLE_INDICATORS:
+        if indicator in title_lower:
+            return indicator
+    return None
+
+def paid_page_indicator(page_source: str) -> Optional[str]:
+    """Return the payment indicator found on a match page, or None"""
+    page_source = page_source.lower()
+    for indicator in PAID_PAGE_INDICATORS:
+        if indicator in page_source:
+            return indicator
+    return None
+
+def classify_match_page(page_source: str) -> str:
+    """Classify a match page as paid_match, not_open, open, full or unknown"""
+    page_source = page_source.lower()
+    
+    # Also check for payment indicators on the page
+    if paid_page_indicator(page_source):
+        return "paid_match"
+    
+    if "registration not open" in page_source:
+        return "not_open"
+    elif "register" in page_source and "button" in page_source:
+        return "open"
+    elif "full" in page_source or "roster full" in page_source:
+        return "full"
+    else:
+        return "unknown"
+
+def probe_page_status(page_source: str, logged_in: bool) -> str:
+    """Status of a match page fetched over HTTP (the registered state needs a logged-in session)"""
+    page_source = page_source.lower()
+    if logged_in and any(indicator in page_source for indicator in REGISTERED_PAGE_INDICATORS):
+        return "already_registered"
+    return classify_match_page(page_source)
+
+def decide_action(match_title: str, status: Optional[str], state: Dict) -> tuple:
+    """Decide what a run does with a match given its (probed or cached) status and stored state
+    
+    Returns (action, reason) where action is register, notify, skip or probe.
+    """
+    if state.get('registered_at') or status == "already_registered":
+        return "skip", "already registered"
+    if paid_title_indicator(match_title) or status == "paid_match":
+        return "notify", "paid match - manual registration required"
+    if status is None:
+        return "probe", "no cached status - registration page would be checked"
+    if status == "open":
+        return "register", "free match with registration open"
+    if status == "not_open":
+        return "skip", "registration not yet open"
+    if status == "full":
+        return "skip", "match is full"
+    return "skip", f"unknown status: {status}"
+
 class PractiscoreRegistrar:
     def __init__(self):
-        self.base_url = "https://practiscore.com"
+        # A recorded run replayed offline (MATCHREG_REPLAY), or a live run being recorded (MATCHREG_RECORD)
+        self.replay = replay_path() is not None
+        self._replay_archive = ReplayArchive.open(replay_path()) if self.replay else None
+        self.recorder = Recorder(record_path()) if record_path() and not self.replay else None
+        if self.recorder:
+            atexit.register(self.recorder.close)
+        
+        self.base_url = os.getenv('PRACTISCORE_BASE_URL', "https://practiscore.com").rstrip('/')
+        if self.replay:
+            self._replay_server = ReplayServer(self._replay_archive).start()
+            self.base_url = self._replay_server.url
         self.club_url = f"{self.base_url}/clubs/north_shore_practical_shooters"
         self.login_url = f"{self.base_url}/login"
         
@@ -48,21 +184,88 @@ class PractiscoreRegistrar:
         if not self.username or not self.password:
             raise ValueError("PractiScore credentials not found in environment variables")
         
-        # Setup Chrome options for headless browsing with Cloudflare bypass
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless=new')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-gpu')
-        self.chrome_options.add_argument('--disable-extensions')
-        self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        self.chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-        self.chrome_options.add_argument('--window-size=1920,1080')
-        self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36')
+        self._chrome_options = None
+        self._session = None
+        self._notifier = None
+        
+        # One watched browser for every step instead of a browser per step (daemon mode)
+        self.reuse_browser = os.getenv('REUSE_BROWSER', 'false').lower() in ('1', 'true', 'yes')
+        self._managed_driver = None
+        
+        # Session timeouts for every driver, and no Chrome processes left behind
+        self.supervisor = DriverSupervisor()
+        
+        # Screenshot, DOM and logs of failed registrations, written off the registration path
+        self.diagnostics = DiagnosticsRecorder.from_env()
+        
+        # Parse the page's XHR/JSON responses before falling back to the DOM
+        self.network_capture = network_capture_enabled()
+        
+        # Register with one POST over the session once the form schema is known
+        self.direct_submit = os.getenv('DIRECT_SUBMIT', 'true').lower() in ('1', 'true', 'yes')
+        
+        # Login cookies from an earlier process, so chained commands skip the login form
+        self.cookie_path = cookie_cache_path()
+        self._cached_cookies = load_cookies(self.cookie_path) if self.cookie_path else []
+        self._session_logged_in = bool(self._cached_cookies)
+        
+        # How many open matches a run registers for, and of which types (run_gun, pwp, other)
+        self.max_registrations = int(os.getenv('REGISTRATION_MAX_PER_RUN', 1))
+        types = os.getenv('REGISTRATION_MATCH_TYPES', '')
+        self.registration_types = {t.strip() for t in types.split(',') if t.strip()} or None
+        
+        # Past matches and matches further out than this are never probed (0 = no horizon)
+        self.horizon_days = int(os.getenv('MATCH_HORIZON_DAYS', 60))
+        
+        # Counters and timings for this run
+        self.report = RunReport()
+        
+        # Overall time limit, renewed by each run_check from RUN_DEADLINE_SECONDS (none outside a run)
+        self.deadline = Deadline()
+        
+        # Catalog and per-match state shared between runs
+        self.state = MatchStateStore()
+        
+        # Render and element waits sized from each step's recent latency
+        self.timeouts = StepTimeouts(self.state.step_latency())
+        
+        # Politeness budget shared by every navigation and HTTP request (no limit on a local replay)
+        self.rate = RateController(base_rate=10 ** 6, burst=10 ** 6, budget=10 ** 9, cooldown=0) if self.replay else RateController()
+        
+        # Registration-open predictions decide when not-yet-open matches are probed
+        self.forecaster = OpenTimeForecaster(self.state)
+        self.scheduler = ProbeScheduler(self.forecaster)
+        
+        # Candidates are probed and registered for highest priority first
+        self.prioritizer = MatchPrioritizer(self.forecaster)
+    
+    @property
+    def chrome_options(self):
+        """Chrome options, built on first use"""
+        if self._chrome_options is None:
+            self._chrome_options = self._build_chrome_options()
+        return self._chrome_options
+    
+    def _build_chrome_options(self):
+        """Chrome options for headless browsing with Cloudflare bypass"""
+        from selenium.webdriver.chrome.options import Options
+        
+        chrome_options = Options()
+        chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_argument('--disable-features=VizDisplayCompositor')
+        chrome_options.add_argument('--window-size=1920,1080')
+        # Lets the next run find and kill this browser if this process dies without quitting it
+        chrome_options.add_argument(owner_argument())
+        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36')
         
         # Add experimental options to avoid detection
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # Additional preferences to appear more like a real browser
         prefs = {
@@ -70,42 +273,186 @@ class PractiscoreRegistrar:
             "profile.default_content_settings.popups": 0,
             "profile.managed_default_content_settings.images": 2
         }
-        self.chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.add_experimental_option("prefs", prefs)
+        
+        if self.network_capture:
+            enable_performance_logging(chrome_options)
         
         # Set binary location based on environment  
-        chrome_binary_set = False
-        chrome_paths = [
-            '/snap/bin/chromium',
-            '/usr/bin/google-chrome', 
-            '/opt/hostedtoolcache/setup-chrome/chrome/stable/x64/chrome',
-            '/usr/bin/chromium-browser',
-            '/usr/bin/chrome'
-        ]
-        
-        for chrome_path in chrome_paths:
-            if os.path.exists(chrome_path):
-                self.chrome_options.binary_location = chrome_path
-                logger.info(f"Using Chrome binary at: {chrome_path}")
-                chrome_binary_set = True
-                break
-        
-        if not chrome_binary_set:
+        chrome_path = find_chrome_binary()
+        if chrome_path:
+            chrome_options.binary_location = chrome_path
+            logger.info(f"Using Chrome binary at: {chrome_path}")
+        else:
             logger.warning("No Chrome binary found in expected locations")
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        return chrome_options
+    
+    @property
+    def session(self):
+        """Shared requests session, created on first use"""
+        if self._session is None:
+            session = rate_limited_session(self.rate, lambda: self.deadline)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+            })
+            self._session = session
+            self._set_session_cookies(self._cached_cookies)
+            if self.recorder:
+                record_session(session, self.recorder)
+        return self._session
+    
+    @property
+    def notifier(self):
+        """Notification manager, created on first use"""
+        if self._notifier is None and self.replay:
+            self._notifier = NullNotifier()
+        if self._notifier is None:
+            from notifications import NotificationManager
+            self._notifier = NotificationManager()
+        return self._notifier
+    
+    def _new_driver(self):
+        """The shared watched browser when reusing, otherwise a fresh driver"""
+        if not self.reuse_browser:
+            return self._start_driver()
+        if self._managed_driver is None:
+            from browser_watchdog import ManagedDriver
+            self._managed_driver = ManagedDriver(self._start_driver, self._stop_driver, self.base_url, self.report)
+        self._managed_driver.report = self.report
+        return self._managed_driver
+    
+    def _start_driver(self):
+        """A replay driver when replaying, otherwise a browser (recorded when recording)"""
+        if self.replay:
+            return ReplayDriver(self._replay_archive)
+        driver = self._launch_driver()
+        return RecordingDriver(driver, self.recorder) if self.recorder else driver
+    
+    def _launch_driver(self):
+        """Attach to the browser server if one is running, otherwise start a Chrome driver"""
+        from selenium import webdriver
+        
+        address = server_address()
+        if address:
+            from selenium.webdriver.chrome.options import Options
+            
+            attach_options = Options()
+            attach_options.debugger_address = address
+            if self.network_capture:
+                enable_performance_logging(attach_options)
+            try:
+                driver = webdriver.Chrome(options=attach_options)
+                driver._matchreg_attached = True
+                # Its own tab - steps attached at once (login alongside the club page) would
+                # otherwise navigate the same tab over each other
+                driver.switch_to.new_window('tab')
+                self.supervisor.track(driver, self._service_pid(driver))
+                self.report.increment('browser_attaches')
+                logger.info(f"Attached to browser server at {address}")
+                return driver
+            except Exception as e:
+                logger.warning(f"Could not attach to browser server at {address}, launching locally: {e}")
+        
+        driver = webdriver.Chrome(options=self.chrome_options)
+        self.supervisor.track(driver, self._service_pid(driver))
+        self.report.increment('browser_starts')
+        return driver
+    
+    @staticmethod
+    def _service_pid(driver) -> Optional[int]:
+        """Pid of the chromedriver behind a driver"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        return process.pid if process else None
+    
+    def _release_driver(self, driver) -> None:
+        """Release a driver after a step (the shared watched browser stays open)"""
+        if driver is not self._managed_driver:
+            self._stop_driver(driver)
+    
+    def _stop_driver(self, driver) -> None:
+        """Stop a driver within the quit timeout and kill any of its processes still running"""
+        self.supervisor.stop(driver, self._quit_driver)
+    
+    @staticmethod
+    def _quit_driver(driver) -> None:
+        """Quit a driver we launched; only close our tab and disconnect from the shared browser server"""
+        if getattr(driver, '_matchreg_attached', False):
+            try:
+                driver.close()
+            except Exception as e:
+                logger.debug(f"Could not close the attached tab: {e}")
+            driver.service.stop()
+        else:
+            driver.quit()
+    
+    def _load(self, driver, url: str) -> None:
+        """Navigate the driver to a URL within the rate budget and count the page load"""
+        self.deadline.check()
+        self.rate.acquire(url, deadline=self.deadline)
+        if self.deadline.expires_at is not None:
+            try:
+                driver.set_page_load_timeout(max(1, self.deadline.clamp(self.supervisor.page_load_timeout)))
+            except Exception:
+                pass
+        driver.get(url)
+        self.report.increment('page_loads')
+        if "cloudflare" in driver.title.lower() or "just a moment" in driver.title.lower():
+            self.rate.on_challenge(url)
+        else:
+            self.rate.on_success(url)
+    
+    def _settle(self, seconds: float, driver=None, step: str = None) -> None:
+        """Give a page time to render, within the run deadline (skipped when replaying a recording)
+        
+        With a driver and a step, waits until the page stops changing, up to the step's tuned timeout.
+        """
+        if self.replay:
+            return
+        if driver is None or step is None:
+            self.deadline.sleep(seconds)
+            return
+        timeout = self.deadline.clamp(self.timeouts.timeout(step))
+        elapsed, _ = wait_until_stable(lambda: driver.page_source, timeout, self.timeouts.floor(step))
+        self.timeouts.observe(step, elapsed)
+        self.deadline.check()
+    
+    def _wait_for(self, driver, step: str, condition, learn_timeouts: bool = True):
+        """WebDriverWait with the step's tuned timeout, recording how long the element took"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        timeout = self.timeouts.timeout(step)
+        start = time.monotonic()
+        try:
+            element = WebDriverWait(driver, self.deadline.clamp(timeout)).until(condition)
+        except TimeoutException:
+            if learn_timeouts:
+                # A miss counts as the full timeout, so the next run allows longer
+                self.timeouts.observe(step, timeout)
+            raise
+        self.timeouts.observe(step, time.monotonic() - start)
+        return element
+    
+    def _full_url(self, match_url: str) -> str:
+        """Resolve a match URL relative to the base URL"""
+        return match_url if match_url.startswith('http') else f"{self.base_url}{match_url}"
         
-        # Initialize notification manager
-        self.notifier = NotificationManager()
+    def get_available_matches(self, fresh_browser: bool = False) -> List[Dict]:
+        """Get all available matches from the club page (in a browser of its own if fresh_browser)"""
+        return list(self.iter_available_matches(fresh_browser))
+    
+    @in_phase('club_page')
+    def iter_available_matches(self, fresh_browser: bool = False) -> Iterator[Dict]:
+        """Yield matches from the club page page by page (or scroll by scroll) as they are parsed
         
-    def get_available_matches(self) -> List[Dict]:
-        """Get all available matches from the club page"""
+        Loading stops early once a whole page is past the planning horizon, or has reached
+        matches that are over after upcoming ones were listed (a date-sorted list).
+        """
         logger.info("Fetching available matches from club page...")
         
         # Log Chrome binary location being used
@@ -124,7 +471,7 @@ class PractiscoreRegistrar:
                 os.environ['DISPLAY'] = ':99'
                 logger.info("Set DISPLAY environment variable to :99")
             
-            driver = webdriver.Chrome(options=self.chrome_options)
+            driver = self._start_driver() if fresh_browser else self._new_driver()
             
             # Execute script to remove webdriver property  
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -134,83 +481,186 @@ class PractiscoreRegistrar:
             logger.error(f"Failed to initialize Chrome driver: {e}")
             import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
-            return []
+            return
         
         try:
-            logger.info(f"Navigating to club URL: {self.club_url}")
+            if not self._load_club_page(driver):
+                return
             
-            # Try multiple times if Cloudflare blocks us
-            for attempt in range(3):
-                driver.get(self.club_url)
-                time.sleep(5)  # Wait longer for page to load
-                
-                current_url = driver.current_url
-                page_title = driver.title
-                page_length = len(driver.page_source)
+            if self.network_capture:
+                matches = matches_from_json(json_responses(driver), self.target_match)
+                if matches:
+                    self.report.increment('xhr_parses')
+                    logger.info(f"Found {len(matches)} matching events in captured JSON")
+                    yield from matches
+                    return
+                logger.info("No match list in captured JSON - parsing the page")
+            
+            seen = set()
+            upcoming_seen = False
+            max_pages = int(os.getenv('CLUB_MAX_PAGES', 10))
+            for page in range(1, max_pages + 1):
+                page_source = driver.page_source
+                logger.info(f"Club page {page}: {len(page_source)} characters")
                 
-                logger.info(f"Attempt {attempt + 1}: URL: {current_url}, Title: {page_title}, Length: {page_length}")
+                batch = [m for m in parse_match_elements(page_source, self.target_match)
+                         if (m['url'], m['title']) not in seen]
+                seen.update((m['url'], m['title']) for m in batch)
+                self.report.increment('club_pages')
+                logger.info(f"Found {len(batch)} matching events on club page {page}")
+                yield from batch
                 
-                # Check if we're blocked by Cloudflare
-                if "cloudflare" in page_title.lower() or page_length < 10000:
-                    logger.warning(f"Attempt {attempt + 1}: Detected Cloudflare block, retrying...")
-                    if attempt < 2:  # Don't sleep on last attempt
-                        time.sleep(10)  # Wait longer between attempts
-                    continue
-                else:
-                    logger.info("Successfully loaded PractiScore page")
-                    break
-            else:
-                logger.error("Failed to bypass Cloudflare after 3 attempts")
-                return []
-            
-            # Look for match elements
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            matches = []
-            
-            logger.info(f"Final page content length: {len(driver.page_source)} characters")
-            
-            # Find match containers (this will need to be adjusted based on actual HTML structure)
-            match_elements = soup.find_all(['div', 'a'], class_=lambda x: x and any(
-                keyword in str(x).lower() for keyword in ['match', 'event', 'competition']
-            ))
-            
-            logger.info(f"Found {len(match_elements)} potential match elements")
-            
-            for i, element in enumerate(match_elements):
-                element_text = element.get_text().strip()
-                logger.debug(f"Element {i}: {element_text[:100]}...")  # First 100 chars
+                days = [d for d in (days_until_match(m['title'], m['url']) for m in batch) if d is not None]
+                if days and self.horizon_days and min(days) > self.horizon_days:
+                    logger.info(f"📅 Club page {page} is past the {self.horizon_days}-day horizon - stopping")
+                    return
+                if days and max(days) < 0 and upcoming_seen:
+                    logger.info(f"📅 Club page {page} lists only past matches - stopping")
+                    return
+                upcoming_seen = upcoming_seen or any(d >= 0 for d in days)
                 
-                if self.target_match.lower() in element_text.lower():
-                    match_data = {
-                        'title': element_text,
-                        'url': element.get('href', ''),
-                        'element': str(element)
-                    }
-                    matches.append(match_data)
-                    logger.info(f"Matched element: {element_text[:100]}...")
-            
-            logger.info(f"Found {len(matches)} matching events")
-            return matches
-            
+                if not self._next_club_page(driver, page_source, bool(batch)):
+                    return
         except Exception as e:
             logger.error(f"Error fetching matches: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return []
         finally:
-            try:
-                driver.quit()
-                logger.info("Chrome driver closed")
-            except:
-                pass
+            self._release_driver(driver)
+            logger.info("Chrome driver closed")
+    
+    def _load_club_page(self, driver) -> bool:
+        """Load the club page, retrying while Cloudflare blocks it"""
+        logger.info(f"Navigating to club URL: {self.club_url}")
+        
+        # Try multiple times if Cloudflare blocks us
+        for attempt in range(3):
+            if self.network_capture:
+                start_capture(driver)
+            self._load(driver, self.club_url)
+            self._settle(5, driver, 'club_page')
+            
+            current_url = driver.current_url
+            page_title = driver.title
+            page_length = len(driver.page_source)
+            
+            logger.info(f"Attempt {attempt + 1}: URL: {current_url}, Title: {page_title}, Length: {page_length}")
+            
+            # Check if we're blocked by Cloudflare
+            if "cloudflare" in page_title.lower() or page_length < 10000:
+                logger.warning(f"Attempt {attempt + 1}: Detected Cloudflare block, retrying...")
+                # The rate controller's cooldown spaces out the next attempt
+                # (challenge titles were already reported by _load)
+                if "cloudflare" not in page_title.lower():
+                    self.rate.on_challenge(self.club_url)
+                continue
+            else:
+                logger.info("Successfully loaded PractiScore page")
+                return True
+        logger.error("Failed to bypass Cloudflare after 3 attempts")
+        return False
     
+    def _next_club_page(self, driver, page_source: str, found_new: bool) -> bool:
+        """Follow the club page's next-page link, or scroll for more lazy-loaded matches"""
+        next_url = next_page_url(page_source, driver.current_url)
+        if next_url:
+            self._load(driver, next_url)
+            self._settle(2, driver, 'club_next_page')
+            return True
+        if not found_new:
+            # The last scroll brought nothing new
+            return False
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+        self._settle(1, driver, 'club_scroll')
+        return driver.page_source != page_source
+    
+    @in_phase('login')
     def login(self, driver) -> bool:
-        """Login to PractiScore"""
+        """Login to PractiScore and share the browser's login with the requests session"""
+        if self.replay:
+            # The login form can't be replayed; keep the recorded navigation order
+            self._load(driver, self.login_url)
+            return True
+        restored = self._cached_cookies and not getattr(driver, '_matchreg_cookies_restored', False)
+        if restored:
+            self._restore_browser_cookies(driver)
+        logged_in = self._login(driver)
+        if logged_in:
+            self._copy_cookies_to_session(driver)
+        elif restored:
+            self._forget_cached_cookies()
+        return logged_in
+    
+    def check_session_login(self) -> bool:
+        """Whether the requests session is logged in (stale cached cookies are cleared)
+        
+        Like the browser, a logged-in session asking for the login page is sent on.
+        """
+        try:
+            response = self.session.get(self.login_url, timeout=self.deadline.clamp(30))
+        except Exception as e:
+            logger.warning(f"Could not check the login: {e}")
+            self._session_logged_in = False
+            return False
+        url = response.url.lower()
+        logged_in = response.status_code < 400 and "login" not in url and "sign" not in url
+        if not logged_in and self._cached_cookies:
+            logger.info("🍪 Cached login cookies no longer work")
+            self._forget_cached_cookies()
+        self._session_logged_in = logged_in
+        return logged_in
+    
+    def _forget_cached_cookies(self) -> None:
+        """Drop login cookies that no longer work, so the next process logs in again"""
+        if self.cookie_path:
+            clear_cookies(self.cookie_path)
+        self._cached_cookies = []
+        self._session_logged_in = False
+        if self._session is not None:
+            self._session.cookies.clear()
+    
+    def _restore_browser_cookies(self, driver) -> None:
+        """Put cached login cookies into a fresh browser (cookies need a page on the domain)"""
+        driver._matchreg_cookies_restored = True
+        try:
+            self._load(driver, self.base_url)
+            for cookie in self._cached_cookies:
+                driver.add_cookie(cookie)
+        except Exception as e:
+            logger.debug(f"Could not restore cached cookies: {e}")
+    
+    def _set_session_cookies(self, cookies: List[Dict]) -> None:
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    
+    def _copy_cookies_to_session(self, driver) -> None:
+        try:
+            cookies = driver.get_cookies()
+        except Exception as e:
+            logger.debug(f"Could not read browser cookies: {e}")
+            return
+        self._set_session_cookies(cookies)
+        self._session_logged_in = bool(cookies)
+        if cookies and self.cookie_path:
+            save_cookies(self.cookie_path, cookies)
+            self._cached_cookies = cookies
+    
+    def _login(self, driver) -> bool:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
         logger.info("Logging in to PractiScore...")
         
         try:
-            driver.get(self.login_url)
-            time.sleep(3)
+            self._load(driver, self.login_url)
+            self._settle(3, driver, 'login_page')
+            
+            # A browser that is still logged in (e.g. the browser server) is sent on to the dashboard
+            current_url = driver.current_url.lower()
+            if "login" not in current_url and "sign" not in current_url:
+                logger.info("Already logged in")
+                return True
             
             # Try multiple selectors for username field
             username_field = None
@@ -224,11 +674,11 @@ class PractiscoreRegistrar:
                 (By.XPATH, "//input[contains(@placeholder, 'username')]")
             ]:
                 try:
-                    username_field = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable(selector)
-                    )
+                    # Only the selector that matches says how long the field took
+                    username_field = self._wait_for(driver, 'login_field', EC.element_to_be_clickable(selector),
+                                                    learn_timeouts=False)
                     break
-                except:
+                except Exception:
                     continue
             
             if not username_field:
@@ -245,7 +695,7 @@ class PractiscoreRegistrar:
                 try:
                     password_field = driver.find_element(*selector)
                     break
-                except:
+                except Exception:
                     continue
             
             if not password_field:
@@ -258,7 +708,7 @@ class PractiscoreRegistrar:
             password_field.clear()
             password_field.send_keys(self.password)
             
-            time.sleep(1)
+            self._settle(1)
             
             # Try multiple selectors for submit button
             submit_button = None
@@ -272,7 +722,7 @@ class PractiscoreRegistrar:
                 try:
                     submit_button = driver.find_element(*selector)
                     break
-                except:
+                except Exception:
                     continue
             
             if not submit_button:
@@ -280,7 +730,7 @@ class PractiscoreRegistrar:
                 return False
             
             submit_button.click()
-            time.sleep(4)
+            self._settle(4, driver, 'login_submit')
             
             # Check if login was successful
             current_url = driver.current_url.lower()
@@ -300,27 +750,22 @@ class PractiscoreRegistrar:
             logger.error(f"Login error: {e}")
             return False
     
+    @in_phase('registration_check')
     def check_if_already_registered(self, match_url: str) -> bool:
         """Check if user is already registered for a match"""
-        driver = webdriver.Chrome(options=self.chrome_options)
+        driver = self._new_driver()
         try:
             if not self.login(driver):
                 logger.error("Failed to login while checking registration status")
                 return False
             
-            full_url = match_url if match_url.startswith('http') else f"{self.base_url}{match_url}"
-            driver.get(full_url)
-            time.sleep(3)
+            self._load(driver, self._full_url(match_url))
+            self._settle(3, driver, 'match_page')
             
             page_source = driver.page_source.lower()
             
             # Check for indicators that user is already registered
-            already_registered_indicators = [
-                "already registered",
-                "you are registered",
-                "unregister",
-                "withdraw",
-                "cancel registration",
+            already_registered_indicators = REGISTERED_PAGE_INDICATORS + [
                 f"{self.username.lower()}" in page_source  # Look for username in roster
             ]
             
@@ -335,100 +780,107 @@ class PractiscoreRegistrar:
             logger.error(f"Error checking if already registered: {e}")
             return False
         finally:
-            driver.quit()
+            self._release_driver(driver)
 
     def is_paid_match(self, match_title: str, match_url: str) -> bool:
         """Check if a match requires payment (classifiers, fees, etc.)"""
-        title_lower = match_title.lower()
-        
-        # Keywords that indicate paid matches
-        paid_indicators = [
-            "classifier",
-            "classifiers", 
-            "uspsa classifier",
-            "level ii",
-            "level 2",
-            "$",  # Dollar sign in title
-            "fee",
-            "cost",
-            "sanctioned"
-        ]
-        
-        for indicator in paid_indicators:
-            if indicator in title_lower:
-                logger.info(f"Detected paid match: {match_title} (contains '{indicator}')")
-                return True
+        indicator = paid_title_indicator(match_title)
+        if indicator:
+            logger.info(f"Detected paid match: {match_title} (contains '{indicator}')")
+            return True
                 
         return False
 
-    def check_registration_status(self, match_url: str, match_title: str = "") -> str:
-        """Check if registration is open for a match"""
+    @in_phase('probe')
+    def check_registration_status(self, match_url: str, match_title: str = "", driver=None) -> str:
+        """Check if registration is open for a match (with an already logged-in driver if given)"""
         # Check if it's a paid match first
         if match_title and self.is_paid_match(match_title, match_url):
             return "paid_match"
-            
-        driver = webdriver.Chrome(options=self.chrome_options)
+        
+        own_driver = driver is None
+        if own_driver:
+            driver = self._new_driver()
         try:
-            if not self.login(driver):
-                return "login_failed"
-            
-            # First check if already registered
-            if self.check_if_already_registered(match_url):
-                return "already_registered"
+            if own_driver:
+                if not self.login(driver):
+                    return "login_failed"
+                
+                # First check if already registered
+                if self.check_if_already_registered(match_url):
+                    return "already_registered"
             
-            full_url = match_url if match_url.startswith('http') else f"{self.base_url}{match_url}"
-            driver.get(full_url)
-            time.sleep(3)
+            if self.network_capture:
+                start_capture(driver)
+            self._load(driver, self._full_url(match_url))
+            self._settle(3, driver, 'match_page')
             
-            page_source = driver.page_source.lower()
+            # A logged-in driver shows the registered state on the same page
+            page_source = driver.page_source
+            if not own_driver and any(indicator in page_source.lower() for indicator in REGISTERED_PAGE_INDICATORS):
+                return "already_registered"
             
-            # Also check for payment indicators on the page
-            if any(indicator in page_source for indicator in ["payment", "credit card", "paypal", "stripe", "fee:", "cost:", "$"]):
+            # The page is checked for payment first - the JSON only says paid when it carries a fee
+            if paid_page_indicator(page_source):
                 logger.info("Detected payment requirements on registration page")
                 return "paid_match"
             
-            if "registration not open" in page_source:
-                return "not_open"
-            elif "register" in page_source and "button" in page_source:
-                return "open"
-            elif "full" in page_source or "roster full" in page_source:
-                return "full"
-            else:
-                return "unknown"
+            if self.network_capture:
+                status = registration_status_from_json(json_responses(driver), match_url)
+                if status:
+                    self.report.increment('xhr_parses')
+                    return status
+            
+            return classify_match_page(page_source)
                 
         except Exception as e:
             logger.error(f"Error checking registration status: {e}")
             return "error"
         finally:
-            driver.quit()
+            if own_driver:
+                self._release_driver(driver)
     
+    @in_phase('registration')
     def register_for_match(self, match_url: str, first_name: str = None, last_name: str = None, 
-                          email: str = None, power_factor: str = None) -> bool:
-        """Attempt to register for a match"""
+                          email: str = None, power_factor: str = None, try_direct: bool = True,
+                          fresh_browser: bool = False) -> bool:
+        """Attempt to register for a match (in a browser of its own if fresh_browser)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
         logger.info(f"Attempting to register for match: {match_url}")
         
-        # Get registration details from environment variables for security
-        reg_first_name = first_name or os.getenv('REGISTRATION_FIRST_NAME')
-        reg_last_name = last_name or os.getenv('REGISTRATION_LAST_NAME') 
-        reg_email = email or os.getenv('REGISTRATION_EMAIL')
-        reg_power_factor = power_factor or os.getenv('REGISTRATION_POWER_FACTOR', 'minor')
+        details = self._registration_details(first_name, last_name, email, power_factor)
+        reg_first_name = details['first_name']
+        reg_last_name = details['last_name']
+        reg_email = details['email']
+        reg_power_factor = details['power_factor']
         
-        driver = webdriver.Chrome(options=self.chrome_options)
+        if self.replay:
+            logger.info("Registration is not replayed")
+            return False
+        
+        if self.direct_submit and try_direct:
+            result = self._register_direct(match_url, details)
+            if result is not None:
+                return result
+        
+        driver = self._start_driver() if fresh_browser else self._new_driver()
         try:
             if not self.login(driver):
                 return False
             
-            full_url = match_url if match_url.startswith('http') else f"{self.base_url}{match_url}"
-            driver.get(full_url)
-            time.sleep(3)
+            self._load(driver, self._full_url(match_url))
+            self._settle(3, driver, 'match_page')
             
             # Look for registration button
-            register_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Register')] | //a[contains(text(), 'Register')]"))
-            )
+            register_button = self._wait_for(driver, 'register_button', EC.element_to_be_clickable(
+                (By.XPATH, "//button[contains(text(), 'Register')] | //a[contains(text(), 'Register')]")))
             register_button.click()
             
-            time.sleep(3)
+            self._settle(3, driver, 'registration_form')
+            
+            self._learn_form_schema(match_url, driver.page_source, driver.current_url)
             
             # Fill out registration form
             try:
@@ -460,21 +912,20 @@ class PractiscoreRegistrar:
                                 option.click()
                                 logger.info(f"Selected power factor: {reg_power_factor}")
                                 break
-                    except:
+                    except Exception:
                         logger.warning("Could not find power factor field")
                 
-                time.sleep(2)
+                self._settle(2)
                 
             except Exception as form_error:
                 logger.warning(f"Form filling error (may be expected): {form_error}")
             
             # Submit registration
-            submit_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@type='submit'] | //input[@type='submit']"))
-            )
+            submit_button = self._wait_for(driver, 'submit_button', EC.element_to_be_clickable(
+                (By.XPATH, "//button[@type='submit'] | //input[@type='submit']")))
             submit_button.click()
             
-            time.sleep(3)
+            self._settle(3, driver, 'registration_result')
             
             # Check for success message
             page_source = driver.page_source.lower()
@@ -483,19 +934,92 @@ class PractiscoreRegistrar:
                 return True
             else:
                 logger.error("Registration may have failed")
+                self.diagnostics.capture('registration unclear', driver, {'match_url': match_url})
                 return False
                 
         except Exception as e:
             logger.error(f"Registration error: {e}")
+            self.diagnostics.capture('registration error', driver, {'match_url': match_url, 'error': str(e)})
             return False
         finally:
-            driver.quit()
+            self._release_driver(driver)
+    
+    def _registration_details(self, first_name: str = None, last_name: str = None,
+                              email: str = None, power_factor: str = None) -> Dict[str, str]:
+        """Registration details, from the arguments or environment variables for security"""
+        return {
+            'first_name': first_name or os.getenv('REGISTRATION_FIRST_NAME'),
+            'last_name': last_name or os.getenv('REGISTRATION_LAST_NAME'),
+            'email': email or os.getenv('REGISTRATION_EMAIL'),
+            'power_factor': power_factor or os.getenv('REGISTRATION_POWER_FACTOR', 'minor'),
+        }
+    
+    def _can_register_direct(self, match_url: str) -> bool:
+        kind = match_type(self.state.get(match_url).get('title', ''), match_url)
+        return self.direct_submit and self._session_logged_in and self.state.form_schema(kind) is not None
     
+    def _learn_form_schema(self, match_url: str, page_source: str, page_url: str) -> None:
+        """Remember the registration form of this match type for direct submission"""
+        schema = parse_registration_form(page_source, page_url)
+        if not schema or schema['method'] != 'post':
+            return
+        kind = match_type(self.state.get(match_url).get('title', ''), match_url)
+        match_path = urlparse(self._full_url(match_url)).path
+        template = schema_template(schema, match_path)
+        if template is None:
+            logger.info(f"The {kind} registration form isn't addressed by the match URL - not used for direct submission")
+            return
+        self.state.set_form_schema(kind, template)
+        logger.info(f"📝 Learned the {kind} registration form ({len(schema['fields'])} fields)")
+    
+    def _register_direct(self, match_url: str, details: Dict[str, str]) -> Optional[bool]:
+        """Register with a single POST; None if it couldn't be tried and the browser should be used"""
+        kind = match_type(self.state.get(match_url).get('title', ''), match_url)
+        template = self.state.form_schema(kind)
+        if not template or not self._session_logged_in:
+            return None
+        if not is_match_template(template):
+            # Learned before templates were checked; it could point at another match
+            self.state.set_form_schema(kind, None)
+            return None
+        
+        schema = schema_for_match(template, urlparse(self._full_url(match_url)).path)
+        try:
+            response = self.session.get(f"{self.base_url}{schema['form_url']}", timeout=self.deadline.clamp(30))
+            fresh = parse_registration_form(response.text, response.url) if response.status_code == 200 else None
+            if not fresh or 'login' in urlparse(response.url).path:
+                logger.info("Direct submission unavailable (form page not served) - using the browser")
+                return None
+            if not same_shape(template, fresh):
+                logger.info(f"The {kind} registration form changed - relearning it in the browser")
+                self.state.set_form_schema(kind, None)
+                return None
+            
+            response = self.session.post(f"{self.base_url}{fresh['action']}", data=build_form_data(fresh, details),
+                                         timeout=self.deadline.clamp(30))
+        except Exception as e:
+            logger.warning(f"Direct submission failed, using the browser: {e}")
+            return None
+        if response.status_code in (403, 419) or response.status_code >= 500:
+            logger.warning(f"Direct submission rejected ({response.status_code}) - using the browser")
+            return None
+        
+        self.report.increment('direct_submits')
+        page_source = response.text.lower()
+        if "registered" in page_source or "confirmation" in page_source or "success" in page_source:
+            logger.info("Registration successful! (direct submission)")
+            return True
+        # The POST may have missed a field the form needs; the browser shows what happened
+        logger.warning("Direct submission unclear - using the browser")
+        self.diagnostics.capture('direct submission unclear', context={'match_url': match_url}, response=response)
+        return None
+    
+    @in_phase('current_registrations')
     def check_current_registrations(self):
         """Check and log all current registrations"""
         logger.info("Checking current registrations...")
         
-        matches = self.get_available_matches()
+        matches = self.filter_by_date(self.get_available_matches())
         if not matches:
             logger.info("No matching events found")
             return []
@@ -517,52 +1041,367 @@ class PractiscoreRegistrar:
             
         return registered_matches
     
-    def run_check(self):
+    def close_browser(self) -> None:
+        """Close the shared watched browser, if one is open"""
+        if self._managed_driver is not None:
+            self._managed_driver.close()
+            self._managed_driver = None
+    
+    def run_check(self, keep_browser: bool = False):
         """Main function to check for and register for matches"""
+        self._start_run()
+        try:
+            self._run_check()
+        except DeadlineExceeded as e:
+            logger.error(f"⏰ Run deadline of {self.deadline.seconds:.0f}s reached during {e.phase} - stopping")
+            self.report.section('deadline')['exceeded_in'] = e.phase
+        finally:
+            self._finish_run(keep_browser)
+    
+    def _start_run(self) -> None:
         logger.info("Starting match registration check...")
+        # A fresh report per run, so a daemon's numbers never include the sleep or watch between runs
+        self.report = RunReport()
+        self.deadline = Deadline.from_env()
+        # The request budget is per run, not per process (daemon, chained commands)
+        self.rate.new_run()
+        if not self.replay:
+            self.supervisor.reap_orphans()
+    
+    def _finish_run(self, keep_browser: bool = False) -> None:
+        """Close the browser unless kept, then save the state and write the run report"""
+        if self.deadline.seconds:
+            self.report.section('deadline').update({
+                'limit_seconds': self.deadline.seconds,
+                'used_seconds': round(self.deadline.elapsed(), 1),
+            })
+        if self._managed_driver is not None:
+            self.report.sections['browser_watchdog'] = dict(self._managed_driver.stats)
+        if not keep_browser:
+            self.close_browser()
+        self.report.sections['driver_supervisor'] = dict(self.supervisor.stats)
+        self.report.sections['timeouts'] = self.timeouts.summary()
+        if self.diagnostics.stats['captured']:
+            self.diagnostics.flush(timeout=max(5, self.deadline.clamp(30)))
+            self.report.sections['diagnostics'] = dict(self.diagnostics.stats)
+        self.state.save()
+        self.report.sections['rate'] = self.rate.snapshot()
+        self.report.finish()
+        self.report.write()
+        logger.info(f"Run finished in {self.report.wall_time():.1f}s "
+                    f"({self.report.counters['browser_starts']} browser starts, "
+                    f"{self.report.counters['page_loads']} page loads)")
+    
+    def _run_check(self):
+        """Check every matching event and register for open free matches within the per-run policy
         
-        # First, check what we're already registered for
-        self.check_current_registrations()
+        Logging in and fetching the club page overlap; matches are probed with the one
+        logged-in browser as they come off the club page, highest priority first.
+        """
+        # Built (and selenium imported) up front - both stages importing selenium at once can fail
+        self.chrome_options
+        stages = self.report.section('pipeline')
+        started = time.perf_counter()
+        candidates = self.prioritizer.queue(self.report.section('priority'))
+        pipeline = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pipeline')
+        login = pipeline.submit(self._timed, stages, 'login_seconds', self._open_probe_driver)
+        fetch = pipeline.submit(self._timed, stages, 'club_page_seconds', self._stream_candidates, candidates)
+        pipeline.shutdown(wait=False)
         
-        matches = self.get_available_matches()
-        if not matches:
-            logger.info("No matching events found")
-            return
+        try:
+            self._probe_candidates(candidates, login, stages, started)
+        finally:
+            # Released now, or when a login still in progress (deadline reached) finishes
+            login.add_done_callback(self._release_probe_driver)
+        # A club page stage stopped by the deadline stops the run too
+        fetch.result()
+    
+    @staticmethod
+    def _timed(stages: Dict, name: str, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            stages[name] = round(time.perf_counter() - start, 2)
+    
+    def _open_probe_driver(self) -> tuple:
+        """(driver, logged_in) - the browser that probes every match, logged in once"""
+        try:
+            driver = self._new_driver()
+        except Exception as e:
+            logger.error(f"Failed to start the probing browser: {e}")
+            return None, False
+        try:
+            return driver, self.login(driver)
+        except BaseException:
+            self._release_driver(driver)
+            raise
+    
+    def _release_probe_driver(self, login) -> None:
+        if not login.cancelled() and login.exception() is None and login.result()[0] is not None:
+            self._release_driver(login.result()[0])
+    
+    def _stream_candidates(self, candidates: CandidateQueue) -> None:
+        """Fetch the club page and queue its upcoming matches for probing (None when done)"""
+        try:
+            # Its own browser, so it doesn't wait for the probing browser to log in
+            matches = []
+            for match in self.iter_available_matches(fresh_browser=self.reuse_browser):
+                matches.append(match)
+                for upcoming in self.filter_by_date([match]):
+                    candidates.put(upcoming)
+            if not matches:
+                logger.info("No matching events found")
+                return
+            self.state.update_catalog(matches)
+        finally:
+            candidates.put(None)
+    
+    def _probe_candidates(self, candidates: CandidateQueue, login, stages: Dict, started: float):
+        """Probe queued matches as they arrive and register for open ones within the per-run policy
         
+        Registrations run in the background while probing continues, and each outcome is
+        recorded and announced as soon as it is known.
+        """
+        driver = logged_in = None
+        registered = []
+        selected = 0
+        pending = {}  # registrations in flight -> (title, url)
+        record_lock = threading.Lock()
+        executor = ThreadPoolExecutor(max_workers=int(os.getenv('REGISTRATION_CONCURRENCY', 4)))
+        
+        def finished(future, match_title, match_url):
+            if future.cancelled():
+                return
+            try:
+                success = future.result()
+            except DeadlineExceeded:
+                logger.warning(f"⏰ No time left to register for {match_title}")
+                success = False
+            except Exception as e:
+                logger.error(f"Registration for {match_title} failed: {e}")
+                success = False
+            with record_lock:
+                self.record_registration(match_title, match_url, success)
+        
+        try:
+            for match in iter(candidates.get, None):
+                stages.setdefault('first_candidate_at', round(time.perf_counter() - started, 2))
+                if logged_in is None and not paid_title_indicator(match.get('title', '')):
+                    # Login ran alongside the club page; it is usually done by now
+                    driver, logged_in = login.result()
+                    # Matches queued during the wait may outrank this one
+                    match = candidates.exchange(match)
+                match_title = match.get('title', 'Unknown')
+                match_url = match.get('url', '')
+                
+                logger.info(f"Checking match: {match_title}")
+                
+                if self.state.is_registered(match_url):
+                    logger.info("✅ Already registered (match state) - skipping")
+                    registered.append(match_title)
+                    continue
+                if not self.scheduler.should_probe(match_title, match_url, self.state.get(match_url)):
+                    prediction = self.forecaster.predict(match_title, match_url)
+                    logger.info(f"⏳ Probe deferred - {describe_prediction(prediction)}")
+                    self.report.section('scheduler').setdefault('deferred', []).append(match_title)
+                    continue
+                if self.scheduler.in_window(match_title, match_url):
+                    # Probing is worth more than usual close to an opening
+                    self.rate.boost(self.base_url)
+                
+                # Without a logged-in probing browser each probe opens (and logs in) its own
+                status = self.check_registration_status(match_url, match_title, driver if logged_in else None)
+                logger.info(f"Registration status: {status}")
+                self.state.record_status(match_url, match_title, status)
+                # Kept as we go, so a run stopped by its deadline still reports what it probed
+                self.report.section('results')[match_title] = status
+                
+                if status == "already_registered":
+                    logger.info("✅ Already registered for this match - skipping")
+                    registered.append(match_title)
+                elif status == "paid_match":
+                    self.notify_paid_match(match_title, match_url)
+                elif status == "open":
+                    blocked = self.registration_blocked(match_title, match_url, selected)
+                    if blocked:
+                        logger.info(f"🟢 Registration is open but not registering: {blocked}")
+                        continue
+                    direct = self._can_register_direct(match_url)
+                    if direct:
+                        logger.info("🟢 FREE match registration is open - submitting directly")
+                    else:
+                        logger.info("🟢 FREE match registration is open - attempting to register")
+                    selected += 1
+                    future = executor.submit(self._register_candidate, match_title, match_url, direct)
+                    pending[future] = (match_title, match_url)
+                    future.add_done_callback(lambda done, title=match_title, url=match_url: finished(done, title, url))
+                elif status == "not_open":
+                    logger.info("Registration not yet open")
+                elif status == "full":
+                    logger.info("Match is full")
+                else:
+                    logger.warning(f"Unknown status: {status}")
+            
+            stages['wall_seconds'] = round(time.perf_counter() - started, 2)
+            if registered:
+                logger.info(f"Currently registered for {len(registered)} matches: {', '.join(registered)}")
+            else:
+                logger.info("Not currently registered for any matches")
+        finally:
+            # Past the deadline, registrations that haven't started are dropped and running ones aren't waited for
+            expired = self.deadline.expired()
+            executor.shutdown(wait=not expired, cancel_futures=expired)
+            for future, (match_title, match_url) in pending.items():
+                if not future.done() or future.cancelled():
+                    logger.warning(f"⏰ Registration for {match_title} still in flight at the deadline")
+                    self.report.section('deadline').setdefault('in_flight', []).append(match_title)
+    
+    def _register_candidate(self, match_title: str, match_url: str, direct: bool) -> bool:
+        """Register in the background: one direct POST if the form is known, else a browser of its own"""
+        success = self._register_direct(match_url, self._registration_details()) if direct else None
+        if success is None:
+            if direct:
+                logger.info(f"Direct submission unavailable for {match_title} - using the browser")
+            # The shared browser stays with the probes
+            success = self.register_for_match(match_url, try_direct=False, fresh_browser=self.reuse_browser)
+        return success
+    
+    def filter_by_date(self, matches: List[Dict]) -> List[Dict]:
+        """Drop past matches and matches beyond the horizon before anything is probed"""
+        kept = []
+        dropped = self.report.section('date_filter')
         for match in matches:
+            reason = date_filter_reason(match.get('title', ''), match.get('url', ''), self.horizon_days)
+            if reason:
+                logger.info(f"📅 Skipping {match.get('title', 'Unknown')}: {reason}")
+                dropped[reason] = dropped.get(reason, 0) + 1
+            else:
+                kept.append(match)
+        return kept
+    
+    def registration_blocked(self, match_title: str, match_url: str, selected: int) -> Optional[str]:
+        """Why an open free match is not registered for this run, or None if it should be"""
+        kind = match_type(match_title, match_url)
+        if self.registration_types and kind not in self.registration_types:
+            return f"{kind} matches are not selected for registration"
+        if selected >= self.max_registrations:
+            return f"limit of {self.max_registrations} registration(s) per run reached"
+        return None
+    
+    def notify_paid_match(self, match_title: str, match_url: str) -> None:
+        """Announce a paid match that has to be registered for by hand"""
+        logger.warning(f"💳 PAID MATCH DETECTED: {match_title}")
+        logger.warning("   This match requires payment (likely has classifiers or fees)")
+        logger.warning("   NOTIFICATION: Manual registration required")
+        logger.warning(f"   URL: {self.base_url}{match_url}")
+        self.notifier.timeout = max(5, self.deadline.clamp(30))
+        self.notifier.notify_match_found(match_title, match_url, is_paid=True)
+        self.state.mark_notified(match_url, match_title)
+    
+    def record_registration(self, match_title: str, match_url: str, success: bool) -> None:
+        """Store and announce the outcome of a registration attempt"""
+        # Notifications are sent even near the deadline, but never block past it for long
+        self.notifier.timeout = max(5, self.deadline.clamp(30))
+        if success:
+            logger.info("Successfully registered!")
+            self.state.mark_registered(match_url, match_title)
+            self.notifier.notify_registration_success(match_title, match_url)
+        else:
+            # Still notify about the attempt
+            self.notifier.notify_match_found(match_title, match_url, is_paid=False)
+            self.state.mark_notified(match_url, match_title)
+    
+    def plan(self) -> List[Dict]:
+        """Work out what run_check would do from the cached catalog and state - no browser"""
+        catalog = self.state.catalog()
+        decisions = []
+        selected = 0
+        # Registration slots go by priority, as in a run; the plan is listed in club page order
+        for match in self.prioritizer.rank(catalog):
             match_title = match.get('title', 'Unknown')
             match_url = match.get('url', '')
+            state = self.state.get(match_url)
+            action, reason = decide_action(match_title, state.get('status'), state)
+            date_reason = date_filter_reason(match_title, match_url, self.horizon_days)
+            if date_reason and action != "skip":
+                action, reason = "skip", date_reason
             
-            logger.info(f"Checking match: {match_title}")
-            
-            status = self.check_registration_status(match_url, match_title)
-            logger.info(f"Registration status: {status}")
-            
-            if status == "already_registered":
-                logger.info("✅ Already registered for this match - skipping")
-            elif status == "paid_match":
-                logger.warning(f"💳 PAID MATCH DETECTED: {match_title}")
-                logger.warning("   This match requires payment (likely has classifiers or fees)")
-                logger.warning("   NOTIFICATION: Manual registration required")
-                logger.warning(f"   URL: {self.base_url}{match_url}")
-                self.notifier.notify_match_found(match_title, match_url, is_paid=True)
-            elif status == "open":
-                logger.info("🟢 FREE match registration is open - attempting to register")
-                success = self.register_for_match(match_url)
-                if success:
-                    logger.info("Successfully registered!")
-                    self.notifier.notify_registration_success(match_title, match_url)
-                    break  # Only register for one match to avoid duplicates
-                else:
-                    # Still notify about the attempt
-                    self.notifier.notify_match_found(match_title, match_url, is_paid=False)
-            elif status == "not_open":
-                logger.info("Registration not yet open")
-            elif status == "full":
-                logger.info("Match is full")
-            else:
-                logger.warning(f"Unknown status: {status}")
+            blocked = self.registration_blocked(match_title, match_url, selected) if action == "register" else None
+            if blocked:
+                action, reason = "skip", blocked
+            elif state.get('status') in ("not_open", "unknown"):
+                prediction = self.forecaster.predict(match_title, match_url)
+                next_probe = self.scheduler.next_probe_at(match_title, match_url, state)
+                if next_probe > time.time():
+                    reason += f"; next probe {datetime.fromtimestamp(next_probe):%m/%d %H:%M}"
+                reason += f"; {describe_prediction(prediction)}"
+            selected += action == "register"
+            
+            decisions.append((match, {
+                'title': match_title,
+                'url': match_url,
+                'action': action,
+                'reason': reason,
+                'checked_at': state.get('checked_at'),
+            }))
+        position = {id(match): index for index, match in enumerate(catalog)}
+        return [decision for _, decision in sorted(decisions, key=lambda item: position[id(item[0])])]
+
+    def run_forever(self, max_sleep: float = None):
+        """Keep checking, watching full matches until the scheduler's next due probe"""
+        from waitlist_watcher import RosterWatcher
+        
+        max_sleep = max_sleep or float(os.getenv('DAEMON_MAX_SLEEP_HOURS', 6)) * 3600
+        self.reuse_browser = True
+        watcher = RosterWatcher(self)
+        try:
+            while True:
+                self.run_check(keep_browser=True)
+                wakeup = self.scheduler.next_wakeup(self.state.catalog(), self.state)
+                delay = max_sleep if wakeup is None else wakeup - time.time()
+                delay = min(max(delay, self.scheduler.near_interval), max_sleep)
+                logger.info(f"💤 Next check at {datetime.fromtimestamp(time.time() + delay):%m/%d %H:%M}")
+                # Full matches are watched over HTTP until then (with their own report)
+                until = time.time() + delay
+                if watcher.refresh():
+                    watcher.run(until=until)
+                time.sleep(max(0.0, until - time.time()))
+        finally:
+            self.close_browser()
+
+def print_plan(decisions: List[Dict], catalog_updated_at: Optional[float] = None) -> None:
+    """Print a plan produced by PractiscoreRegistrar.plan()"""
+    icons = {'register': '🟢', 'notify': '💳', 'skip': '⏭️ ', 'probe': '🔍'}
+    if catalog_updated_at:
+        print(f"Catalog from {datetime.fromtimestamp(catalog_updated_at):%Y-%m-%d %H:%M}")
+    if not decisions:
+        print("No cached matches - run match_registrar.py once to build the catalog")
+        return
+    for decision in decisions:
+        checked = decision['checked_at']
+        checked_text = f" (checked {datetime.fromtimestamp(checked):%m/%d %H:%M})" if checked else ""
+        print(f"{icons.get(decision['action'], '  ')} {decision['action'].upper():<9}{decision['title']}")
+        print(f"   {decision['reason']}{checked_text}")
 
 if __name__ == "__main__":
+    import argparse
+    from profiling import add_profile_arguments, profile_mode, trace_webdriver_enabled, run_profiled
+    
+    parser = argparse.ArgumentParser(description="PractiScore match auto-registration")
+    parser.add_argument('--plan', action='store_true',
+                        help="Show what a run would do from cached state, without a browser")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running, probing around predicted registration openings")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    
+    setup_logging()
     registrar = PractiscoreRegistrar()
-    registrar.run_check()
\ No newline at end of file
+    if args.plan:
+        print_plan(registrar.plan(), registrar.state.catalog_updated_at())
+        raise SystemExit(0)
+    if args.daemon:
+        registrar.run_forever()
+    run_profiled("run_check", registrar.run_check,
+                 mode=profile_mode(args), trace_webdriver=trace_webdriver_enabled(args))
\ No newline at end of file
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Persistent catalog and per-match state for the registrar
+
+match_state.json (MATCH_STATE_PATH) holds the last club page catalog and,
+for each match URL, the last probed status and when we registered or
+notified, plus the registration form schema learned per match type and the
+recent latency of each timed step. Runs write it; --plan and dedup read it
+without a browser.
+"""
+
+import os
+import json
+import time
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = 'match_state.json'
+
+class MatchStateStore:
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv('MATCH_STATE_PATH', DEFAULT_STATE_PATH)
+        self.data = {'catalog': {'updated_at': None, 'matches': []}, 'matches': {}, 'form_schemas': {},
+                     'step_latency': {}}
+        self.load()
+
+    def load(self) -> None:
+        """Read the state file if it exists"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                loaded = json.load(f)
+            self.data['catalog'] = loaded.get('catalog', self.data['catalog'])
+            self.data['matches'] = loaded.get('matches', {})
+            self.data['form_schemas'] = loaded.get('form_schemas', {})
+            self.data['step_latency'] = loaded.get('step_latency', {})
+        except Exception as e:
+            logger.warning(f"Could not read match state from {self.path}: {e}")
+
+    def save(self) -> None:
+        """Write the state file atomically"""
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Could not save match state to {self.path}: {e}")
+
+    def update_catalog(self, matches: List[Dict]) -> None:
+        """Store the matches found on the club page"""
+        now = time.time()
+        self.data['catalog'] = {
+            'updated_at': now,
+            'matches': [{'title': m.get('title', ''), 'url': m.get('url', '')} for m in matches],
+        }
+        for match in matches:
+            entry = self.entry(match.get('url', ''), match.get('title', ''))
+            entry['last_seen'] = now
+
+    def catalog(self) -> List[Dict]:
+        """Matches from the last club page fetch"""
+        return self.data['catalog'].get('matches', [])
+
+    def catalog_updated_at(self) -> Optional[float]:
+        return self.data['catalog'].get('updated_at')
+
+    def get(self, url: str) -> Dict:
+        """State for a match URL (empty if unknown)"""
+        return self.data['matches'].get(url, {})
+
+    def entry(self, url: str, title: str = '') -> Dict:
+        """State for a match URL, created if needed"""
+        entry = self.data['matches'].setdefault(url, {'first_seen': time.time()})
+        if title:
+            entry['title'] = title
+        return entry
+
+    def record_status(self, url: str, title: str, status: str) -> None:
+        entry = self.entry(url, title)
+        entry['status'] = status
+        entry['checked_at'] = time.time()
+        if status == 'already_registered':
+            entry.setdefault('registered_at', entry['checked_at'])
+        elif status == 'open':
+            entry.setdefault('first_open_at', entry['checked_at'])
+        elif status == 'not_open':
+            entry['last_not_open_at'] = entry['checked_at']
+        elif status == 'full':
+            entry.setdefault('first_full_at', entry['checked_at'])
+
+    def mark_registered(self, url: str, title: str = '') -> None:
+        self.entry(url, title)['registered_at'] = time.time()
+
+    def mark_notified(self, url: str, title: str = '') -> None:
+        self.entry(url, title)['notified_at'] = time.time()
+
+    def is_registered(self, url: str) -> bool:
+        return bool(self.get(url).get('registered_at'))
+
+    def form_schema(self, match_type: str) -> Optional[Dict]:
+        """Registration form schema learned for a match type"""
+        return self.data['form_schemas'].get(match_type)
+
+    def step_latency(self) -> Dict[str, List[float]]:
+        """Recent seconds per timed step (updated in place by StepTimeouts)"""
+        return self.data['step_latency']
+
+    def set_form_schema(self, match_type: str, schema: Optional[Dict]) -> None:
+        if schema is None:
+            self.data['form_schemas'].pop(match_type, None)
+        else:
+            self.data['form_schemas'][match_type] = dict(schema, learned_at=time.time())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+matchreg - one CLI for scanning, probing, registering, watching and planning
+
+Every subcommand shares one PractiscoreRegistrar: one requests session, one
+reused browser, the login cookie cache and the match_state.json catalog.
+Chain subcommands with '+' to run them in one process without starting the
+browser or logging in again:
+
+    python matchreg.py scan + status + plan
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_ICONS = {
+    'open': '🟢', 'not_open': '⏳', 'full': '🔴', 'paid_match': '💳',
+    'already_registered': '✅', 'unknown': '❔', 'error': '❌', 'login_failed': '❌',
+}
+
+class Context:
+    """Registrar shared by the chained subcommands, created on first use"""
+
+    def __init__(self):
+        self._registrar = None
+
+    @property
+    def registrar(self):
+        if self._registrar is None:
+            from match_registrar import PractiscoreRegistrar
+            self._registrar = PractiscoreRegistrar()
+            self._registrar.reuse_browser = True
+        return self._registrar
+
+    def close(self) -> None:
+        if self._registrar is not None:
+            self._registrar.state.save()
+            self._registrar.close_browser()
+
+def cmd_scan(context: Context, args) -> int:
+    """Fetch the club page and refresh the catalog"""
+    from match_registrar import parse_match_elements
+
+    registrar = context.registrar
+    if args.http:
+        response = registrar.session.get(registrar.club_url, timeout=30)
+        matches = parse_match_elements(response.text, registrar.target_match)
+    else:
+        matches = registrar.get_available_matches()
+    if not matches:
+        print("❌ No matching events found")
+        return 1
+    registrar.state.update_catalog(matches)
+    print(f"🔍 {len(matches)} matching events in the catalog")
+    for match in matches:
+        print(f"   {match['title']}")
+    return 0
+
+def probe_over_http(registrar, match: Dict) -> str:
+    """Registration status of a match page fetched with the shared session"""
+    from match_registrar import paid_title_indicator, probe_page_status
+
+    if paid_title_indicator(match['title']):
+        return "paid_match"
+    try:
+        response = registrar.session.get(registrar._full_url(match['url']), timeout=30)
+    except Exception as e:
+        logger.warning(f"Probe of {match['title']} failed: {e}")
+        return "error"
+    if response.status_code != 200:
+        return "error"
+    return probe_page_status(response.text, registrar._session_logged_in)
+
+def login_for_probes(registrar) -> bool:
+    """Make sure the shared session is logged in, logging in with the browser if it isn't"""
+    if registrar.check_session_login():
+        return True
+    driver, logged_in = registrar._open_probe_driver()
+    if driver is not None:
+        registrar._release_driver(driver)
+    return logged_in
+
+def cmd_status(context: Context, args) -> int:
+    """Probe every cached upcoming match and print its state"""
+    registrar = context.registrar
+    matches = registrar.filter_by_date(registrar.state.catalog())
+    if not matches:
+        print("No cached upcoming matches - run `matchreg.py scan` first")
+        return 1
+
+    start = time.perf_counter()
+    if args.browser:
+        statuses = [registrar.check_registration_status(m['url'], m['title']) for m in matches]
+        logged_in = True
+    else:
+        # A logged-out page never shows "already registered"
+        logged_in = login_for_probes(registrar)
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            statuses = list(pool.map(lambda match: probe_over_http(registrar, match), matches))
+    elapsed = time.perf_counter() - start
+
+    for match, status in zip(matches, statuses):
+        # Errors and logged-out probes would overwrite a good cached status
+        if logged_in and status not in ("error", "login_failed"):
+            registrar.state.record_status(match['url'], match['title'], status)
+        print(f"{STATUS_ICONS.get(status, '  ')} {status:<19}{match['title']}")
+    print(f"Probed {len(matches)} matches in {elapsed:.1f}s")
+    if not logged_in:
+        print("⚠️  Not logged in - statuses shown but not saved (registered matches look open)")
+    return 0
+
+def find_catalog_match(registrar, query: str) -> Optional[Dict]:
+    """The single cached match whose URL equals or title contains the query"""
+    found = [m for m in registrar.state.catalog()
+             if m['url'] == query or query.lower() in m['title'].lower()]
+    if len(found) == 1:
+        return found[0]
+    if not found:
+        print(f"❌ No cached match matches '{query}' - run `matchreg.py scan` first")
+    else:
+        print(f"❌ '{query}' matches {len(found)} matches:")
+        for match in found:
+            print(f"   {match['title']}")
+    return None
+
+def cmd_register(context: Context, args) -> int:
+    """Register for one cached match"""
+    registrar = context.registrar
+    match = find_catalog_match(registrar, args.match)
+    if match is None:
+        return 1
+    if registrar.state.is_registered(match['url']):
+        print(f"✅ Already registered: {match['title']}")
+        return 0
+    success = registrar.register_for_match(match['url'], power_factor=args.power_factor)
+    registrar.record_registration(match['title'], match['url'], success)
+    print(f"{'✅ Registered' if success else '❌ Registration failed'}: {match['title']}")
+    return 0 if success else 1
+
+def cmd_watch(context: Context, args) -> int:
+    """Watch full matches for a freed slot"""
+    from waitlist_watcher import RosterWatcher
+
+    watcher = RosterWatcher(context.registrar)
+    if not watcher.refresh():
+        print("⚪ No full matches to watch")
+        return 0
+    if args.once:
+        registered = watcher.run_once()
+    else:
+        print(f"👀 Watching {len(watcher.watched)} full match(es)")
+        watcher.run(until=time.time() + args.hours * 3600 if args.hours else None)
+        registered = []
+    print(f"Registered: {', '.join(registered) or 'none'}")
+    return 0
+
+def cmd_plan(context: Context, args) -> int:
+    """Show what a run would do from the cached state"""
+    from match_registrar import print_plan
+
+    registrar = context.registrar
+    print_plan(registrar.plan(), registrar.state.catalog_updated_at())
+    return 0
+
+def _age(timestamp: Optional[float]) -> str:
+    if not timestamp:
+        return "never"
+    hours = (time.time() - timestamp) / 3600
+    return f"{hours:.1f}h ago ({datetime.fromtimestamp(timestamp):%m/%d %H:%M})"
+
+def doctor_checks(offline: bool = False) -> List[tuple]:
+    """(ok, name, detail) for each part of the setup; ok is True, False or None for a warning"""
+    from browser_server import find_chrome_binary, server_status
+    from cookie_cache import cookie_cache_path, load_cookies
+    from match_state import MatchStateStore
+
+    checks = []
+    missing = [name for name in ('PRACTISCORE_USERNAME', 'PRACTISCORE_PASSWORD') if not os.getenv(name)]
+    checks.append((not missing, "Credentials", f"missing {', '.join(missing)}" if missing else "set"))
+    missing = [name for name in ('REGISTRATION_FIRST_NAME', 'REGISTRATION_LAST_NAME', 'REGISTRATION_EMAIL')
+               if not os.getenv(name)]
+    checks.append((None if missing else True, "Registration details",
+                   f"missing {', '.join(missing)}" if missing else "set"))
+
+    chrome = find_chrome_binary()
+    checks.append((bool(chrome), "Chrome", chrome or "no binary in the expected locations"))
+    chromedriver = shutil.which('chromedriver')
+    checks.append((True if chromedriver else None, "ChromeDriver",
+                   chromedriver or "not on PATH (Selenium Manager will try to fetch one)"))
+    status = server_status()
+    checks.append((True, "Browser server", f"running on port {status['port']}" if status else "not running"))
+
+    path = cookie_cache_path()
+    cookies = load_cookies(path) if path else []
+    checks.append((True if cookies else None, "Login cookies",
+                   f"{len(cookies)} cached in {path}" if cookies else "none cached - the next run logs in"))
+    store = MatchStateStore()
+    catalog = store.catalog()
+    checks.append((True if catalog else None, "Catalog",
+                   f"{len(catalog)} matches, updated {_age(store.catalog_updated_at())}"))
+
+    if not offline:
+        import requests
+        base_url = os.getenv('PRACTISCORE_BASE_URL', "https://practiscore.com").rstrip('/')
+        try:
+            response = requests.get(base_url, timeout=10)
+            ok = True if response.status_code < 400 else None
+            checks.append((ok, "PractiScore", f"{base_url} answered {response.status_code}"))
+        except Exception as e:
+            checks.append((False, "PractiScore", f"{base_url} unreachable: {e}"))
+    return checks
+
+def cmd_doctor(context: Context, args) -> int:
+    """Check credentials, browser, caches and connectivity"""
+    icons = {True: '✅', None: '⚠️ ', False: '❌'}
+    checks = doctor_checks(offline=args.offline)
+    for ok, name, detail in checks:
+        print(f"{icons[ok]} {name}: {detail}")
+    return 1 if any(ok is False for ok, _, _ in checks) else 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='matchreg', description="PractiScore match registration",
+                                     epilog="Chain subcommands with '+': matchreg.py scan + status + plan")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan = commands.add_parser('scan', help="Fetch the club page and refresh the catalog")
+    scan.add_argument('--http', action='store_true', help="Fetch over HTTP instead of the browser")
+    scan.set_defaults(handler=cmd_scan)
+
+    status = commands.add_parser('status', help="Probe every cached upcoming match")
+    status.add_argument('--browser', action='store_true', help="Probe in the browser (one match at a time)")
+    status.add_argument('--workers', type=int, default=int(os.getenv('STATUS_WORKERS', 4)))
+    status.set_defaults(handler=cmd_status)
+
+    register = commands.add_parser('register', help="Register for one cached match")
+    register.add_argument('match', help="Match URL or part of its title")
+    register.add_argument('--power-factor', choices=['minor', 'major'], default=None)
+    register.set_defaults(handler=cmd_register)
+
+    watch = commands.add_parser('watch', help="Watch full matches for a freed slot")
+    watch.add_argument('--once', action='store_true')
+    watch.add_argument('--hours', type=float, default=None)
+    watch.set_defaults(handler=cmd_watch)
+
+    plan = commands.add_parser('plan', help="Show what a run would do, without a browser")
+    plan.set_defaults(handler=cmd_plan)
+
+    doctor = commands.add_parser('doctor', help="Check the setup")
+    doctor.add_argument('--offline', action='store_true', help="Skip the connectivity check")
+    doctor.set_defaults(handler=cmd_doctor)
+    return parser
+
+def split_chain(argv: List[str]) -> List[List[str]]:
+    """['scan', '+', 'status'] -> [['scan'], ['status']]"""
+    chain = [[]]
+    for arg in argv:
+        if arg == '+':
+            chain.append([])
+        else:
+            chain[-1].append(arg)
+    return [command for command in chain if command]
+
+def main(argv: List[str] = None) -> int:
+    from dotenv import load_dotenv
+    from logging_setup import setup_logging
+
+    load_dotenv()
+    parser = build_parser()
+    commands = [parser.parse_args(command) for command in split_chain(argv if argv is not None else sys.argv[1:])]
+    if not commands:
+        parser.print_help()
+        return 2
+    setup_logging()
+
+    context = Context()
+    try:
+        for args in commands:
+            code = args.handler(context, args)
+            if code:
+                return code
+        return 0
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        context.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Read PractiScore's XHR/JSON responses through the Chrome DevTools Protocol
+
+With NETWORK_CAPTURE=true the registrar enables Chrome's performance log
+(the CDP Network domain), collects the JSON responses a page loads and
+parses match lists and registration state from them. Pages whose data is
+not found in the captured JSON fall back to DOM parsing.
+"""
+
+import os
+import json
+import logging
+from typing import Dict, List, Optional, Iterable, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+TITLE_KEYS = ('name', 'title', 'match_name', 'matchName')
+LINK_KEYS = ('url', 'link', 'href', 'registration_url', 'registrationUrl')
+SLUG_KEYS = ('slug', 'uuid')
+DATE_KEYS = ('date', 'start_date', 'startDate', 'match_date', 'matchDate')
+REGISTERED_KEYS = ('registered', 'is_registered', 'isRegistered', 'user_registered')
+STATUS_KEYS = ('registration_status', 'registrationStatus', 'status')
+FEE_KEYS = ('fee', 'price', 'cost', 'entry_fee', 'entryFee')
+SPOTS_KEYS = ('spots_available', 'spotsAvailable', 'slots_remaining')
+
+STATUS_VALUES = {
+    'open': 'open',
+    'opened': 'open',
+    'not_open': 'not_open',
+    'not open': 'not_open',
+    'pending': 'not_open',
+    'upcoming': 'not_open',
+    'full': 'full',
+    'waitlist': 'full',
+}
+
+def network_capture_enabled() -> bool:
+    return os.getenv('NETWORK_CAPTURE', 'false').lower() in ('1', 'true', 'yes')
+
+def enable_performance_logging(options) -> None:
+    """Ask chromedriver to record CDP Network events in the performance log"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+def start_capture(driver) -> None:
+    """Enable the Network domain and drop events from earlier navigations"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.get_log('performance')
+    except Exception as e:
+        logger.debug("Network capture unavailable: %s", e)
+
+def json_responses(driver) -> List[Tuple[str, object]]:
+    """(url, parsed body) for every JSON response recorded since start_capture"""
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.debug("No performance log: %s", e)
+        return []
+
+    responses = []
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError, TypeError):
+            continue
+        if message.get('method') != 'Network.responseReceived':
+            continue
+        params = message.get('params', {})
+        response = params.get('response', {})
+        if 'json' not in response.get('mimeType', '') or response.get('status', 200) >= 400:
+            continue
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+            responses.append((response.get('url', ''), json.loads(body['body'])))
+        except Exception as e:
+            logger.debug("Could not read response body for %s: %s", response.get('url'), e)
+    logger.debug("Captured %d JSON responses", len(responses))
+    return responses
+
+def _dicts(payload) -> Iterable[Dict]:
+    """Every dict nested anywhere in a JSON payload"""
+    pending = [payload]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, dict):
+            yield item
+            pending.extend(item.values())
+        elif isinstance(item, list):
+            pending.extend(reversed(item))
+
+def _first(record: Dict, keys: tuple):
+    for key in keys:
+        if record.get(key) not in (None, ''):
+            return record[key]
+    return None
+
+def _match_url(record: Dict) -> Optional[str]:
+    link = _first(record, LINK_KEYS)
+    if isinstance(link, str) and (link.startswith('/') or link.startswith('http')):
+        return urlparse(link).path if link.startswith('http') else link
+    slug = _first(record, SLUG_KEYS)
+    if isinstance(slug, str):
+        return f"/{slug}/register"
+    return None
+
+def matches_from_json(responses: List[Tuple[str, object]], target_match: str) -> List[Dict]:
+    """Match dicts (title, url) found in captured JSON whose title contains target_match"""
+    matches, seen = [], set()
+    for _, payload in responses:
+        for record in _dicts(payload):
+            title = _first(record, TITLE_KEYS)
+            url = _match_url(record)
+            if not isinstance(title, str) or not url or url in seen:
+                continue
+            if target_match.lower() not in title.lower():
+                continue
+            seen.add(url)
+            match = {'title': title.strip(), 'url': url, 'source': 'xhr'}
+            date = _first(record, DATE_KEYS)
+            if date:
+                match['date'] = date
+            matches.append(match)
+    return matches
+
+def registration_status_from_json(responses: List[Tuple[str, object]], match_url: str) -> Optional[str]:
+    """Registration status of match_url from captured JSON, or None if it isn't there"""
+    path = urlparse(match_url).path or match_url
+    for _, payload in responses:
+        for record in _dicts(payload):
+            if _match_url(record) != path:
+                continue
+            if any(record.get(key) for key in REGISTERED_KEYS):
+                return "already_registered"
+            fee = _first(record, FEE_KEYS)
+            if isinstance(fee, (int, float)) and fee > 0:
+                return "paid_match"
+            spots = _first(record, SPOTS_KEYS)
+            status = _first(record, STATUS_KEYS)
+            if isinstance(status, str) and status.lower() in STATUS_VALUES:
+                status = STATUS_VALUES[status.lower()]
+                if status == 'open' and spots == 0:
+                    return "full"
+                return status
+    return None
@@ -4,11 +4,8 @@ Notification system for match registration alerts
 """
 
 import os
-import smtplib
-import requests
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from datetime import datetime
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -26,6 +23,9 @@ class NotificationManager:
         # GitHub notification
         self.github_token = os.getenv('GITHUB_TOKEN')
         self.github_repo = "glocklol/match-reg"
+        
+        # Seconds any one notification request may take (cut down near a run's deadline)
+        self.timeout = float(os.getenv('NOTIFY_TIMEOUT_SECONDS', 30))
     
     def send_email_to_sms(self, subject: str, message: str) -> bool:
         """Send SMS via email-to-SMS gateway (FREE)"""
@@ -54,8 +54,10 @@ class NotificationManager:
             
         try:
             from twilio.rest import Client
+            from twilio.http.http_client import TwilioHttpClient
             
-            client = Client(self.twilio_account_sid, self.twilio_auth_token)
+            client = Client(self.twilio_account_sid, self.twilio_auth_token,
+                            http_client=TwilioHttpClient(timeout=self.timeout))
             
             message = client.messages.create(
                 body=message,
@@ -92,7 +94,9 @@ class NotificationManager:
                 "labels": ["match-notification", "automated"]
             }
             
-            response = requests.post(url, headers=headers, json=data)
+            import requests
+            
+            response = requests.post(url, headers=headers, json=data, timeout=self.timeout)
             
             if response.status_code == 201:
                 issue_url = response.json().get("html_url", "")
@@ -160,7 +164,4 @@ class NotificationManager:
 The system successfully registered you for this match. You should receive a confirmation email from PractiScore.
 """
         
-        self.create_github_issue(subject, issue_body)
-
-# Import datetime at the top
-from datetime import datetime
\ No newline at end of file
+        self.create_github_issue(subject, issue_body)
\ No newline at end of file
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Local PractiScore stand-in server for offline benchmarks and tests
+
+Serves fixture pages for the club list, login, dashboard, match detail,
+registration form and success page, plus the JSON endpoints those pages
+fetch with XHR. Latency, Cloudflare challenges and full rosters can be
+injected to reproduce slow or hostile runs.
+"""
+
+import time
+import json
+import hashlib
+import secrets
+import argparse
+import threading
+from datetime import datetime, timedelta
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import List, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+CLUB_PATH = "/clubs/north_shore_practical_shooters"
+CLUB_API_PATH = "/api" + CLUB_PATH + "/matches"
+MATCH_API_PREFIX = "/api/matches/"
+SESSION_COOKIE = "ps_session"
+
+# Filler that makes fixture pages roughly as heavy as the real ones (the registrar
+# treats anything under 10,000 characters on the club page as a Cloudflare block)
+FILLER_BLOCK = """
+<section class="club-info">
+  <h3>About North Shore Practical Shooters</h3>
+  <p>North Shore Practical Shooters hosts USPSA matches, practice sessions and new shooter
+  clinics throughout the season. All shooters must be familiar with the range rules and
+  safety procedures before participating. Eye and ear protection are required at all times.</p>
+  <ul class="club-links"><li>Range rules</li><li>Directions</li><li>New shooters</li><li>Contact</li></ul>
+</section>
+"""
+
+
+def match_slug(title: str) -> str:
+    """Build a PractiScore style slug from a match title ('NSPS Run & Gun 07/28/25' -> 'nsps-run-gun-07-28-25')"""
+    cleaned = ''.join(c.lower() if c.isalnum() else ' ' for c in title)
+    return '-'.join(cleaned.split())
+
+
+def default_matches(today: datetime = None) -> List[Dict]:
+    """Fixture match list with dates relative to today"""
+    today = today or datetime.now()
+
+    def title(name: str, days: int) -> str:
+        return f"{name} {(today + timedelta(days=days)).strftime('%m/%d/%y')}"
+
+    matches = [
+        {'title': title("NSPS Run & Gun", 7), 'status': 'open'},
+        {'title': title("NSPS Practice with Purpose", 10), 'status': 'not_open'},
+        {'title': title("NSPS Run & Gun - with USPSA Classifiers", 14), 'status': 'open'},
+        {'title': title("NSPS Practice with Purpose", 3), 'status': 'full'},
+        {'title': title("NSPS Run & Gun", -7), 'status': 'closed'},
+        {'title': title("NSPS Steel Challenge", 21), 'status': 'open'},
+        {'title': title("Tri-County Outlaw Match", 5), 'status': 'open'},
+    ]
+    for match in matches:
+        match['slug'] = match_slug(match['title'])
+    return matches
+
+
+class StandinServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 cloudflare_challenges: int = 0, full_rosters: bool = False,
+                 matches: Optional[List[Dict]] = None, page_size: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.cloudflare_challenges = cloudflare_challenges
+        self.full_rosters = full_rosters
+        self.matches = matches if matches is not None else default_matches()
+        self.page_size = page_size  # club page lists this many matches per page (None = all)
+        self._httpd = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget sessions, registrations and request counts"""
+        with self._lock:
+            self.sessions = set()
+            self.csrf_tokens = set()
+            self.registrations = {}  # slug -> list of registrant dicts
+            self.challenges_served = 0
+            self.request_counts = {}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "StandinServer":
+        """Start serving on a background thread"""
+        handler = type('StandinHandler', (StandinHandler,), {'standin': self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def find_match(self, slug: str) -> Optional[Dict]:
+        for match in self.matches:
+            if match['slug'] == slug:
+                return match
+        return None
+
+    def match_status(self, match: Dict) -> str:
+        if self.full_rosters and match['status'] == 'open':
+            return 'full'
+        return match['status']
+
+    def count_request(self, key: str) -> None:
+        with self._lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def take_challenge(self) -> bool:
+        """True if the next club page request should get a Cloudflare challenge"""
+        with self._lock:
+            if self.challenges_served < self.cloudflare_challenges:
+                self.challenges_served += 1
+                return True
+            return False
+
+
+def page(title: str, body: str, filler: int = 0) -> str:
+    """Wrap a body in the common page layout"""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{escape(title)} | PractiScore</title></head>
+<body>
+<header class="navbar"><a href="/">PractiScore</a> <a href="/dashboard/home">Dashboard</a></header>
+<main class="container">
+{body}
+</main>
+{FILLER_BLOCK * filler}
+<footer>PractiScore stand-in</footer>
+</body>
+</html>"""
+
+
+def club_page(standin: StandinServer, number: int = 1) -> str:
+    if not standin.page_size:
+        return club_page_html(standin.matches)
+    start = (number - 1) * standin.page_size
+    more = start + standin.page_size < len(standin.matches)
+    return club_page_html(standin.matches[start:start + standin.page_size], number + 1 if more else None)
+
+
+def club_page_html(matches: List[Dict], next_page: Optional[int] = None) -> str:
+    """Render a club page listing the given matches, with a link to the next page if there is one"""
+    items = []
+    for match in matches:
+        items.append(
+            f'<li class="list-group-item">'
+            f'<a class="match-link" href="/{match["slug"]}/register">{escape(match["title"])}</a>'
+            f'</li>'
+        )
+    body = f"""<h1>North Shore Practical Shooters</h1>
+<h2>Upcoming Matches</h2>
+<ul class="list-group">
+{''.join(items)}
+</ul>
+{f'<nav><a class="page-link" rel="next" href="{CLUB_PATH}?page={next_page}">Next</a></nav>' if next_page else ''}
+<script>fetch("{CLUB_API_PATH}").then(r => r.json());</script>"""
+    return page("North Shore Practical Shooters", body, filler=30)
+
+
+def challenge_page() -> str:
+    return """<!DOCTYPE html><html><head><title>Just a moment... | Cloudflare</title></head>
+<body><p>Checking your browser before accessing practiscore.com.</p></body></html>"""
+
+
+def login_page(error: bool = False) -> str:
+    message = '<p class="alert">Invalid email or password</p>' if error else ''
+    body = f"""<h1>Sign In</h1>
+{message}
+<form method="post" action="/login">
+  <input type="email" name="email" placeholder="Email address">
+  <input type="password" name="password" placeholder="Password">
+  <button type="submit">Sign In</button>
+</form>"""
+    return page("Sign In", body)
+
+
+def dashboard_page(standin: StandinServer, session: str) -> str:
+    rows = []
+    for slug, registrants in standin.registrations.items():
+        if any(r['session'] == session for r in registrants):
+            match = standin.find_match(slug)
+            rows.append(f'<li><a href="/{slug}/register">{escape(match["title"])}</a></li>')
+    body = f"<h1>Dashboard</h1><h2>My Matches</h2><ul>{''.join(rows)}</ul>"
+    return page("Dashboard", body)
+
+
+def match_page(standin: StandinServer, match: Dict, session: Optional[str]) -> str:
+    slug = match['slug']
+    registered = session and any(r['session'] == session for r in standin.registrations.get(slug, []))
+    status = standin.match_status(match)
+    if registered:
+        detail = '<p class="alert">You are registered for this match.</p><a href="#">Withdraw</a>'
+    elif status == 'open':
+        detail = f'<a class="btn btn-primary button" href="/{slug}/register/form">Register</a>'
+    elif status == 'not_open':
+        detail = '<p class="alert">Registration not open yet. Check back later.</p>'
+    elif status == 'full':
+        detail = '<p class="alert">Roster full. This match has reached capacity.</p>'
+    else:
+        detail = '<p class="alert">This match has ended.</p>'
+    count = len(standin.registrations.get(slug, []))
+    body = f"""<h1>{escape(match['title'])}</h1>
+<p>Hosted by North Shore Practical Shooters</p>
+<p class="roster-count">Shooters: {count}</p>
+{detail}
+<script>fetch("{MATCH_API_PREFIX}{slug}", {{credentials: "same-origin"}}).then(r => r.json());</script>"""
+    return page(match['title'], body)
+
+
+def form_page(match: Dict, token: str, error: str = '') -> str:
+    notice = f'<p class="error">{escape(error)}</p>' if error else ''
+    body = f"""<h1>Register: {escape(match['title'])}</h1>
+{notice}
+<form method="post" action="/{match['slug']}/register/form">
+  <input type="hidden" name="_token" value="{token}">
+  <input type="text" name="first_name">
+  <input type="text" name="last_name">
+  <input type="email" name="email">
+  <select name="power_factor">
+    <option value="minor">Minor</option>
+    <option value="major">Major</option>
+  </select>
+  <label><input type="radio" name="division" value="carry_optics" checked> Carry Optics</label>
+  <label><input type="radio" name="division" value="limited"> Limited</label>
+  <label><input type="checkbox" name="newsletter" value="yes"> Club newsletter</label>
+  <label><input type="checkbox" name="waiver" value="accepted" required> I accept the range waiver</label>
+  <button type="submit">Submit Registration</button>
+</form>"""
+    return page(f"Register: {match['title']}", body)
+
+
+def success_page(match: Dict) -> str:
+    body = f"""<h1>{escape(match['title'])}</h1>
+<p class="alert">Success! You are registered. A confirmation email is on its way.</p>"""
+    return page(match['title'], body)
+
+
+def match_json(standin: StandinServer, match: Dict, session: Optional[str]) -> Dict:
+    """What the page's XHR gets for one match"""
+    registrants = standin.registrations.get(match['slug'], [])
+    return {
+        'name': match['title'],
+        'slug': match['slug'],
+        'registration_status': standin.match_status(match),
+        'shooters': len(registrants),
+        'registered': bool(session and any(r['session'] == session for r in registrants)),
+    }
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    standin: StandinServer = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _session(self) -> Optional[str]:
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE and value in self.standin.sessions:
+                return value
+        return None
+
+    def _form(self) -> Dict[str, str]:
+        length = int(self.headers.get('Content-Length', 0))
+        data = parse_qs(self.rfile.read(length).decode())
+        return {key: values[0] for key, values in data.items()}
+
+    def _send(self, html: str, status: int = 200, headers: Dict[str, str] = None) -> None:
+        payload = html.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_json(self, data, status: int = 200) -> None:
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str, headers: Dict[str, str] = None) -> None:
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _split_match_path(self, path: str):
+        parts = [p for p in path.split('/') if p]
+        if len(parts) >= 2 and parts[1] == 'register':
+            return self.standin.find_match(parts[0]), parts[2:]
+        return None, None
+
+    def do_GET(self):
+        standin = self.standin
+        path = urlparse(self.path).path
+        standin.count_request(f"GET {path}")
+        if standin.latency:
+            time.sleep(standin.latency)
+
+        if path == CLUB_PATH:
+            if standin.take_challenge():
+                return self._send(challenge_page(), status=403)
+            number = parse_qs(urlparse(self.path).query).get('page', ['1'])[0]
+            return self._send(club_page(standin, int(number) if number.isdigit() else 1))
+        if path == CLUB_API_PATH:
+            return self._send_json({'matches': [match_json(standin, m, None) for m in standin.matches]})
+        if path.startswith(MATCH_API_PREFIX):
+            match = standin.find_match(path[len(MATCH_API_PREFIX):])
+            if match is None:
+                return self._send_json({'error': 'not found'}, status=404)
+            return self._send_json({'match': match_json(standin, match, self._session())})
+        if path == '/login':
+            if self._session():
+                return self._redirect('/dashboard/home')
+            return self._send(login_page())
+        if path == '/dashboard/home':
+            session = self._session()
+            if not session:
+                return self._redirect('/login')
+            return self._send(dashboard_page(standin, session))
+
+        match, rest = self._split_match_path(path)
+        if match is None:
+            return self._send(page("Not Found", "<h1>Page not found</h1>"), status=404)
+        if rest == ['form']:
+            if not self._session():
+                return self._redirect('/login')
+            token = secrets.token_hex(16)
+            standin.csrf_tokens.add(token)
+            return self._send(form_page(match, token))
+        html = match_page(standin, match, self._session())
+        etag = '"%s"' % hashlib.sha1(html.encode()).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        return self._send(html, headers={'ETag': etag})
+
+    def do_POST(self):
+        standin = self.standin
+        path = urlparse(self.path).path
+        standin.count_request(f"POST {path}")
+        if standin.latency:
+            time.sleep(standin.latency)
+        form = self._form()
+
+        if path == '/login':
+            if not form.get('email') or not form.get('password'):
+                return self._send(login_page(error=True))
+            session = secrets.token_hex(16)
+            standin.sessions.add(session)
+            return self._redirect('/dashboard/home', {
+                'Set-Cookie': f"{SESSION_COOKIE}={session}; Path=/; HttpOnly"
+            })
+
+        match, rest = self._split_match_path(path)
+        if match is None or rest != ['form']:
+            return self._send(page("Not Found", "<h1>Page not found</h1>"), status=404)
+        session = self._session()
+        if not session:
+            return self._redirect('/login')
+        if form.get('_token') not in standin.csrf_tokens:
+            return self._send(page("Page Expired", "<h1>Page expired (419)</h1>"), status=419)
+        standin.csrf_tokens.discard(form.get('_token'))
+        if standin.match_status(match) != 'open':
+            return self._send(match_page(standin, match, session))
+        if form.get('waiver') != 'accepted':
+            token = secrets.token_hex(16)
+            standin.csrf_tokens.add(token)
+            return self._send(form_page(match, token, "The range waiver must be accepted"))
+        standin.registrations.setdefault(match['slug'], []).append({
+            'session': session,
+            'first_name': form.get('first_name', ''),
+            'last_name': form.get('last_name', ''),
+            'email': form.get('email', ''),
+            'power_factor': form.get('power_factor', ''),
+            'division': form.get('division', ''),
+        })
+        return self._send(success_page(match))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local PractiScore stand-in server")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--cloudflare', type=int, default=0, help="Number of club page challenges to serve")
+    parser.add_argument('--full', action='store_true', help="Show every open match as full")
+    args = parser.parse_args()
+
+    server = StandinServer(port=args.port, latency=args.latency,
+                           cloudflare_challenges=args.cloudflare, full_rosters=args.full).start()
+    print(f"🧪 PractiScore stand-in running at {server.url}")
+    print(f"   export PRACTISCORE_BASE_URL={server.url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Process information from /proc, for the memory watchdog and the driver supervisor
+
+Everything returns empty results where /proc does not exist (macOS, Windows).
+"""
+
+import os
+from typing import Dict, List, Optional
+
+def read_proc(pid: int, name: str) -> Optional[str]:
+    """Contents of /proc/<pid>/<name>, or None if the process (or /proc) is gone"""
+    try:
+        with open(f"/proc/{pid}/{name}", 'rb') as f:
+            return f.read().decode(errors='replace')
+    except OSError:
+        return None
+
+def children_map() -> Dict[int, List[int]]:
+    """Parent pid -> pids of its children, for every running process"""
+    children = {}
+    if not os.path.isdir('/proc'):
+        return children
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        stat = read_proc(int(entry), 'stat')
+        if not stat:
+            continue
+        # The command name may contain spaces; fields after it are space separated
+        fields = stat[stat.rfind(')') + 2:].split()
+        children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+def process_tree(pid: int) -> List[int]:
+    """pid and all of its descendants"""
+    children = children_map()
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
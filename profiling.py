@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for run_check and the CLI entry points
+
+Enable with MATCHREG_PROFILE=cprofile|sample|all (1 means all) or --profile on
+the command line. cProfile output is written as .prof (open with snakeviz or
+pstats), sampled stacks as .collapsed (feed to flamegraph.pl or speedscope).
+MATCHREG_TRACE_WEBDRIVER=1 or --trace-webdriver also records every WebDriver
+command with its latency.
+"""
+
+import os
+import sys
+import time
+import json
+import logging
+import threading
+import cProfile
+from datetime import datetime
+from typing import Optional, Dict, List
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ['cprofile', 'sample', 'all']
+
+# Profiles go next to match_registrar.log unless MATCHREG_PROFILE_DIR is set
+DEFAULT_PROFILE_DIR = '.'
+
+def add_profile_arguments(parser) -> None:
+    """Add --profile and --trace-webdriver to an argparse parser"""
+    parser.add_argument('--profile', nargs='?', const='all', choices=PROFILE_MODES,
+                        help="Profile this run (cprofile, sample or all)")
+    parser.add_argument('--trace-webdriver', action='store_true',
+                        help="Record every WebDriver command with its latency")
+
+def profile_mode(args=None) -> Optional[str]:
+    """Resolve the profiling mode from parsed args or MATCHREG_PROFILE"""
+    mode = getattr(args, 'profile', None) or os.getenv('MATCHREG_PROFILE', '').strip().lower()
+    if mode in ('1', 'true', 'yes'):
+        mode = 'all'
+    return mode if mode in PROFILE_MODES else None
+
+def trace_webdriver_enabled(args=None) -> bool:
+    """Whether WebDriver command tracing was requested"""
+    if getattr(args, 'trace_webdriver', False):
+        return True
+    return os.getenv('MATCHREG_TRACE_WEBDRIVER', '').strip().lower() in ('1', 'true', 'yes')
+
+def _output_base(name: str) -> str:
+    directory = os.getenv('MATCHREG_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"profile-{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+
+class StackSampler:
+    """Samples the stacks of all threads at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.counts: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _frame_label(self, frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)))
+            key = ';'.join(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+class WebDriverTracer:
+    """Times every WebDriver command by wrapping RemoteWebDriver.execute"""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self._original = None
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        from selenium.webdriver.remote.webdriver import WebDriver
+        self._original = original = WebDriver.execute
+        tracer = self
+
+        def traced_execute(driver, driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(driver, driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                with tracer._lock:
+                    tracer.records.append({
+                        'command': driver_command,
+                        'seconds': round(elapsed, 4),
+                        'at': round(time.time(), 3),
+                    })
+                logger.debug("WebDriver %s took %.3fs", driver_command, elapsed)
+
+        WebDriver.execute = traced_execute
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            from selenium.webdriver.remote.webdriver import WebDriver
+            WebDriver.execute = self._original
+            self._original = None
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-command count, total and max latency"""
+        summary = {}
+        for record in self.records:
+            entry = summary.setdefault(record['command'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += record['seconds']
+            entry['max'] = max(entry['max'], record['seconds'])
+        return summary
+
+    def write(self, path: str) -> None:
+        with open(path, 'w') as f:
+            for record in self.records:
+                f.write(json.dumps(record) + "\n")
+
+def run_profiled(name: str, func, *args, mode: Optional[str] = None, trace_webdriver: bool = False, **kwargs):
+    """Run func under the requested profilers and write their output; returns func's result"""
+    if not mode and not trace_webdriver:
+        return func(*args, **kwargs)
+
+    base = _output_base(name)
+    profiler = cProfile.Profile() if mode in ('cprofile', 'all') else None
+    sampler = StackSampler() if mode in ('sample', 'all') else None
+    tracer = WebDriverTracer() if trace_webdriver else None
+
+    if tracer:
+        tracer.install()
+    if sampler:
+        sampler.start()
+    if profiler:
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(f"{base}.prof")
+            logger.info(f"🔬 cProfile output: {base}.prof")
+        if sampler:
+            sampler.stop()
+            sampler.write_collapsed(f"{base}.collapsed")
+            logger.info(f"🔬 Collapsed stacks: {base}.collapsed")
+        if tracer:
+            tracer.uninstall()
+            tracer.write(f"{base}.webdriver.jsonl")
+            total = sum(r['seconds'] for r in tracer.records)
+            logger.info(f"🔬 WebDriver trace: {len(tracer.records)} commands, {total:.1f}s of {elapsed:.1f}s "
+                        f"-> {base}.webdriver.jsonl")
+            for command, entry in sorted(tracer.summary().items(), key=lambda kv: -kv[1]['total'])[:10]:
+                logger.info(f"   {command}: {entry['count']}x, {entry['total']:.2f}s total, {entry['max']:.2f}s max")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Adaptive request rate control with a per-host politeness budget
+
+Every browser navigation and HTTP request acquires a token from the host's
+token bucket first. Cloudflare challenges, 429s and 503s halve the host's
+rate and add a cooldown; clean responses slowly restore it. The rate may be
+boosted above the base rate (up to RATE_LIMIT_MAX_PER_MINUTE) only while a
+target is close to opening. A hard per-run request budget caps the total;
+new_run() renews it (and drops the boost) for each run of a long-lived process.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+class RequestBudgetExceeded(Exception):
+    """Raised when a host's per-run request budget is used up"""
+
+class TokenBucket:
+    def __init__(self, rate_per_minute: float, capacity: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+class HostState:
+    def __init__(self, base_rate: float, burst: float):
+        self.base_rate = base_rate
+        self.ceiling = base_rate
+        self.bucket = TokenBucket(base_rate, burst)
+        self.cooldown_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate * 60
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        self.bucket._refill()
+        self.bucket.rate = rate_per_minute / 60.0
+
+class RateController:
+    def __init__(self, base_rate: float = None, burst: float = None, max_rate: float = None,
+                 min_rate: float = None, budget: int = None, cooldown: float = None):
+        self.base_rate = base_rate if base_rate is not None else float(os.getenv('RATE_LIMIT_PER_MINUTE', 30))
+        self.burst = burst if burst is not None else float(os.getenv('RATE_LIMIT_BURST', 5))
+        self.max_rate = (max_rate if max_rate is not None
+                         else float(os.getenv('RATE_LIMIT_MAX_PER_MINUTE', self.base_rate * 2)))
+        self.min_rate = min_rate if min_rate is not None else float(os.getenv('RATE_LIMIT_MIN_PER_MINUTE', 2))
+        self.budget = budget if budget is not None else int(os.getenv('RATE_BUDGET_PER_RUN', 300))
+        self.cooldown = cooldown if cooldown is not None else float(os.getenv('RATE_COOLDOWN_SECONDS', 10))
+        self.hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url: str) -> HostState:
+        host = urlparse(url).netloc or url
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = HostState(self.base_rate, self.burst)
+        return state
+
+    def acquire(self, url: str, deadline=None) -> float:
+        """Block until the host allows another request; returns the seconds waited
+        
+        With a Deadline, a wait that would outlast it raises DeadlineExceeded instead.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                state = self._host(url)
+                if state.requests >= self.budget:
+                    raise RequestBudgetExceeded(f"Request budget of {self.budget} used up for {urlparse(url).netloc}")
+                delay = max(state.bucket.wait_time(), state.cooldown_until - time.monotonic())
+                if delay <= 0:
+                    state.bucket.take()
+                    state.requests += 1
+                    state.waited += waited
+                    return waited
+            if deadline is not None and delay > deadline.remaining():
+                from deadline import DeadlineExceeded
+                raise DeadlineExceeded(deadline.phase)
+            time.sleep(delay)
+            waited += delay
+
+    def on_challenge(self, url: str, retry_after: Optional[float] = None) -> None:
+        """Slow down after a Cloudflare challenge, 429 or 503"""
+        with self._lock:
+            state = self._host(url)
+            state.throttled += 1
+            state.set_rate(max(self.min_rate, state.rate / 2))
+            state.cooldown_until = time.monotonic() + (retry_after if retry_after is not None else self.cooldown)
+            logger.warning(f"🐢 Throttled by {urlparse(url).netloc} - rate now {state.rate:.1f}/min")
+
+    def on_success(self, url: str) -> None:
+        """Recover toward the ceiling after a clean response"""
+        with self._lock:
+            state = self._host(url)
+            if state.rate < state.ceiling:
+                state.set_rate(min(state.ceiling, state.rate + state.base_rate * 0.1))
+
+    def on_status(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Feed an HTTP status code back into the controller"""
+        if status_code in (429, 503):
+            seconds = float(retry_after) if retry_after and retry_after.isdigit() else None
+            self.on_challenge(url, seconds)
+        elif status_code < 400:
+            self.on_success(url)
+
+    def boost(self, url: str) -> None:
+        """Allow up to max_rate while a target is close to opening (never after throttling)"""
+        with self._lock:
+            state = self._host(url)
+            if state.throttled:
+                return
+            state.ceiling = self.max_rate
+            if state.rate < self.max_rate:
+                state.set_rate(self.max_rate)
+                logger.info(f"🚀 Boosting {urlparse(url).netloc} to {self.max_rate:.0f}/min")
+
+    def new_run(self) -> None:
+        """Start a run: fresh request budget and no boost, keeping any throttling and cooldown"""
+        with self._lock:
+            for state in self.hosts.values():
+                state.requests = 0
+                state.waited = 0.0
+                state.ceiling = state.base_rate
+                if state.rate > state.base_rate:
+                    state.set_rate(state.base_rate)
+
+    def remaining(self, url: str) -> int:
+        with self._lock:
+            return self.budget - self._host(url).requests
+
+    def snapshot(self) -> Dict:
+        """Current rate and budget per host, for the run report"""
+        with self._lock:
+            return {
+                host: {
+                    'rate_per_minute': round(state.rate, 2),
+                    'requests': state.requests,
+                    'budget_remaining': self.budget - state.requests,
+                    'throttled': state.throttled,
+                    'seconds_waited': round(state.waited, 2),
+                }
+                for host, state in self.hosts.items()
+            }
+
+def rate_limited_session(controller: RateController, deadline: Callable[[], object] = None):
+    """A requests.Session whose requests go through the rate controller
+    
+    deadline returns the current run's Deadline, so a rate-limit wait never outlasts it.
+    """
+    import requests
+
+    class RateLimitedSession(requests.Session):
+        def request(self, method, url, *args, **kwargs):
+            controller.acquire(url, deadline() if deadline else None)
+            response = super().request(method, url, *args, **kwargs)
+            controller.on_status(url, response.status_code, response.headers.get('Retry-After'))
+            return response
+
+    return RateLimitedSession()
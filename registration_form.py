@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Registration form schema - learned from the browser once, replayed over HTTP
+
+The first browser registration for a match type records where the form
+lives, where it posts to and what its fields are. Later registrations of
+that type fetch the form page with the logged-in requests session (for a
+fresh CSRF token) and submit it as a single POST.
+"""
+
+import logging
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+logger = logging.getLogger(__name__)
+
+MATCH_PLACEHOLDER = '{match}'
+CSRF_NAMES = ('_token', 'csrf_token', 'csrfmiddlewaretoken', 'authenticity_token', '_csrf')
+TEXT_INPUT_TYPES = ('text', 'email', 'tel', 'number', '')
+
+def _path(url: str) -> str:
+    parsed = urlparse(url)
+    return parsed.path + (f"?{parsed.query}" if parsed.query else '')
+
+def parse_registration_form(page_source: str, page_url: str) -> Optional[Dict]:
+    """Schema of the registration form on a page: action, hidden inputs, fields, choices and select options
+    
+    Checkboxes that are checked or required (a waiver, an agreement) are kept with the
+    value they submit; radio groups with a checked or required choice keep their values.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page_source, 'html.parser')
+    forms = [form for form in soup.find_all('form') if form.find(['input', 'select'])]
+    if not forms:
+        return None
+    # The registration form is the POST form with the most inputs (not a search box or logout link)
+    form = max(forms, key=lambda f: ((f.get('method') or 'get').lower() == 'post', len(f.find_all(['input', 'select']))))
+
+    schema = {
+        'form_url': _path(page_url),
+        'action': _path(urljoin(page_url, form.get('action') or page_url)),
+        'method': (form.get('method') or 'get').lower(),
+        'hidden': {},
+        'fields': [],
+        'selects': {},
+        'checkboxes': {},
+        'radios': {},
+        'csrf_field': None,
+    }
+    radios = {}
+    for field in form.find_all('input'):
+        name = field.get('name')
+        input_type = (field.get('type') or '').lower()
+        if not name:
+            continue
+        if input_type == 'hidden':
+            schema['hidden'][name] = field.get('value', '')
+            if name.lower() in CSRF_NAMES or 'csrf' in name.lower():
+                schema['csrf_field'] = name
+        elif input_type in TEXT_INPUT_TYPES:
+            schema['fields'].append(name)
+        elif input_type == 'checkbox':
+            if field.has_attr('checked') or field.has_attr('required'):
+                schema['checkboxes'][name] = field.get('value', 'on')
+        elif input_type == 'radio':
+            radios.setdefault(name, []).append(field)
+    for name, choices in radios.items():
+        checked = [choice.get('value', 'on') for choice in choices if choice.has_attr('checked')]
+        if checked or any(choice.has_attr('required') for choice in choices):
+            # The checked choice first, so it is the default
+            values = [choice.get('value', 'on') for choice in choices]
+            schema['radios'][name] = checked[:1] + [value for value in values if value not in checked[:1]]
+    for select in form.find_all('select'):
+        if select.get('name'):
+            schema['selects'][select['name']] = [
+                [option.get('value', option.get_text().strip()), option.get_text().strip()]
+                for option in select.find_all('option')
+            ]
+    return schema
+
+def is_match_template(template: Dict) -> bool:
+    """True if both the form URL and the action are tied to the match through the placeholder"""
+    return all(MATCH_PLACEHOLDER in template.get(key, '') for key in ('form_url', 'action'))
+
+def schema_template(schema: Dict, match_path: str) -> Optional[Dict]:
+    """Schema with this match's URL replaced by a placeholder so other matches of the type can use it
+    
+    None if the form URL or action doesn't contain the match path (a numeric id, another
+    slug) - such a template would send every match's registration to this match.
+    """
+    template = dict(schema)
+    for key in ('form_url', 'action'):
+        template[key] = schema[key].replace(match_path, MATCH_PLACEHOLDER)
+    if not is_match_template(template):
+        return None
+    # Hidden values (the CSRF token in particular) are fetched fresh every time
+    template['hidden'] = sorted(schema['hidden'])
+    return template
+
+def schema_for_match(template: Dict, match_path: str) -> Dict:
+    schema = dict(template)
+    for key in ('form_url', 'action'):
+        schema[key] = template[key].replace(MATCH_PLACEHOLDER, match_path)
+    return schema
+
+def same_shape(template: Dict, schema: Dict) -> bool:
+    """True if a freshly fetched form still matches the learned template"""
+    return (sorted(schema['hidden']) == template['hidden']
+            and schema['fields'] == template['fields']
+            and sorted(schema['selects']) == sorted(template['selects'])
+            and sorted(schema['checkboxes']) == sorted(template.get('checkboxes', {}))
+            and sorted(schema['radios']) == sorted(template.get('radios', {})))
+
+def build_form_data(schema: Dict, details: Dict[str, str]) -> Dict[str, str]:
+    """POST body for a fresh form: its hidden inputs plus our registration details"""
+    data = dict(schema['hidden'])
+    for name in schema['fields']:
+        lowered = name.lower()
+        if 'first' in lowered and details.get('first_name'):
+            data[name] = details['first_name']
+        elif 'last' in lowered and details.get('last_name'):
+            data[name] = details['last_name']
+        elif 'email' in lowered and details.get('email'):
+            data[name] = details['email']
+        else:
+            data.setdefault(name, '')
+    wanted = (details.get('power_factor') or '').lower()
+    for name, options in schema['selects'].items():
+        if not options:
+            continue
+        value = options[0][0]
+        if wanted and ('power' in name.lower() or 'factor' in name.lower()):
+            for option_value, option_text in options:
+                if wanted in option_text.lower() or wanted == option_value.lower():
+                    value = option_value
+                    break
+        data[name] = value
+    data.update(schema['checkboxes'])
+    for name, values in schema['radios'].items():
+        data[name] = values[0]
+        if wanted and ('power' in name.lower() or 'factor' in name.lower()):
+            data[name] = next((value for value in values if value.lower() == wanted), values[0])
+    return data
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Record a live run and replay it offline
+
+MATCHREG_RECORD=run.jsonl.gz records every browser navigation (final URL,
+title, page source, load time), later page source reads, captured XHR
+bodies and requests-session responses into a gzipped JSON-lines archive.
+MATCHREG_REPLAY=run.jsonl.gz serves that archive back through ReplayDriver
+instead of Chrome, so parsing, classification and decisions can be re-run
+and timed offline. ReplayServer serves the same archive over HTTP for the
+requests session.
+
+    python replay.py info run.jsonl.gz
+    python replay.py run run.jsonl.gz --output results.json
+    python replay.py serve run.jsonl.gz --port 8766
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import logging
+import argparse
+import threading
+from collections import defaultdict, deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+
+def record_path() -> Optional[str]:
+    return os.getenv('MATCHREG_RECORD') or None
+
+def replay_path() -> Optional[str]:
+    return os.getenv('MATCHREG_REPLAY') or None
+
+def _path(url: str) -> str:
+    """Archive key for a URL - path and query, so a different base URL replays the same pages"""
+    parsed = urlparse(url)
+    return (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+
+class Recorder:
+    """Appends records to a gzipped JSON-lines archive (thread-safe)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        self.navigations = 0
+        self.write({'kind': 'meta', 'version': ARCHIVE_VERSION, 'started_at': time.time()})
+        logger.info(f"⏺️  Recording run to {path}")
+
+    def write(self, record: Dict) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            record.setdefault('at', time.time())
+            self._file.write(json.dumps(record) + '\n')
+
+    def next_navigation(self) -> int:
+        """Id for the next recorded navigation (drivers record from several threads)"""
+        with self._lock:
+            self.navigations += 1
+            return self.navigations
+
+    def record_http(self, method: str, url: str, response, elapsed: float) -> None:
+        self.write({'kind': 'http', 'method': method.upper(), 'path': _path(url), 'status': response.status_code,
+                    'content_type': response.headers.get('Content-Type', ''), 'body': response.text,
+                    'elapsed': round(elapsed, 4)})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+def record_session(session, recorder: Recorder) -> None:
+    """Record every response a requests session receives"""
+    original = session.request
+
+    def request(method, url, *args, **kwargs):
+        start = time.perf_counter()
+        response = original(method, url, *args, **kwargs)
+        recorder.record_http(method, url, response, time.perf_counter() - start)
+        return response
+
+    session.request = request
+
+class RecordingDriver:
+    """Wraps a WebDriver and records what the registrar sees through it"""
+
+    def __init__(self, driver, recorder: Recorder):
+        self._driver = driver
+        self._recorder = recorder
+        self._navigation = None
+        self._last_source = None
+        self._xhr_urls = {}
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url: str) -> None:
+        start = time.perf_counter()
+        self._driver.get(url)
+        elapsed = time.perf_counter() - start
+        self._navigation = self._recorder.next_navigation()
+        self._last_source = self._driver.page_source
+        self._recorder.write({'kind': 'navigation', 'id': self._navigation, 'path': _path(url),
+                              'final_url': self._driver.current_url, 'title': self._driver.title,
+                              'page_source': self._last_source, 'elapsed': round(elapsed, 4)})
+
+    @property
+    def page_source(self) -> str:
+        source = self._driver.page_source
+        if source != self._last_source:
+            # The page changed after load (client-side rendering) - keep each version in order
+            self._last_source = source
+            self._recorder.write({'kind': 'snapshot', 'navigation': self._navigation, 'page_source': source})
+        return source
+
+    def get_log(self, log_type: str):
+        entries = self._driver.get_log(log_type)
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+                if message.get('method') == 'Network.responseReceived':
+                    params = message['params']
+                    self._xhr_urls[params['requestId']] = params['response']
+            except (KeyError, ValueError, TypeError):
+                continue
+        return entries
+
+    def execute_cdp_cmd(self, command: str, params: Dict):
+        result = self._driver.execute_cdp_cmd(command, params)
+        if command == 'Network.getResponseBody':
+            response = self._xhr_urls.get(params.get('requestId'), {})
+            self._recorder.write({'kind': 'xhr', 'navigation': self._navigation, 'url': response.get('url', ''),
+                                  'mime_type': response.get('mimeType', 'application/json'),
+                                  'body': result.get('body', '')})
+        return result
+
+def load_archive(path: str) -> List[Dict]:
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+class ReplayArchive:
+    """Navigations from an archive, handed out per URL in recorded order"""
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.navigations = defaultdict(deque)
+        self.snapshots = defaultdict(list)
+        self.xhr = defaultdict(list)
+        self.http = defaultdict(deque)
+        for record in records:
+            kind = record['kind']
+            if kind == 'navigation':
+                self.navigations[record['path']].append(record)
+            elif kind == 'snapshot':
+                self.snapshots[record['navigation']].append(record['page_source'])
+            elif kind == 'xhr':
+                self.xhr[record['navigation']].append(record)
+            elif kind == 'http':
+                self.http[(record['method'], record['path'])].append(record)
+        self._lock = threading.Lock()
+        self.misses = []
+
+    @classmethod
+    def open(cls, path: str) -> "ReplayArchive":
+        return cls(load_archive(path))
+
+    def next_navigation(self, url: str) -> Optional[Dict]:
+        """The next recorded load of this URL (the last one repeats once they run out)"""
+        with self._lock:
+            queue = self.navigations.get(_path(url))
+            if not queue:
+                self.misses.append(_path(url))
+                return None
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def next_http(self, method: str, path: str) -> Optional[Dict]:
+        with self._lock:
+            queue = self.http.get((method, path))
+            if not queue:
+                return None
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+class ReplayDriver:
+    """Enough of a WebDriver to replay recorded pages through the registrar"""
+
+    def __init__(self, archive: ReplayArchive, realtime: bool = False):
+        self.archive = archive
+        self.realtime = realtime
+        self.current_url = 'data:,'
+        self.title = ''
+        self._navigation = None
+        self._sources = deque()
+        self._source = ''
+
+    def get(self, url: str) -> None:
+        record = self.archive.next_navigation(url)
+        if record is None:
+            self.current_url, self.title, self._source = url, 'Not recorded', ''
+            self._navigation = None
+            self._sources = deque()
+            return
+        if self.realtime:
+            time.sleep(record['elapsed'])
+        self.current_url = record['final_url']
+        self.title = record['title']
+        self._navigation = record['id']
+        self._source = record['page_source']
+        self._sources = deque(self.archive.snapshots.get(record['id'], []))
+
+    @property
+    def page_source(self) -> str:
+        if self._sources:
+            self._source = self._sources.popleft()
+        return self._source
+
+    def get_log(self, log_type: str) -> List[Dict]:
+        entries = []
+        for i, record in enumerate(self.archive.xhr.get(self._navigation, [])):
+            message = {'message': {'method': 'Network.responseReceived', 'params': {
+                'requestId': f"{self._navigation}.{i}",
+                'response': {'url': record['url'], 'mimeType': record['mime_type'], 'status': 200}}}}
+            entries.append({'message': json.dumps(message)})
+        return entries
+
+    def execute_cdp_cmd(self, command: str, params: Dict):
+        if command == 'Network.getResponseBody':
+            navigation, index = params['requestId'].split('.')
+            return {'body': self.archive.xhr[int(navigation)][int(index)]['body'], 'base64Encoded': False}
+        return {}
+
+    def execute_script(self, *args):
+        return None
+
+    def find_element(self, *args):
+        from selenium.common.exceptions import NoSuchElementException
+        raise NoSuchElementException("Interactive elements are not replayed")
+
+    def find_elements(self, *args):
+        return []
+
+    def get_cookies(self) -> List[Dict]:
+        return []
+
+    def add_cookie(self, cookie: Dict) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+class ReplayServer:
+    """Serves an archive's pages and HTTP responses on a local port"""
+
+    def __init__(self, archive: ReplayArchive, host: str = "127.0.0.1", port: int = 0):
+        self.archive = archive
+        self.host = host
+        self.port = port
+        self._httpd = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "ReplayServer":
+        archive = self.archive
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, method: str) -> None:
+                path = _path(self.path)
+                record = archive.next_http(method, path)
+                if record is not None:
+                    status, content_type, body = record['status'], record['content_type'], record['body']
+                else:
+                    navigation = archive.next_navigation(path) if method == 'GET' else None
+                    if navigation is None:
+                        status, content_type, body = 404, 'text/plain', 'Not recorded'
+                    else:
+                        status, content_type, body = 200, 'text/html; charset=utf-8', navigation['page_source']
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header('Content-Type', content_type or 'text/html')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._reply('GET')
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self._reply('POST')
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._httpd.server_address[1]
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def summarize(records: List[Dict]) -> Dict:
+    """Navigation counts and load times per path"""
+    per_path = defaultdict(list)
+    for record in records:
+        if record['kind'] == 'navigation':
+            per_path[record['path']].append(record['elapsed'])
+    kinds = defaultdict(int)
+    for record in records:
+        kinds[record['kind']] += 1
+    return {
+        'records': dict(kinds),
+        'load_seconds': round(sum(sum(times) for times in per_path.values()), 3),
+        'paths': {path: {'loads': len(times), 'seconds': round(sum(times), 3)} for path, times in per_path.items()},
+    }
+
+class NullNotifier:
+    """Replayed runs never send notifications"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+REPLAY_ENV = ('MATCHREG_REPLAY', 'MATCHREG_RECORD', 'MATCH_STATE_PATH', 'RUN_REPORT_PATH', 'COOKIE_CACHE')
+
+def replay_run(path: str) -> Dict:
+    """Re-run a check against an archive; returns the probed statuses and timings"""
+    import tempfile
+    from match_registrar import PractiscoreRegistrar
+
+    # The registrar reads its settings from the environment; restored afterwards so
+    # nothing later in the process stays in replay mode
+    saved = {name: os.environ.get(name) for name in REPLAY_ENV}
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            # Never touch the live state, report or cookies
+            os.environ['MATCHREG_REPLAY'] = path
+            os.environ['MATCH_STATE_PATH'] = os.path.join(directory, 'match_state.json')
+            os.environ['RUN_REPORT_PATH'] = os.path.join(directory, 'run_report.json')
+            os.environ['COOKIE_CACHE'] = 'off'
+            os.environ.pop('MATCHREG_RECORD', None)
+            registrar = PractiscoreRegistrar()
+            start = time.perf_counter()
+            registrar.run_check()
+            elapsed = time.perf_counter() - start
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        statuses = {entry.get('title', url): entry.get('status')
+                    for url, entry in registrar.state.data['matches'].items()}
+        return {
+            'archive': path,
+            'wall_time': round(elapsed, 3),
+            'statuses': statuses,
+            'counters': registrar.report.counters,
+            'not_recorded': sorted(set(registrar._replay_archive.misses)),
+        }
+
+if __name__ == "__main__":
+    from logging_setup import setup_logging
+
+    parser = argparse.ArgumentParser(description="Inspect, replay or serve a recorded run")
+    parser.add_argument('command', choices=['info', 'run', 'serve'])
+    parser.add_argument('archive')
+    parser.add_argument('--output', help="Write the replay results as JSON (run)")
+    parser.add_argument('--port', type=int, default=8766, help="Port to serve on (serve)")
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        summary = summarize(load_archive(args.archive))
+        print(f"📼 {args.archive}: {summary['records']}, {summary['load_seconds']:.1f}s of page loads")
+        for path, stats in sorted(summary['paths'].items(), key=lambda item: -item[1]['seconds']):
+            print(f"   {stats['seconds']:7.2f}s {stats['loads']:3d}x {path}")
+    elif args.command == 'run':
+        setup_logging()
+        results = replay_run(args.archive)
+        for title, status in results['statuses'].items():
+            print(f"   {status or '-':<19}{title}")
+        print(f"Replayed in {results['wall_time']:.2f}s ({results['counters'].get('page_loads', 0)} page loads)")
+        if results['not_recorded']:
+            print(f"⚠️  Not in the recording: {', '.join(results['not_recorded'])}")
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+    else:
+        server = ReplayServer(ReplayArchive.open(args.archive), port=args.port).start()
+        print(f"📼 Serving {args.archive} at {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+            sys.exit(0)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Run report for match registration runs - counters, timings and per-feature sections
+"""
+
+import os
+import json
+import time
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+class RunReport:
+    def __init__(self):
+        self.started_at = time.time()
+        self.finished_at = None
+        self.counters: Dict[str, int] = {
+            'browser_starts': 0,
+            'page_loads': 0,
+        }
+        self.sections: Dict[str, Dict] = {}
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increase a named counter"""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def section(self, name: str) -> Dict:
+        """Get (creating if needed) a named section of the report"""
+        return self.sections.setdefault(name, {})
+
+    def wall_time(self) -> float:
+        """Seconds since the report was started (or until it was finished)"""
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - self.started_at
+
+    def finish(self) -> None:
+        """Mark the run as finished"""
+        self.finished_at = time.time()
+
+    def to_dict(self) -> Dict:
+        """Serializable view of the report"""
+        return {
+            'started_at': self.started_at,
+            'wall_time': round(self.wall_time(), 3),
+            'counters': dict(self.counters),
+            'sections': self.sections,
+        }
+
+    def write(self, path: str = None) -> str:
+        """Write the report as JSON (defaults to RUN_REPORT_PATH or run_report.json)"""
+        path = path or os.getenv('RUN_REPORT_PATH', 'run_report.json')
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2, default=str)
+            logger.info(f"📊 Run report written to {path}")
+        except Exception as e:
+            logger.error(f"Failed to write run report: {e}")
+        return path
@@ -3,7 +3,7 @@
 Show all available matches for testing
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def show_all_matches():
     """Show all available matches with their status"""
@@ -46,6 +46,15 @@ def show_all_matches():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    import argparse
+    from profiling import add_profile_arguments, profile_mode, trace_webdriver_enabled, run_profiled
+    
+    parser = argparse.ArgumentParser(description="Show all available matches")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    
+    setup_logging()
     print("📋 Available Matches Overview")
     print("=" * 80)
-    show_all_matches()
\ No newline at end of file
+    run_profiled("show_available_matches", show_all_matches,
+                 mode=profile_mode(args), trace_webdriver=trace_webdriver_enabled(args))
\ No newline at end of file
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Wait timeouts tuned from the latency each step has shown before
+
+Every timed step (a page rendering, an element appearing) records how long
+it took. Its next timeout is a high percentile of the recent history plus a
+margin, kept between the step's floor and ceiling, so quiet days run fast
+and slow days still get the time they need. Until a step has enough history
+the original fixed wait is used. The history lives in match_state.json.
+"""
+
+import os
+import time
+import threading
+from typing import Callable, Dict, List, Tuple
+
+# step -> (fixed wait used until there is history, floor, ceiling) in seconds
+STEPS = {
+    'club_page': (5, 1.5, 15),
+    'club_next_page': (2, 0.5, 6),
+    'club_scroll': (1, 0.5, 3),
+    'login_page': (3, 1.0, 10),
+    'login_field': (5, 1.0, 15),
+    'login_submit': (4, 1.0, 12),
+    'match_page': (3, 1.0, 10),
+    'register_button': (10, 2.0, 30),
+    'registration_form': (3, 1.0, 10),
+    'submit_button': (10, 2.0, 30),
+    'registration_result': (3, 1.0, 10),
+}
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+def wait_until_stable(read: Callable[[], str], timeout: float, minimum: float,
+                      poll: float = 0.25) -> Tuple[float, bool]:
+    """Poll read() until it returns the same value twice after at least `minimum` seconds
+
+    Returns (seconds waited, whether it settled before the timeout).
+    """
+    start = time.monotonic()
+    minimum = min(minimum, timeout)
+    previous = read()
+    while True:
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            return elapsed, False
+        time.sleep(min(poll, timeout - elapsed))
+        current = read()
+        if current == previous and time.monotonic() - start >= minimum:
+            return time.monotonic() - start, True
+        previous = current
+
+class StepTimeouts:
+    def __init__(self, history: Dict[str, List[float]]):
+        self.history = history  # step -> recent seconds, shared with the match state
+        self.percentile = float(os.getenv('STEP_TIMEOUT_PERCENTILE', 95))
+        self.margin = float(os.getenv('STEP_TIMEOUT_MARGIN', 0.5))
+        self.min_samples = int(os.getenv('STEP_TIMEOUT_MIN_SAMPLES', 5))
+        self.window = int(os.getenv('STEP_HISTORY_SIZE', 50))
+        self._lock = threading.Lock()
+        self.observed: Dict[str, List[float]] = {}  # this run only, for the report
+
+    def floor(self, step: str) -> float:
+        return STEPS[step][1]
+
+    def timeout(self, step: str) -> float:
+        """Timeout for a step: high percentile of its history plus margin, or its fixed wait without enough history"""
+        default, floor, ceiling = STEPS[step]
+        with self._lock:
+            samples = list(self.history.get(step, []))
+        if len(samples) < self.min_samples:
+            return default
+        return round(min(ceiling, max(floor, percentile(samples, self.percentile) * (1 + self.margin))), 2)
+
+    def observe(self, step: str, seconds: float) -> None:
+        """Record how long a step took (or the timeout it ran into)"""
+        with self._lock:
+            samples = self.history.setdefault(step, [])
+            samples.append(round(seconds, 3))
+            del samples[:-self.window]
+            self.observed.setdefault(step, []).append(round(seconds, 3))
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-step timeouts, history and this run's observations for the run report"""
+        summary = {}
+        for step in sorted((set(self.history) | set(self.observed)) & set(STEPS)):
+            samples = self.history.get(step, [])
+            summary[step] = {
+                'timeout': self.timeout(step),
+                f'p{self.percentile:g}': percentile(samples, self.percentile) if samples else None,
+                'samples': len(samples),
+                'this_run': self.observed.get(step, []),
+            }
+        return summary
@@ -3,7 +3,7 @@
 Test actual registration process with the July 21 match
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_july_21_registration():
     """Test registration for the July 21 Run & Gun match"""
@@ -72,6 +72,7 @@ def test_july_21_registration():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing Actual Registration Process")
     print("=" * 60)
     print("⚠️  This will attempt REAL registration if you confirm!")
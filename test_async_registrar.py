@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the asyncio registrar against the local stand-in (no Chrome needed)
+"""
+
+import time
+import asyncio
+import tempfile
+from practiscore_standin import StandinServer
+from testing_support import CookieDriver, HttpDriver, browser_login, standin_env
+
+LATENCY = 0.3
+
+def _environment(server, directory, **values):
+    values.setdefault('REGISTRATION_MAX_PER_RUN', '0')
+    return standin_env(server, directory, COOKIE_CACHE='off', **values)
+
+def test_concurrent_probes():
+    from async_registrar import AsyncPractiscoreRegistrar, aiohttp_available
+
+    with StandinServer(latency=LATENCY) as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory):
+            from match_registrar import PractiscoreRegistrar, paid_title_indicator
+
+            registrar = PractiscoreRegistrar()
+            registrar._copy_cookies_to_session(CookieDriver(browser_login(server)[1]))
+            matches = [{'title': m['title'], 'url': f"/{m['slug']}/register"} for m in server.matches]
+            # A closed match page reads as unknown, like it does in the browser
+            expected = ["paid_match" if paid_title_indicator(m['title']) else
+                        {'closed': 'unknown'}.get(server.match_status(m), server.match_status(m))
+                        for m in server.matches]
+            loaded = sum(status != "paid_match" for status in expected)
+
+            for use_aiohttp in ([True, False] if aiohttp_available() else [False]):
+                print(f"{'1️⃣' if use_aiohttp else '2️⃣'} Probes over {'aiohttp' if use_aiohttp else 'requests in threads'}")
+
+                async def probe_all():
+                    async with AsyncPractiscoreRegistrar(registrar, use_aiohttp=use_aiohttp) as front:
+                        return await asyncio.gather(*(front.probe(match) for match in matches))
+
+                start = time.monotonic()
+                statuses = asyncio.run(probe_all())
+                elapsed = time.monotonic() - start
+                print(f"   {loaded} pages in {elapsed:.2f}s: {statuses}")
+                assert statuses == expected
+                # Serially this would take LATENCY per page
+                assert elapsed < LATENCY * loaded / 2
+            print("✅ Concurrent probes working")
+
+def test_async_run_check():
+    from async_registrar import AsyncPractiscoreRegistrar
+
+    with StandinServer(latency=0.05) as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory, REGISTRATION_MAX_PER_RUN='3'):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            print("3️⃣ A full run_check from asyncio")
+            registrar = PractiscoreRegistrar()
+            registrar._launch_driver = HttpDriver
+            registrar._settle = lambda *args: None
+            registrar._notifier = NullNotifier()
+            # Logged in through the "browser" - already registered for the first open match
+            browser, cookies = browser_login(server)
+            registrar.login = lambda driver: registrar._copy_cookies_to_session(CookieDriver(cookies)) or True
+            first = next(m for m in server.matches if m['status'] == 'open')
+            server.registrations[first['slug']] = [{'session': cookies[0]['value']}]
+            registered = []
+            registrar.register_for_match = lambda url, **kwargs: registered.append(url) or True
+
+            statuses = asyncio.run(AsyncPractiscoreRegistrar(registrar, use_aiohttp=False).run_check())
+            print(f"   {statuses}")
+            assert registrar.report.sections['results'] == statuses
+            assert set(statuses.values()) >= {'open', 'not_open', 'full', 'paid_match', 'already_registered'}
+            assert statuses[first['title']] == 'already_registered'
+            assert registered and f"/{first['slug']}/register" not in registered
+            assert registrar.state.get(f"/{server.matches[0]['slug']}/register").get('status')
+            print("✅ Async run_check working")
+
+if __name__ == "__main__":
+    print("🧪 Testing the asyncio registrar")
+    print("=" * 50)
+    test_concurrent_probes()
+    test_async_run_check()
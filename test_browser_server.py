@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test browser server discovery (no Chrome needed)
+"""
+
+import os
+import json
+import tempfile
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+import browser_server
+
+class FakeDevTools(BaseHTTPRequestHandler):
+    """Answers /json/version like Chrome's remote debugging endpoint"""
+
+    def do_GET(self):
+        payload = json.dumps({'Browser': 'HeadlessChrome/138.0'}).encode()
+        self.send_response(200 if self.path == '/json/version' else 404)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_server_discovery():
+    with tempfile.TemporaryDirectory() as directory:
+        original_state = browser_server.STATE_FILE
+        browser_server.STATE_FILE = os.path.join(directory, 'state.json')
+        devtools = HTTPServer(('127.0.0.1', 0), FakeDevTools)
+        threading.Thread(target=devtools.serve_forever, daemon=True).start()
+        try:
+            print("1️⃣ No state file - not running")
+            assert browser_server.server_address() is None
+
+            print("2️⃣ Live pid and DevTools endpoint - attach")
+            port = devtools.server_address[1]
+            with open(browser_server.STATE_FILE, 'w') as f:
+                json.dump({'pid': os.getpid(), 'port': port, 'started_at': 0, 'profile': directory}, f)
+            assert browser_server.server_address() == f"127.0.0.1:{port}"
+            assert browser_server.server_status()['browser'] == 'HeadlessChrome/138.0'
+
+            print("3️⃣ BROWSER_SERVER=off - never attach")
+            os.environ['BROWSER_SERVER'] = 'off'
+            try:
+                assert browser_server.server_address() is None
+            finally:
+                del os.environ['BROWSER_SERVER']
+
+            print("4️⃣ Stale pid - not running")
+            with open(browser_server.STATE_FILE, 'w') as f:
+                json.dump({'pid': 2 ** 22 + 12345, 'port': port, 'started_at': 0, 'profile': directory}, f)
+            assert browser_server.server_address() is None
+            print("✅ Browser server discovery working")
+        finally:
+            devtools.shutdown()
+            browser_server.STATE_FILE = original_state
+
+class AttachedDriver:
+    """Stands in for webdriver.Chrome attached to the browser server's tabs"""
+
+    tabs = ['server tab']
+
+    def __init__(self, options=None):
+        self.switch_to = self
+        self.service = self
+        self.handle = 'server tab'
+
+    def new_window(self, kind):
+        self.handle = f"tab {len(self.tabs)}"
+        self.tabs.append(self.handle)
+
+    def close(self):
+        self.tabs.remove(self.handle)
+
+    def stop(self):
+        pass
+
+def test_attached_drivers_get_their_own_tabs():
+    import selenium.webdriver
+    import match_registrar
+
+    print("5️⃣ Drivers attached at the same time navigate separate tabs")
+    saved = (selenium.webdriver.Chrome, match_registrar.server_address, dict(os.environ))
+    selenium.webdriver.Chrome = AttachedDriver
+    match_registrar.server_address = lambda: '127.0.0.1:9222'
+    try:
+        os.environ.update({'PRACTISCORE_USERNAME': 'shooter@example.com', 'PRACTISCORE_PASSWORD': 'secret',
+                           'COOKIE_CACHE': 'off'})
+        registrar = match_registrar.PractiscoreRegistrar()
+        login, club_page = registrar._launch_driver(), registrar._launch_driver()
+        assert login.handle != club_page.handle and len(AttachedDriver.tabs) == 3
+        registrar._quit_driver(login)
+        registrar._quit_driver(club_page)
+        assert AttachedDriver.tabs == ['server tab']
+        print("✅ Attached drivers use their own tabs")
+    finally:
+        selenium.webdriver.Chrome, match_registrar.server_address, environment = saved
+        os.environ.clear()
+        os.environ.update(environment)
+
+if __name__ == "__main__":
+    print("🧪 Testing browser server discovery")
+    print("=" * 50)
+    test_server_discovery()
+    test_attached_drivers_get_their_own_tabs()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the browser memory watchdog with a fake driver (no Chrome needed)
+"""
+
+import os
+from browser_watchdog import ManagedDriver, tree_memory
+from run_report import RunReport
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        self.driver.handles.append(f"tab-{len(self.driver.handles)}")
+        self.driver.current_window_handle = self.driver.handles[-1]
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+class FakeDriver:
+    """Just enough of a WebDriver for ManagedDriver"""
+
+    def __init__(self):
+        self.handles = ['tab-0']
+        self.current_window_handle = 'tab-0'
+        self.current_url = 'data:,'
+        self.cookies = []
+        self.visited = []
+        self.switch_to = FakeSwitchTo(self)
+        self.title = 'PractiScore'
+
+    def get(self, url):
+        self.current_url = url
+        self.visited.append(url)
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies]
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+def _managed(**limits):
+    started, stopped = [], []
+
+    def start():
+        started.append(FakeDriver())
+        return started[-1]
+
+    managed = ManagedDriver(start, stopped.append, 'https://practiscore.com', RunReport())
+    for name, value in limits.items():
+        setattr(managed, name, value)
+    return managed, started, stopped
+
+def test_tree_memory_reads_proc():
+    if not os.path.isdir('/proc'):
+        print("⏭️  No /proc - skipping")
+        return
+    memory = tree_memory(os.getpid())
+    print(f"This process: {memory['total_mb']:.1f} MB over {memory['processes']} process(es)")
+    assert memory['processes'] >= 1 and memory['total_mb'] > 0
+
+def test_tab_recycled_after_navigation_limit():
+    managed, started, stopped = _managed(sample_every=1, max_tab_navigations=3)
+    for i in range(3):
+        managed.get(f"https://practiscore.com/match-{i}/register")
+    assert managed.stats['tab_recycles'] == 1 and managed.stats['restarts'] == 0
+    assert managed.handles == ['tab-1'] and managed.current_url.endswith('match-2/register')
+    assert managed.title == 'PractiScore'  # proxied to the real driver
+
+def test_restart_restores_cookies():
+    managed, started, stopped = _managed(sample_every=1, max_navigations=2)
+    managed.driver.cookies = [{'name': 'ps_session', 'value': 'abc', 'sameSite': 'Lax'}]
+    managed.get("https://practiscore.com/dashboard/home")
+    managed.get("https://practiscore.com/match-1/register")
+    assert managed.stats['restarts'] == 1 and len(started) == 2 and stopped == [started[0]]
+    assert managed.driver is started[1]
+    assert managed.driver.cookies == [{'name': 'ps_session', 'value': 'abc'}]
+    assert managed.driver.visited == ['https://practiscore.com', 'https://practiscore.com/match-1/register']
+    assert managed.report.sections['browser_watchdog']['restarts'] == 1
+    managed.close()
+    assert stopped == started
+    print(f"✅ Watchdog stats: {managed.stats}")
+
+def test_attached_driver_ignores_server_memory():
+    """The browser server's RSS covers every tab; closing ours would free nothing"""
+    import browser_server
+    status = browser_server.server_status
+    browser_server.server_status = lambda: {'pid': os.getpid(), 'port': 9222}
+    try:
+        managed, started, stopped = _managed(sample_every=1, max_total_mb=0.001, max_renderer_mb=0.001)
+        managed.driver._matchreg_attached = True
+        for i in range(3):
+            managed.get(f"https://practiscore.com/match-{i}/register")
+    finally:
+        browser_server.server_status = status
+    assert managed.stats['restarts'] == 0 and managed.stats['tab_recycles'] == 0
+    assert managed.stats['samples'] == 3 and len(started) == 1
+
+if __name__ == "__main__":
+    print("🧪 Testing browser watchdog")
+    print("=" * 50)
+    test_tree_memory_reads_proc()
+    test_tab_recycled_after_navigation_limit()
+    test_restart_restores_cookies()
+    test_attached_driver_ignores_server_memory()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the streaming, paginated club page loader against the local stand-in (no Chrome needed)
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from practiscore_standin import StandinServer, CLUB_PATH, match_slug
+from testing_support import HttpDriver, standin_env
+
+def dated_matches(days):
+    today = datetime.now()
+    matches = []
+    for offset in days:
+        title = f"NSPS Run & Gun {(today + timedelta(days=offset)).strftime('%m/%d/%y')}"
+        matches.append({'title': title, 'slug': match_slug(title), 'status': 'open'})
+    return matches
+
+def _environment(server, directory):
+    return standin_env(server, directory, COOKIE_CACHE='off', MATCH_HORIZON_DAYS='30')
+
+def _registrar():
+    from match_registrar import PractiscoreRegistrar
+    registrar = PractiscoreRegistrar()
+    registrar._launch_driver = HttpDriver
+    registrar._settle = lambda *args: None
+    return registrar
+
+def _club_loads(server):
+    return server.request_counts.get(f"GET {CLUB_PATH}", 0)
+
+def test_next_page_url():
+    from match_registrar import next_page_url
+    html = '<nav><a class="page-link" rel="next" href="?page=2">Next</a></nav>'
+    assert next_page_url(html, 'https://example.com/clubs/x') == 'https://example.com/clubs/x?page=2'
+    assert next_page_url('<a href="/other">Other</a>', 'https://example.com/') is None
+
+def test_stops_at_horizon():
+    # Ascending by date, 3 per page: pages 3 and 4 are past the 30-day horizon
+    matches = dated_matches([-3, 2, 5, 9, 16, 23, 40, 47, 54, 61, 68, 75])
+    with StandinServer(matches=matches, page_size=3) as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory):
+            registrar = _registrar()
+
+            print("1️⃣ Records stream out before the next page is loaded")
+            loader = registrar.iter_available_matches()
+            first = next(loader)
+            assert first['url'] == f"/{matches[0]['slug']}/register" and _club_loads(server) == 1
+
+            print("2️⃣ Loading stops at the first page past the horizon")
+            found = [first] + list(loader)
+            print(f"   {len(found)} matches from {_club_loads(server)} of 4 pages")
+            assert len(found) == 9 and _club_loads(server) == 3
+            assert registrar.report.counters['club_pages'] == 3
+            print("✅ Horizon stop working")
+
+def test_stops_at_past_matches():
+    # Newest first: once a page is all past matches the rest are older still
+    matches = dated_matches([20, 12, 6, 1, -5, -12, -19, -26, -33, -40, -47, -54])
+    with StandinServer(matches=matches, page_size=3) as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory):
+            registrar = _registrar()
+            found = registrar.get_available_matches()
+            print(f"3️⃣ {len(found)} matches from {_club_loads(server)} of 4 pages")
+            assert len(found) == 9 and _club_loads(server) == 3
+            print("✅ Past-match stop working")
+
+if __name__ == "__main__":
+    print("🧪 Testing the club page loader")
+    print("=" * 50)
+    test_next_page_url()
+    test_stops_at_horizon()
+    test_stops_at_past_matches()
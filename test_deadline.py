@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the run deadline (no Chrome needed)
+"""
+
+import os
+import json
+import time
+import tempfile
+from deadline import Deadline, DeadlineExceeded
+from practiscore_standin import StandinServer
+from testing_support import HttpDriver, standin_env
+
+def test_deadline_budget():
+    print("1️⃣ No limit - nothing is clamped or raised")
+    unlimited = Deadline()
+    assert unlimited.clamp(10) == 10 and not unlimited.expired()
+    unlimited.check()
+
+    print("2️⃣ Waits are cut down to the time left")
+    deadline = Deadline(0.3)
+    assert deadline.clamp(10) <= 0.3
+    start = time.monotonic()
+    try:
+        with deadline.phase_of('probe'):
+            try:
+                deadline.sleep(5)
+            except Exception:
+                raise AssertionError("DeadlineExceeded must get through `except Exception`")
+        raise AssertionError("sleeping past the deadline should raise")
+    except DeadlineExceeded as e:
+        assert e.phase == 'probe'
+    assert time.monotonic() - start < 1
+    assert deadline.phase == 'startup' and deadline.clamp(10) == 0
+    print("✅ Deadline budget working")
+
+def test_run_stops_at_deadline():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        report_path = os.path.join(directory, 'run_report.json')
+        with standin_env(server, directory, COOKIE_CACHE='off', RUN_DEADLINE_SECONDS='1'):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            print("3️⃣ A run whose page settles outlast the deadline stops and still reports")
+            registrar = PractiscoreRegistrar()
+            registrar._launch_driver = HttpDriver
+            registrar._notifier = NullNotifier()
+            start = time.monotonic()
+            registrar.run_check()
+            elapsed = time.monotonic() - start
+            with open(report_path) as f:
+                report = json.load(f)['sections']['deadline']
+            print(f"   stopped after {elapsed:.1f}s: {report}")
+            assert elapsed < 3
+            assert report['limit_seconds'] == 1 and report['exceeded_in'] == 'club_page'
+            print("✅ Run deadline working")
+
+def test_deadline_in_login_is_not_swallowed():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, COOKIE_CACHE='off'):
+            from match_registrar import PractiscoreRegistrar
+
+            print("4️⃣ A deadline reached while looking for the login form stops the login")
+            registrar = PractiscoreRegistrar()
+            registrar._settle = lambda *args: None
+            waits = []
+
+            def wait_for(driver, step, condition, learn_timeouts=True):
+                waits.append(step)
+                raise DeadlineExceeded('login')
+            registrar._wait_for = wait_for
+            try:
+                registrar._login(HttpDriver())
+                raise AssertionError("the deadline should get through the selector loop")
+            except DeadlineExceeded as e:
+                assert e.phase == 'login' and waits == ['login_field']
+            print("✅ Login stops at the deadline")
+
+if __name__ == "__main__":
+    print("🧪 Testing the run deadline")
+    print("=" * 50)
+    test_deadline_budget()
+    test_run_stops_at_deadline()
+    test_deadline_in_login_is_not_swallowed()
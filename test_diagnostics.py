@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test background failure diagnostics (no Chrome needed)
+"""
+
+import os
+import re
+import time
+import tarfile
+from html import escape
+import tempfile
+from diagnostics import DiagnosticsRecorder
+from practiscore_standin import StandinServer
+from testing_support import HttpDriver, standin_env
+
+class PageDriver:
+    """A driver with a page, a screenshot and logs"""
+
+    current_url = 'https://practiscore.com/nsps/register'
+    page_source = '<html><body>Something went wrong</body></html>'
+
+    def get_screenshot_as_png(self):
+        return b'\x89PNG fake'
+
+    def get_log(self, log_type):
+        return [{'level': 'SEVERE', 'message': f'{log_type} entry'}]
+
+def test_capture_is_written_in_background():
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = DiagnosticsRecorder(directory, keep=2)
+        slow_write = recorder._write
+
+        def write(bundle):
+            time.sleep(0.3)
+            return slow_write(bundle)
+        recorder._write = write
+
+        print("1️⃣ Capturing doesn't wait for compression or disk")
+        start = time.perf_counter()
+        for attempt in range(4):
+            recorder.capture('registration unclear', PageDriver(), {'attempt': attempt})
+        assert time.perf_counter() - start < 0.1
+
+        print("2️⃣ Bundles hold the screenshot, DOM and logs; only the newest are kept")
+        start = time.perf_counter()
+        assert not recorder.flush(timeout=0.1)
+        assert time.perf_counter() - start < 0.3
+        assert recorder.flush(timeout=5)
+        bundles = sorted(os.listdir(directory))
+        assert len(bundles) == 2 and recorder.stats['written'] == 4
+        with tarfile.open(os.path.join(directory, bundles[-1])) as archive:
+            names = sorted(name.split('/')[-1] for name in archive.getnames())
+        assert names == ['console.json', 'meta.json', 'page.html', 'screenshot.png']
+        print("✅ Background diagnostics working")
+
+class FilledFormDriver(PageDriver):
+    page_source = ('<form><input type="hidden" name="_token" value="abc123">'
+                   '<input name="email" value="pat@example.com"><textarea>USPSA A12345</textarea></form>'
+                   '<p>Welcome back, Pat Shooter</p>')
+
+class Response:
+    url = 'https://practiscore.com/nsps/register/form'
+    status_code = 200
+    text = '<p>Thanks Pat Shooter</p><p>Patch notes for pat@example.com.</p>'
+    headers = {'Content-Type': 'text/html', 'Set-Cookie': 'session=s3cret', 'Authorization': 'Bearer t0ken'}
+
+def test_bundles_are_scrubbed():
+    with tempfile.TemporaryDirectory() as directory:
+        print("3️⃣ No cookies, form values or personal details are written")
+        recorder = DiagnosticsRecorder(directory, redact=['Pat', 'Shooter', 'pat@example.com', ''])
+        recorder.capture('registration unclear', FilledFormDriver())
+        recorder.capture('direct submission unclear', response=Response())
+        assert recorder.flush(timeout=5)
+        written = b''
+        for bundle in os.listdir(directory):
+            with tarfile.open(os.path.join(directory, bundle)) as archive:
+                for member in archive.getmembers():
+                    written += archive.extractfile(member).read()
+        for secret in (b's3cret', b't0ken', b'abc123', b'pat@example.com', b'A12345', b'Shooter'):
+            assert secret not in written, secret
+        assert not re.search(rb'\bPat\b', written)
+        # Names are masked as whole words only
+        assert b'Content-Type' in written and b'Welcome back' in written and b'Patch notes' in written
+        print("✅ Diagnostics scrubbed")
+
+def test_failed_registration_is_captured():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, COOKIE_CACHE='off', DIRECT_SUBMIT='false',
+                         DIAGNOSTICS_DIR=os.path.join(directory, 'diagnostics')):
+            from match_registrar import PractiscoreRegistrar
+
+            print("4️⃣ A registration that fails in the browser leaves a bundle")
+            registrar = PractiscoreRegistrar()
+            registrar._launch_driver = HttpDriver  # no clickable elements - the registration fails
+            registrar._settle = lambda *args: None
+            registrar.login = lambda driver: True
+            match = next(m for m in server.matches if m['status'] == 'open')
+            assert registrar.register_for_match(f"/{match['slug']}/register") is False
+            assert registrar.diagnostics.flush(timeout=5)
+            bundles = os.listdir(os.environ['DIAGNOSTICS_DIR'])
+            assert len(bundles) == 1 and 'registration-error' in bundles[0]
+            with tarfile.open(os.path.join(os.environ['DIAGNOSTICS_DIR'], bundles[0])) as archive:
+                page = archive.extractfile(next(n for n in archive.getnames() if n.endswith('page.html'))).read()
+            assert escape(match['title']).encode() in page
+            print("✅ Failed registration captured")
+
+if __name__ == "__main__":
+    print("🧪 Testing failure diagnostics")
+    print("=" * 50)
+    test_capture_is_written_in_background()
+    test_bundles_are_scrubbed()
+    test_failed_registration_is_captured()
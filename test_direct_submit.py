@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test direct HTTP registration against the local stand-in (no Chrome needed)
+"""
+
+import tempfile
+from match_registrar import PractiscoreRegistrar, parse_match_elements, paid_title_indicator
+from practiscore_standin import StandinServer
+from testing_support import CookieDriver, RecordingNotifier, browser_login, standin_env
+
+def test_direct_submission():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory):
+            registrar = PractiscoreRegistrar()
+            first, second = [m for m in server.matches if m['status'] == 'open' and 'Run & Gun' in m['title']]
+            first_url, second_url = f"/{first['slug']}/register", f"/{second['slug']}/register"
+
+            print("1️⃣ No learned schema - use the browser")
+            assert registrar._register_direct(second_url, {}) is None
+
+            print("2️⃣ Learn the Run & Gun form from the page the browser saw")
+            browser, cookies = browser_login(server)
+            form = browser.get(f"{server.url}{first_url}/form")
+            registrar._learn_form_schema(first_url, form.text, form.url)
+            schema = registrar.state.form_schema('run_gun')
+            assert schema['action'] == '{match}/form' and schema['csrf_field'] == '_token'
+            # The required waiver and the checked division are kept, the optional newsletter isn't
+            assert schema['checkboxes'] == {'waiver': 'accepted'}
+            assert schema['radios'] == {'division': ['carry_optics', 'limited']}
+
+            print("3️⃣ Not logged in over HTTP yet - use the browser")
+            assert registrar._register_direct(second_url, {}) is None
+
+            print("4️⃣ Logged in - one GET for the token and one POST")
+            registrar._copy_cookies_to_session(CookieDriver(cookies))
+            server.request_counts.clear()
+            details = {'first_name': 'Pat', 'last_name': 'Shooter', 'email': 'pat@example.com', 'power_factor': 'major'}
+            assert registrar._register_direct(second_url, details) is True
+            registrant = server.registrations[second['slug']][0]
+            assert (registrant['first_name'], registrant['power_factor']) == ('Pat', 'major')
+            assert registrant['division'] == 'carry_optics'
+            assert sorted(server.request_counts) == [f"GET {second_url}/form", f"POST {second_url}/form"]
+            assert registrar.report.counters['direct_submits'] == 1
+
+            print("5️⃣ An unclear response (a required field left out) - use the browser")
+            post = registrar.session.post
+            registrar.session.post = lambda url, data, **kwargs: post(url, data=dict(data, waiver=''), **kwargs)
+            try:
+                assert registrar._register_direct(first_url, details) is None
+            finally:
+                del registrar.session.post
+            assert not server.registrations.get(first['slug'])
+
+            print("6️⃣ Form changed - forget the schema and use the browser")
+            schema['fields'] = ['first_name', 'last_name', 'email', 'uspsa_number']
+            assert registrar._register_direct(second_url, details) is None
+            assert registrar.state.form_schema('run_gun') is None
+            print("✅ Direct submission working")
+
+def test_form_not_tied_to_match_is_not_learned():
+    """A form posting to an id instead of the match path would register every match for this one"""
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory):
+            registrar = PractiscoreRegistrar()
+            first, second = [m for m in server.matches if m['status'] == 'open' and 'Run & Gun' in m['title']]
+            first_url, second_url = f"/{first['slug']}/register", f"/{second['slug']}/register"
+            browser, cookies = browser_login(server)
+            form = browser.get(f"{server.url}{first_url}/form").text
+            form = form.replace(f'action="/{first["slug"]}/register/form"', 'action="/events/4711/signup"')
+            assert 'action="/events/4711/signup"' in form
+
+            registrar._learn_form_schema(first_url, form, f"{server.url}{first_url}/form")
+            assert registrar.state.form_schema('run_gun') is None
+
+            # A template stored before the check is dropped rather than used
+            registrar.state.set_form_schema('run_gun', {'form_url': f"{first_url}/form", 'action': '/events/4711/signup',
+                                                        'hidden': ['_token'], 'fields': [], 'selects': {}})
+            registrar._copy_cookies_to_session(CookieDriver(cookies))
+            server.request_counts.clear()
+            assert registrar._register_direct(second_url, {}) is None
+            assert registrar.state.form_schema('run_gun') is None and not server.request_counts
+            print("✅ Forms not addressed by the match URL are never replayed")
+
+def test_run_registers_several_matches():
+    """A run submits every selected open match over HTTP and records them in the state"""
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, REGISTRATION_MAX_PER_RUN='3'):
+            registrar = PractiscoreRegistrar()
+            browser, cookies = browser_login(server)
+            for slug in ('nsps-run-gun', 'nsps-steel-challenge'):
+                match = next(m for m in server.matches if m['slug'].startswith(slug) and m['status'] == 'open')
+                form = browser.get(f"{server.url}/{match['slug']}/register/form")
+                registrar._learn_form_schema(f"/{match['slug']}/register", form.text, form.url)
+            registrar._copy_cookies_to_session(CookieDriver(cookies))
+
+            # Club page and probes over HTTP instead of the browser
+            registrar._open_probe_driver = lambda: (None, False)
+            registrar.iter_available_matches = lambda fresh_browser=False: parse_match_elements(
+                browser.get(registrar.club_url).text, registrar.target_match)
+
+            def probe(match_url, match_title="", driver=None):
+                if paid_title_indicator(match_title):
+                    return "paid_match"
+                return server.match_status(server.find_match(match_url.strip('/').split('/')[0]))
+            registrar.check_registration_status = probe
+            registrar._notifier = RecordingNotifier()
+
+            registrar._run_check()
+            registered = sorted(title for kind, title in registrar._notifier.sent if kind == 'registered')
+            print(f"Registered: {registered}")
+            assert len(registered) == 2 and len(server.registrations) == 2
+            assert all(registrar.state.is_registered(f"/{slug}/register") for slug in server.registrations)
+
+            print("Second run - state dedup, nothing submitted again")
+            registrar._notifier = RecordingNotifier()
+            registrar._run_check()
+            assert not [kind for kind, _ in registrar._notifier.sent if kind == 'registered']
+            assert all(len(registrants) == 1 for registrants in server.registrations.values())
+            print("✅ Multiple registrations per run working")
+
+def test_outcomes_are_recorded_as_they_finish():
+    """A registration is announced while probing continues, browser registrations included"""
+    import threading
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, REGISTRATION_MAX_PER_RUN='3'):
+            registrar = PractiscoreRegistrar()
+            browser, cookies = browser_login(server)
+            run_gun = next(m for m in server.matches if m['slug'].startswith('nsps-run-gun') and m['status'] == 'open')
+            form = browser.get(f"{server.url}/{run_gun['slug']}/register/form")
+            registrar._learn_form_schema(f"/{run_gun['slug']}/register", form.text, form.url)
+            registrar._copy_cookies_to_session(CookieDriver(cookies))
+            registrar._open_probe_driver = lambda: (None, False)
+            registrar.iter_available_matches = lambda fresh_browser=False: parse_match_elements(
+                browser.get(registrar.club_url).text, registrar.target_match)
+
+            announced = threading.Event()
+            registrar._notifier = RecordingNotifier()
+            registrar._notifier.notify_registration_success = lambda title, url: announced.set()
+            seen = []
+
+            def probe(match_url, match_title="", driver=None):
+                if seen:
+                    # The first match (Run & Gun, highest priority) is announced before probing ends
+                    seen.append(announced.wait(5))
+                else:
+                    seen.append(True)
+                if paid_title_indicator(match_title):
+                    return "paid_match"
+                return server.match_status(server.find_match(match_url.strip('/').split('/')[0]))
+            registrar.check_registration_status = probe
+
+            # No form learned for Steel Challenge - its browser registration runs in the background too
+            browser_threads = []
+            def register_in_browser(match_url, try_direct=True, fresh_browser=False):
+                browser_threads.append(threading.current_thread())
+                return True
+            registrar.register_for_match = register_in_browser
+
+            registrar._run_check()
+            print(f"Probes saw the first registration announced: {seen}")
+            assert all(seen) and len(seen) >= 3
+            assert browser_threads and threading.main_thread() not in browser_threads
+            assert registrar.state.is_registered(f"/{run_gun['slug']}/register")
+
+if __name__ == "__main__":
+    print("🧪 Testing direct registration submission")
+    print("=" * 50)
+    test_direct_submission()
+    test_form_not_tied_to_match_is_not_learned()
+    test_run_registers_several_matches()
+    test_outcomes_are_recorded_as_they_finish()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test driver timeouts and process cleanup with stand-in processes (no Chrome needed)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+from unittest import mock
+from driver_supervisor import DriverSupervisor, OWNER_SWITCH, _alive
+
+SLEEPER = [sys.executable, '-c', 'import time; time.sleep(60)']
+
+class HungDriver:
+    """A driver whose quit() never returns, backed by a real process"""
+
+    def __init__(self, process):
+        self.service = type('Service', (), {'process': process})()
+        self.timeouts = {}
+
+    def set_page_load_timeout(self, seconds):
+        self.timeouts['page_load'] = seconds
+
+    def set_script_timeout(self, seconds):
+        self.timeouts['script'] = seconds
+
+PID_DIRECTORY = tempfile.mkdtemp()
+
+def _supervisor(**values):
+    """A supervisor keeping its pid records in a scratch directory"""
+    with mock.patch.dict(os.environ, DRIVER_PID_PATH=os.path.join(PID_DIRECTORY, 'drivers.json'), **values):
+        return DriverSupervisor()
+
+def test_hung_quit_is_killed():
+    supervisor = _supervisor(DRIVER_QUIT_TIMEOUT_SECONDS='0.5')
+    process = subprocess.Popen(SLEEPER)
+    try:
+        print("1️⃣ Tracking sets the session timeouts and records the tree")
+        driver = HungDriver(process)
+        supervisor.track(driver, process.pid)
+        assert driver.timeouts == {'page_load': 45.0, 'script': 30.0}
+        assert driver._matchreg_tree == [process.pid]
+        assert supervisor._load_records() == {process.pid: os.getpid()}
+
+        print("2️⃣ A quit that hangs is abandoned and the tree killed")
+        start = time.monotonic()
+        supervisor.stop(driver, lambda d: time.sleep(30))
+        process.wait(timeout=5)
+        assert time.monotonic() - start < 5
+        assert supervisor.stats['hung_quits'] == 1 and supervisor.stats['processes_killed'] == 1
+        assert supervisor._load_records() == {}
+        print("✅ Hung drivers cleaned up")
+    finally:
+        process.kill()
+
+def test_orphans_from_earlier_run_are_reaped():
+    # A pid that has certainly exited plays the run that crashed
+    dead_owner = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead_owner.wait()
+    orphan = subprocess.Popen(SLEEPER + [f'{OWNER_SWITCH}{dead_owner.pid}'])
+    ours = subprocess.Popen(SLEEPER + [f'{OWNER_SWITCH}{os.getpid()}'])
+    # Chromedrivers without Chrome: one the crashed run recorded, one someone else started
+    recorded = subprocess.Popen(SLEEPER + ['chromedriver'])
+    foreign = subprocess.Popen(SLEEPER + ['chromedriver'])
+    try:
+        print("3️⃣ Browsers and recorded drivers of an exited run are reaped once, others are left alone")
+        supervisor = _supervisor()
+        supervisor._update_records(lambda records: records.update({recorded.pid: dead_owner.pid}))
+        assert supervisor.reap_orphans() == 2
+        orphan.wait(timeout=5)
+        recorded.wait(timeout=5)
+        assert _alive(ours.pid) and _alive(foreign.pid)
+        assert supervisor.stats['orphans_reaped'] == 2
+        assert supervisor._load_records() == {}
+        assert supervisor.reap_orphans() == 0
+        print("✅ Orphans reaped")
+    finally:
+        for process in (orphan, ours, recorded, foreign):
+            process.kill()
+            process.wait()
+
+if __name__ == "__main__":
+    print("🧪 Testing the driver supervisor")
+    print("=" * 50)
+    test_hung_quit_is_killed()
+    test_orphans_from_earlier_run_are_reaped()
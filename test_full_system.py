@@ -3,7 +3,7 @@
 Test the full system with paid/free match handling
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_full_system():
     """Test the complete system with current matches"""
@@ -26,4 +26,5 @@ def test_full_system():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     test_full_system()
\ No newline at end of file
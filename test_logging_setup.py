@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test the queued, rotating logging pipeline
+"""
+
+import os
+import sys
+import json
+import gzip
+import glob
+import subprocess
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LOGGING_SCRIPT = """
+import logging
+from logging_setup import setup_logging, shutdown_logging
+setup_logging(console=False)
+logger = logging.getLogger("test")
+for i in range(2000):
+    logger.info("record %d %s", i, "x" * 80, extra={'match': 'NSPS Run & Gun'})
+logger.debug("debug %d", 1)
+shutdown_logging()
+"""
+
+def test_rotation_and_json():
+    """Rotated files are gzip-compressed, bounded in number and hold JSON lines"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, PYTHONPATH=REPO_DIR, MATCHREG_LOG_FORMAT='json',
+                   MATCHREG_LOG_MAX_BYTES='20000', MATCHREG_LOG_BACKUPS='2')
+        result = subprocess.run([sys.executable, '-c', LOGGING_SCRIPT], cwd=directory, env=env,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+        backups = sorted(glob.glob(os.path.join(directory, 'match_registrar.log.*.gz')))
+        print(f"Backups: {[os.path.basename(b) for b in backups]}")
+        assert len(backups) == 2
+        assert os.path.getsize(os.path.join(directory, 'match_registrar.log')) <= 20000
+
+        with gzip.open(backups[0], 'rt') as f:
+            entry = json.loads(f.readline())
+        assert entry['level'] == 'INFO' and entry['match'] == 'NSPS Run & Gun'
+        with open(os.path.join(directory, 'match_registrar.log')) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[-1]['message'].startswith('record 1999')
+        print("✅ Rotation, compression and JSON output working")
+
+if __name__ == "__main__":
+    print("🧪 Testing logging pipeline")
+    print("=" * 50)
+    test_rotation_and_json()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test registration-open prediction and probe scheduling
+"""
+
+import os
+import time
+import tempfile
+from datetime import datetime, timedelta
+from match_info import parse_match_date, match_type, local_timezone, days_until_match, date_filter_reason
+from match_state import MatchStateStore
+from match_forecast import OpenTimeForecaster, ProbeScheduler
+
+DAY = 24 * 3600
+
+def test_match_info():
+    """Dates come from titles or slugs; types from keywords"""
+    date = parse_match_date("NSPS Run & Gun 07/28/25")
+    assert (date.year, date.month, date.day) == (2025, 7, 28) and date.tzinfo is not None
+    date = parse_match_date("NSPS Practice with Purpose", "/nsps-practice-with-purpose-07-24-25/register")
+    assert (date.month, date.day) == (7, 24)
+    assert parse_match_date("NSPS Run & Gun") is None
+    assert match_type("NSPS Run & Gun 07/28/25") == 'run_gun'
+    assert match_type("", "/nsps-practice-with-purpose-07-24-25") == 'pwp'
+
+def test_date_filter():
+    """Past and far-out matches are dropped; undated ones are kept"""
+    now = local_timezone().localize(datetime(2025, 7, 20, 23, 30))
+    assert days_until_match("NSPS Run & Gun 07/28/25", now=now) == 8
+    assert date_filter_reason("NSPS Run & Gun 07/28/25", horizon_days=60, now=now) is None
+    assert date_filter_reason("NSPS Run & Gun 07/20/25", horizon_days=60, now=now) is None
+    assert date_filter_reason("NSPS Run & Gun 07/19/25", horizon_days=60, now=now) == "match date has passed"
+    assert date_filter_reason("NSPS Run & Gun 10/28/25", horizon_days=60, now=now) == "more than 60 days out"
+    assert date_filter_reason("NSPS Run & Gun 10/28/25", horizon_days=0, now=now) is None
+    assert date_filter_reason("NSPS Run & Gun", horizon_days=60, now=now) is None
+
+def history_store(path: str) -> MatchStateStore:
+    """Three past Run & Gun matches that opened 7 days (+/- 1h) before the match"""
+    store = MatchStateStore(path)
+    today = time.time()
+    for weeks_ago, jitter in [(3, -3600), (4, 0), (5, 3600)]:
+        title = f"NSPS Run & Gun {datetime.fromtimestamp(today - weeks_ago * 7 * DAY):%m/%d/%y}"
+        match_ts = parse_match_date(title).timestamp()
+        opened = match_ts - 7 * DAY + jitter
+        entry = store.entry(f"/{weeks_ago}/register", title)
+        entry['last_not_open_at'] = opened - 1800
+        entry['first_open_at'] = opened + 1800
+    return store
+
+def test_prediction_and_scheduling():
+    with tempfile.TemporaryDirectory() as directory:
+        store = history_store(os.path.join(directory, 'match_state.json'))
+        forecaster = OpenTimeForecaster(store)
+        scheduler = ProbeScheduler(forecaster, near_interval=900, far_interval=3 * DAY)
+
+        # A match 20 days out should open about 7 days before its date
+        title = f"NSPS Run & Gun {datetime.now() + timedelta(days=20):%m/%d/%y}"
+        prediction = forecaster.predict(title, "")
+        assert prediction['samples'] == 3
+        assert abs((parse_match_date(title).timestamp() - prediction['opens_at']) / DAY - 7) < 0.1
+        print(f"Predicted opening {(prediction['opens_at'] - time.time()) / DAY:.1f} days from now")
+
+        # Checked an hour ago and the window is far away - no probe this run
+        entry = {'status': 'not_open', 'checked_at': time.time() - 3600}
+        assert not scheduler.should_probe(title, "", entry)
+
+        # A match 7 days out is inside its predicted window and gets probed
+        soon_title = f"NSPS Run & Gun {datetime.now() + timedelta(days=7):%m/%d/%y}"
+        assert scheduler.should_probe(soon_title, "", entry)
+
+        # Practice with Purpose has no history - original behavior, probe every run
+        assert scheduler.should_probe(f"NSPS Practice with Purpose {datetime.now() + timedelta(days=20):%m/%d/%y}", "", entry)
+        print("✅ Scheduler defers far matches and probes near ones")
+
+if __name__ == "__main__":
+    print("🧪 Testing registration-open forecasting")
+    print("=" * 50)
+    test_match_info()
+    test_date_filter()
+    test_prediction_and_scheduling()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test club page parsing and match page classification without a browser
+"""
+
+from practiscore_standin import StandinServer, club_page_html, match_page, default_matches
+from match_registrar import parse_match_elements, classify_match_page, paid_title_indicator
+
+def test_parse_club_page():
+    """Only target matches are parsed, with their registration URLs"""
+    fixtures = default_matches()
+    matches = parse_match_elements(club_page_html(fixtures), 'NSPS')
+
+    expected = [m for m in fixtures if 'NSPS' in m['title']]
+    print(f"Parsed {len(matches)} matches (expected {len(expected)})")
+    assert [m['title'] for m in matches] == [m['title'] for m in expected]
+    assert all(m['url'].endswith('/register') for m in matches)
+
+def test_classify_match_pages():
+    """Each fixture status maps to the registrar's status"""
+    standin = StandinServer()
+    expected = {'open': 'open', 'not_open': 'not_open', 'full': 'full'}
+    for match in standin.matches:
+        if match['status'] not in expected or paid_title_indicator(match['title']):
+            continue
+        status = classify_match_page(match_page(standin, match, None))
+        print(f"{match['title']}: {status}")
+        assert status == expected[match['status']]
+
+    assert classify_match_page("<p>Match fee: $20</p>") == "paid_match"
+
+if __name__ == "__main__":
+    print("🧪 Testing match parsing and classification")
+    print("=" * 50)
+    test_parse_club_page()
+    test_classify_match_pages()
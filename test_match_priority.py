@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the match priority model and candidate queue (no Chrome needed)
+"""
+
+import os
+import time
+import tempfile
+from datetime import datetime, timedelta
+from practiscore_standin import StandinServer
+from testing_support import HttpDriver, standin_env
+
+def dated(name: str, days: int) -> str:
+    return f"{name} {datetime.now() + timedelta(days=days):%m/%d/%y}"
+
+def test_priority_scores():
+    from match_forecast import OpenTimeForecaster
+    from match_priority import MatchPrioritizer
+    from match_state import MatchStateStore
+
+    with tempfile.TemporaryDirectory() as directory:
+        with standin_env(PRIORITY_KEYWORDS='steel=4,night=-1'):
+            state = MatchStateStore(os.path.join(directory, 'match_state.json'))
+            prioritizer = MatchPrioritizer(OpenTimeForecaster(state))
+
+            print("1️⃣ Type, date and keywords")
+            run_gun, pwp = dated('NSPS Run & Gun', 7), dated('NSPS Practice with Purpose', 7)
+            assert prioritizer.score(run_gun) > prioritizer.score(pwp)
+            assert prioritizer.score(dated('NSPS Run & Gun', 3)) > prioritizer.score(dated('NSPS Run & Gun', 30))
+            assert prioritizer.score(dated('NSPS Steel Challenge', 7)) > prioritizer.score(run_gun)
+            assert prioritizer.score(dated('NSPS Night Run & Gun', 7)) < prioritizer.score(run_gun)
+
+            print("2️⃣ Types that filled fast before rank higher")
+            now = time.time()
+            for days in (14, 21):
+                url = f"/pwp-{days}/register"
+                state.entry(url, dated('NSPS Practice with Purpose', -days)).update(
+                    {'first_open_at': now - 3 * 3600, 'first_full_at': now - 2 * 3600})
+            assert prioritizer.forecaster.fill_hours('pwp') == 1.0
+            assert prioritizer.forecaster.fill_hours('run_gun') is None
+            print(f"   {prioritizer.components(pwp)}")
+            assert prioritizer.score(pwp) > prioritizer.score(run_gun)
+
+            print("3️⃣ MATCH_PRIORITY=off keeps the club page order")
+            os.environ['MATCH_PRIORITY'] = 'off'
+            matches = [{'title': pwp}, {'title': run_gun}, {'title': dated('NSPS Steel Challenge', 7)}]
+            assert MatchPrioritizer().rank(matches) == matches
+            print("✅ Priority scores working")
+
+def test_candidate_queue():
+    from match_priority import MatchPrioritizer
+
+    print("4️⃣ The queue hands out the best match waiting")
+    scores = {}
+    candidates = MatchPrioritizer().queue(scores)
+    later, soon, pwp = ({'title': dated('NSPS Run & Gun', 30)}, {'title': dated('NSPS Run & Gun', 2)},
+                        {'title': dated('NSPS Practice with Purpose', 2)})
+    candidates.put(later)
+    taken = candidates.get()
+    candidates.put(pwp)
+    candidates.put(soon)
+    # Taken before the better ones arrived - swapped for the best waiting
+    assert taken is later and candidates.exchange(taken) is soon
+    candidates.put(None)
+    assert [candidates.get(), candidates.get(), candidates.get()] == [pwp, later, None]
+    assert set(scores) == {later['title'], soon['title'], pwp['title']}
+    print("✅ Candidate queue working")
+
+def test_run_probes_by_priority():
+    with StandinServer(latency=0.02) as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, COOKIE_CACHE='off', REGISTRATION_MAX_PER_RUN='1',
+                         PRIORITY_KEYWORDS='steel=10'):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            print("5️⃣ The preferred match is probed and registered for first")
+            registrar = PractiscoreRegistrar()
+            registered = []
+
+            def slow_login(driver):
+                # Long enough for the whole club page to be queued
+                time.sleep(0.3)
+                return True
+
+            registrar._launch_driver = HttpDriver
+            registrar._settle = lambda *args: None
+            registrar.login = slow_login
+            registrar.register_for_match = lambda url, **kwargs: registered.append(url) or True
+            registrar._notifier = NullNotifier()
+            registrar.run_check()
+
+            probed = list(registrar.report.sections['results'])
+            priority = registrar.report.sections['priority']
+            print(f"   probe order: {probed}")
+            steel = next(m for m in server.matches if 'Steel' in m['title'])
+            assert probed[0] == steel['title']
+            assert registered == [f"/{steel['slug']}/register"]
+            assert probed == sorted(probed, key=lambda title: -priority[title])
+            print("✅ Runs follow the priority order")
+
+if __name__ == "__main__":
+    print("🧪 Testing match priority")
+    print("=" * 50)
+    test_priority_scores()
+    test_candidate_queue()
+    test_run_probes_by_priority()
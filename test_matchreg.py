@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the matchreg CLI against the local stand-in (no Chrome needed)
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tempfile
+from practiscore_standin import StandinServer
+from testing_support import browser_login
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _run(args, directory, server=None):
+    env = dict(os.environ, PYTHONPATH=REPO_DIR, PRACTISCORE_USERNAME='shooter@example.com',
+               PRACTISCORE_PASSWORD='secret', MATCH_STATE_PATH=os.path.join(directory, 'match_state.json'),
+               COOKIE_CACHE_PATH=os.path.join(directory, 'cookies.json'), RATE_LIMIT_PER_MINUTE='6000')
+    if server:
+        env['PRACTISCORE_BASE_URL'] = server.url
+    return subprocess.run([sys.executable, os.path.join(REPO_DIR, 'matchreg.py')] + args,
+                          cwd=directory, env=env, capture_output=True, text=True)
+
+def _cache_cookies(directory, cookies):
+    with open(os.path.join(directory, 'cookies.json'), 'w') as f:
+        json.dump({'saved_at': 0, 'cookies': cookies}, f)
+
+def _saved_statuses(directory):
+    with open(os.path.join(directory, 'match_state.json')) as f:
+        return {entry['title']: entry.get('status') for entry in json.load(f)['matches'].values()}
+
+def test_chained_scan_status_plan():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        # Logged in by an earlier process, and already registered for one open match
+        _, cookies = browser_login(server)
+        _cache_cookies(directory, cookies)
+        registered = next(m for m in server.matches if m['status'] == 'open')
+        server.registrations[registered['slug']] = [{'session': cookies[0]['value']}]
+
+        result = _run(['scan', '--http', '+', 'status', '+', 'plan'], directory, server)
+        print(result.stdout)
+        assert result.returncode == 0, result.stderr
+        assert "6 matching events in the catalog" in result.stdout
+        for status in ('open', 'not_open', 'full', 'paid_match', 'already_registered'):
+            assert f" {status} " in result.stdout, status
+        assert "REGISTER" in result.stdout
+
+        # One process: the club page once, each upcoming match page once, the login only checked
+        assert server.request_counts.get('GET /clubs/north_shore_practical_shooters') == 1
+        assert server.request_counts.get('GET /login') == 1
+        assert server.request_counts.get('POST /login') == 1  # the earlier process's
+        statuses = _saved_statuses(directory)
+        assert {'open', 'not_open', 'full', 'paid_match'} <= set(statuses.values())
+        assert statuses[registered['title']] == 'already_registered'
+
+def test_status_with_stale_cookies_saves_nothing():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        _cache_cookies(directory, [{'name': 'ps_session', 'value': 'expired', 'domain': server.host, 'path': '/'}])
+        result = _run(['scan', '--http', '+', 'status', '+', 'plan'], directory, server)
+        print(result.stdout)
+        assert result.returncode == 0, result.stderr
+        # No browser here to log in with, so the logged-out probes are only shown
+        assert "Not logged in" in result.stdout
+        assert set(_saved_statuses(directory).values()) == {None}
+        assert "REGISTER" not in result.stdout
+        assert not os.path.exists(os.path.join(directory, 'cookies.json'))
+
+def test_register_needs_a_unique_match():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        result = _run(['scan', '--http', '+', 'register', 'Run & Gun'], directory, server)
+        assert result.returncode == 1 and "matches 3 matches" in result.stdout
+
+def test_doctor_offline():
+    with tempfile.TemporaryDirectory() as directory:
+        result = _run(['doctor', '--offline'], directory)
+        print(result.stdout)
+        assert "Credentials: set" in result.stdout
+        assert "Catalog: 0 matches, updated never" in result.stdout
+
+if __name__ == "__main__":
+    print("🧪 Testing matchreg CLI")
+    print("=" * 50)
+    test_chained_scan_status_plan()
+    test_status_with_stale_cookies_saves_nothing()
+    test_register_needs_a_unique_match()
+    test_doctor_offline()
@@ -4,8 +4,8 @@ Test script to verify system readiness for Monday's automated registration
 """
 
 import os
-from datetime import datetime, timedelta
-from match_registrar import PractiscoreRegistrar
+from match_info import days_until_match, date_filter_reason
+from match_registrar import PractiscoreRegistrar, setup_logging
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -63,15 +63,13 @@ def test_monday_readiness():
         print(f"   📊 Found {len(run_gun_matches)} Run & Gun matches")
         print(f"   📊 Found {len(practice_matches)} Practice with Purpose matches")
         
-        # Show upcoming matches that would be targeted
-        today = datetime.now()
-        monday = today + timedelta(days=(7-today.weekday()) % 7)  # Next Monday
-        
+        # Show upcoming matches that would be targeted (dated, not past, within the horizon)
         upcoming_matches = []
         for match in run_gun_matches:
             match_title = match.get('title', '')
-            # Look for dates in title that might indicate upcoming matches
-            if any(date_str in match_title for date_str in ['07/28', '08/', '09/']):
+            match_url = match.get('url', '')
+            if (days_until_match(match_title, match_url) is not None
+                    and not date_filter_reason(match_title, match_url, registrar.horizon_days)):
                 upcoming_matches.append(match)
         
         if upcoming_matches:
@@ -191,4 +189,5 @@ def test_monday_readiness():
     return all_tests_passed
 
 if __name__ == "__main__":
+    setup_logging()
     test_monday_readiness()
\ No newline at end of file
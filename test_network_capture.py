@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test parsing match lists and registration state from captured XHR/JSON
+"""
+
+import json
+import urllib.request
+from network_capture import json_responses, matches_from_json, registration_status_from_json
+from match_registrar import parse_match_elements
+from practiscore_standin import StandinServer, CLUB_PATH, CLUB_API_PATH, MATCH_API_PREFIX
+from testing_support import standin_env
+
+class FakePerformanceDriver:
+    """Serves recorded responses through get_log('performance') and Network.getResponseBody"""
+
+    def __init__(self, responses):
+        self.bodies = {}
+        self.entries = []
+        for i, (url, mime_type, body) in enumerate(responses):
+            request_id = str(i)
+            self.bodies[request_id] = body
+            message = {'message': {'method': 'Network.responseReceived', 'params': {
+                'requestId': request_id, 'type': 'XHR',
+                'response': {'url': url, 'mimeType': mime_type, 'status': 200}}}}
+            self.entries.append({'message': json.dumps(message)})
+        self.entries.append({'message': json.dumps({'message': {'method': 'Network.dataReceived', 'params': {}}})})
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == 'Network.getResponseBody'
+        return {'body': self.bodies[params['requestId']], 'base64Encoded': False}
+
+def _fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode()
+
+def test_json_matches_agree_with_dom():
+    with StandinServer() as server:
+        club_json = _fetch(server.url + CLUB_API_PATH)
+        driver = FakePerformanceDriver([
+            (server.url + '/static/app.css', 'text/css', 'body {}'),
+            (server.url + CLUB_API_PATH, 'application/json', club_json),
+        ])
+        responses = json_responses(driver)
+        assert len(responses) == 1
+
+        from_json = matches_from_json(responses, 'NSPS')
+        from_dom = parse_match_elements(_fetch(server.url + CLUB_PATH), 'NSPS')
+        print(f"JSON: {len(from_json)} matches, DOM: {len(from_dom)} matches")
+        assert [(m['title'], m['url']) for m in from_json] == [(m['title'], m['url']) for m in from_dom]
+
+def test_registration_status_from_json():
+    with StandinServer() as server:
+        for match in server.matches:
+            match_url = f"/{match['slug']}/register"
+            payload = json.loads(_fetch(server.url + MATCH_API_PREFIX + match['slug']))
+            status = registration_status_from_json([(match_url, payload)], match_url)
+            expected = match['status'] if match['status'] != 'closed' else None
+            assert status == expected, (match['title'], status)
+        print("✅ Registration status parsed from JSON")
+
+def test_registered_flag_and_missing_match():
+    url = '/nsps-run-gun-07-28-25/register'
+    payload = {'data': [{'name': 'NSPS Run & Gun 07/28/25', 'slug': 'nsps-run-gun-07-28-25',
+                         'registration_status': 'open', 'registered': True}]}
+    assert registration_status_from_json([('', payload)], url) == 'already_registered'
+    assert registration_status_from_json([('', payload)], '/other-match/register') is None
+
+class PaidPageDriver(FakePerformanceDriver):
+    """A paid match page whose registration JSON has no fee field"""
+
+    title = "NSPS Steel Challenge"
+    page_source = "<h1>NSPS Steel Challenge</h1><p>Entry fee: $25, paid at check-in</p><button>Register</button>"
+
+    def get(self, url):
+        pass
+
+def test_paid_page_wins_over_json():
+    import tempfile
+    from match_registrar import PractiscoreRegistrar
+
+    url = '/nsps-steel-challenge/register'
+    payload = {'match': {'slug': 'nsps-steel-challenge', 'registration_status': 'open'}}
+    assert registration_status_from_json([(url, payload)], url) == 'open'
+
+    with tempfile.TemporaryDirectory() as directory:
+        with standin_env(directory=directory, COOKIE_CACHE='off', NETWORK_CAPTURE='true'):
+            registrar = PractiscoreRegistrar()
+            registrar._settle = lambda *args: None
+            driver = PaidPageDriver([('https://practiscore.com/api' + url, 'application/json', json.dumps(payload))])
+            status = registrar.check_registration_status(url, 'NSPS Steel Challenge', driver=driver)
+            print(f"Paid page with a fee-less JSON status: {status}")
+            assert status == 'paid_match'
+
+if __name__ == "__main__":
+    print("🧪 Testing network capture parsing")
+    print("=" * 50)
+    test_json_matches_agree_with_dom()
+    test_registration_status_from_json()
+    test_registered_flag_and_missing_match()
+    test_paid_page_wins_over_json()
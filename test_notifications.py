@@ -4,6 +4,7 @@ Test notification system
 """
 
 from notifications import NotificationManager
+from logging_setup import setup_logging
 
 def test_notifications():
     """Test notification functionality"""
@@ -43,4 +44,5 @@ def test_notifications():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     test_notifications()
\ No newline at end of file
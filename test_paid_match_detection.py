@@ -3,7 +3,7 @@
 Test paid match detection
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_paid_match_detection():
     """Test detection of paid matches (classifiers, etc.)"""
@@ -59,6 +59,7 @@ def test_paid_match_detection():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing Paid Match Detection")
     print("=" * 60)
     test_paid_match_detection()
\ No newline at end of file
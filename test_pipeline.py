@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test that login overlaps the club page fetch and probes share one browser (no Chrome needed)
+"""
+
+import time
+import tempfile
+from practiscore_standin import StandinServer
+from testing_support import HttpDriver, standin_env
+
+LOGIN_SECONDS = 0.6
+
+def test_login_overlaps_club_fetch():
+    with StandinServer(latency=0.2) as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, COOKIE_CACHE='off', REGISTRATION_MAX_PER_RUN='0'):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            registrar = PractiscoreRegistrar()
+            drivers = []
+
+            def launch():
+                drivers.append(HttpDriver())
+                return drivers[-1]
+
+            def slow_login(driver):
+                time.sleep(LOGIN_SECONDS)
+                return True
+
+            registrar._launch_driver = launch
+            registrar._settle = lambda *args: None
+            registrar.login = slow_login
+            registrar._notifier = NullNotifier()
+            registrar.run_check()
+
+            stages = registrar.report.sections['pipeline']
+            probed = registrar.report.sections['results']
+            print(f"Stages: {stages}")
+            loaded = [title for title, status in probed.items() if status != 'paid_match']
+            print(f"Probed {len(probed)} matches with {len(drivers)} browsers")
+            # The club page (one 0.2s load) came in while the login was still running,
+            # so the run is shorter than login, club page and probes one after another
+            assert stages['first_candidate_at'] < LOGIN_SECONDS
+            serial = stages['login_seconds'] + stages['club_page_seconds'] + 0.2 * len(loaded)
+            assert stages['wall_seconds'] < serial - 0.1
+            # One browser for the club page, one logged-in browser for every probe (one load each)
+            assert len(drivers) == 2 and len(loaded) >= 3
+            assert registrar.report.counters['page_loads'] == 1 + len(loaded)
+            assert set(probed.values()) >= {'open', 'not_open', 'full'}
+            print("✅ Pipeline overlap working")
+
+if __name__ == "__main__":
+    print("🧪 Testing the run pipeline")
+    print("=" * 50)
+    test_login_overlaps_club_fetch()
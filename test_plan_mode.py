@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test planning mode - decisions from cached state without a browser
+"""
+
+import os
+import sys
+import time
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from match_state import MatchStateStore
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def dated(name: str, days: int) -> tuple:
+    """(title, url) for a match the given number of days from today"""
+    date = datetime.now() + timedelta(days=days)
+    slug = '-'.join(name.lower().replace('&', '').split())
+    return f"{name} {date:%m/%d/%y}", f"/{slug}-{date:%m-%d-%y}/register"
+
+RUN_GUN = dated('NSPS Run & Gun', 7)
+CLASSIFIERS = dated('NSPS Run & Gun - with USPSA Classifiers', 3)
+PWP_FULL = dated('NSPS Practice with Purpose', 2)
+PWP_REGISTERED = dated('NSPS Practice with Purpose', 9)
+RUN_GUN_LATER = dated('NSPS Run & Gun', 14)
+RUN_GUN_UNKNOWN = dated('NSPS Run & Gun', 21)
+RUN_GUN_PAST = dated('NSPS Run & Gun', -7)
+RUN_GUN_FAR = dated('NSPS Run & Gun', 120)
+
+def build_state(path: str) -> None:
+    """A cached catalog covering every decision"""
+    store = MatchStateStore(path)
+    catalog = [RUN_GUN, CLASSIFIERS, PWP_FULL, PWP_REGISTERED, RUN_GUN_LATER, RUN_GUN_UNKNOWN,
+               RUN_GUN_PAST, RUN_GUN_FAR]
+    store.update_catalog([{'title': title, 'url': url} for title, url in catalog])
+    store.record_status(RUN_GUN[1], RUN_GUN[0], 'open')
+    store.record_status(PWP_FULL[1], PWP_FULL[0], 'full')
+    store.mark_registered(PWP_REGISTERED[1])
+    store.record_status(RUN_GUN_LATER[1], RUN_GUN_LATER[0], 'open')
+    store.record_status(RUN_GUN_PAST[1], RUN_GUN_PAST[0], 'open')
+    store.save()
+
+def test_plan_decisions():
+    """Each cached state maps to the expected action"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'match_state.json')
+        build_state(path)
+        env = dict(os.environ, PYTHONPATH=REPO_DIR, MATCH_STATE_PATH=path,
+                   PRACTISCORE_USERNAME='user', PRACTISCORE_PASSWORD='pass')
+
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, os.path.join(REPO_DIR, 'match_registrar.py'), '--plan'],
+                                cwd=directory, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        print(result.stdout)
+        assert result.returncode == 0, result.stderr
+        assert elapsed < 1.0, f"plan took {elapsed:.2f}s"
+
+        actions = [line.split()[1] for line in result.stdout.splitlines() if line[:1] not in (' ', 'C')]
+        assert actions == ['REGISTER', 'NOTIFY', 'SKIP', 'SKIP', 'SKIP', 'PROBE', 'SKIP', 'SKIP']
+        assert "limit of 1 registration(s) per run reached" in result.stdout
+        assert "match date has passed" in result.stdout and "more than 60 days out" in result.stdout
+        assert not os.path.exists(os.path.join(directory, 'match_registrar.log'))
+        print(f"✅ Plan built in {elapsed * 1000:.0f} ms")
+
+def test_plan_registration_policy():
+    """REGISTRATION_MAX_PER_RUN and REGISTRATION_MATCH_TYPES shape the register decisions"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'match_state.json')
+        build_state(path)
+        for policy, expected in [
+            ({'REGISTRATION_MAX_PER_RUN': '2'}, ['REGISTER', 'NOTIFY', 'SKIP', 'SKIP', 'REGISTER', 'PROBE', 'SKIP', 'SKIP']),
+            ({'REGISTRATION_MATCH_TYPES': 'pwp'}, ['SKIP', 'NOTIFY', 'SKIP', 'SKIP', 'SKIP', 'PROBE', 'SKIP', 'SKIP']),
+            ({'MATCH_HORIZON_DAYS': '0'}, ['REGISTER', 'NOTIFY', 'SKIP', 'SKIP', 'SKIP', 'PROBE', 'SKIP', 'PROBE']),
+        ]:
+            env = dict(os.environ, PYTHONPATH=REPO_DIR, MATCH_STATE_PATH=path,
+                       PRACTISCORE_USERNAME='user', PRACTISCORE_PASSWORD='pass', **policy)
+            result = subprocess.run([sys.executable, os.path.join(REPO_DIR, 'match_registrar.py'), '--plan'],
+                                    cwd=directory, env=env, capture_output=True, text=True)
+            assert result.returncode == 0, result.stderr
+            actions = [line.split()[1] for line in result.stdout.splitlines() if line[:1] not in (' ', 'C')]
+            print(f"{policy}: {actions}")
+            assert actions == expected
+
+if __name__ == "__main__":
+    print("🧪 Testing planning mode")
+    print("=" * 50)
+    test_plan_decisions()
+    test_plan_registration_policy()
@@ -4,7 +4,7 @@ Test registration for Practice with Purpose match on 07/24/25
 """
 
 import os
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 import time
 
 def test_practice_purpose_registration():
@@ -88,6 +88,7 @@ def test_practice_purpose_registration():
         return False
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing Practice with Purpose 07/24/25 registration...")
     print("=" * 70)
     success = test_practice_purpose_registration()
@@ -3,7 +3,7 @@
 Test registration for Practice with Purpose match
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 import time
 
 def test_practice_registration():
@@ -71,6 +71,7 @@ def test_practice_registration():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing Practice with Purpose registration...")
     print("=" * 60)
     test_practice_registration()
\ No newline at end of file
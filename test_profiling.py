@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test the opt-in profiling hooks
+"""
+
+import os
+import glob
+import pstats
+import tempfile
+from profiling import run_profiled, profile_mode, WebDriverTracer
+
+def busy_work(n: int) -> int:
+    """Something for the profilers to look at"""
+    total = 0
+    for i in range(n):
+        total += sum(j * j for j in range(200))
+    return total
+
+def test_profile_outputs():
+    """cProfile and sampler outputs are written to MATCHREG_PROFILE_DIR"""
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['MATCHREG_PROFILE_DIR'] = directory
+        try:
+            result = run_profiled("busy", busy_work, 2000, mode='all')
+        finally:
+            del os.environ['MATCHREG_PROFILE_DIR']
+
+        assert result == busy_work(2000)
+        prof = glob.glob(os.path.join(directory, "profile-busy-*.prof"))
+        collapsed = glob.glob(os.path.join(directory, "profile-busy-*.collapsed"))
+        assert prof and collapsed
+        stats = pstats.Stats(prof[0])
+        assert any(func[2] == 'busy_work' for func in stats.stats)
+        with open(collapsed[0]) as f:
+            lines = f.read().splitlines()
+        assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        print(f"✅ Wrote {os.path.basename(prof[0])} and {len(lines)} collapsed stacks")
+
+def test_profile_mode_from_environment():
+    """MATCHREG_PROFILE=1 means every profiler"""
+    os.environ['MATCHREG_PROFILE'] = '1'
+    try:
+        assert profile_mode() == 'all'
+    finally:
+        del os.environ['MATCHREG_PROFILE']
+    assert profile_mode() is None
+
+def test_webdriver_tracer_restores_execute():
+    """The WebDriver patch is undone after the run"""
+    from selenium.webdriver.remote.webdriver import WebDriver
+    original = WebDriver.execute
+    tracer = WebDriverTracer()
+    tracer.install()
+    assert WebDriver.execute is not original
+    tracer.uninstall()
+    assert WebDriver.execute is original
+
+if __name__ == "__main__":
+    print("🧪 Testing profiling hooks")
+    print("=" * 50)
+    test_profile_outputs()
+    test_profile_mode_from_environment()
+    test_webdriver_tracer_restores_execute()
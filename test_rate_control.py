@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the adaptive rate controller
+"""
+
+import time
+import tempfile
+from rate_control import RateController, RequestBudgetExceeded, rate_limited_session
+from practiscore_standin import StandinServer, CLUB_PATH
+from testing_support import HttpDriver, standin_env
+
+URL = "https://practiscore.com/clubs/north_shore_practical_shooters"
+
+def test_token_bucket_paces_requests():
+    """After the burst, requests are spaced at the configured rate"""
+    controller = RateController(base_rate=600, burst=2, budget=100, cooldown=0)
+    start = time.monotonic()
+    for _ in range(4):
+        controller.acquire(URL)
+    elapsed = time.monotonic() - start
+    print(f"4 requests at 600/min with burst 2 took {elapsed:.2f}s")
+    assert 0.15 < elapsed < 0.5
+
+def test_challenge_slows_down_and_boost_is_refused():
+    controller = RateController(base_rate=60, burst=1, max_rate=120, budget=100, cooldown=0)
+    controller.on_challenge(URL)
+    assert controller.snapshot()['practiscore.com']['rate_per_minute'] == 30
+    controller.boost(URL)
+    assert controller.snapshot()['practiscore.com']['rate_per_minute'] == 30
+    for _ in range(20):
+        controller.on_success(URL)
+    assert controller.snapshot()['practiscore.com']['rate_per_minute'] == 60
+
+def test_budget_is_enforced():
+    controller = RateController(base_rate=6000, burst=10, budget=3, cooldown=0)
+    for _ in range(3):
+        controller.acquire(URL)
+    try:
+        controller.acquire(URL)
+    except RequestBudgetExceeded:
+        print("✅ Budget enforced")
+    else:
+        raise AssertionError("budget was not enforced")
+    assert controller.remaining(URL) == 0
+
+def test_zero_budget_is_kept():
+    """An explicit 0 means no requests, not the default budget"""
+    with standin_env(RATE_BUDGET_PER_RUN='300'):
+        controller = RateController(base_rate=6000, burst=10, min_rate=0, budget=0, cooldown=0)
+    assert controller.budget == 0 and controller.min_rate == 0
+    try:
+        controller.acquire(URL)
+    except RequestBudgetExceeded:
+        print("✅ Zero budget kept")
+    else:
+        raise AssertionError("a zero budget fell back to the default")
+
+def test_new_run_renews_budget_and_drops_boost():
+    controller = RateController(base_rate=6000, burst=10, max_rate=12000, budget=2, cooldown=0)
+    controller.boost(URL)
+    controller.acquire(URL)
+    controller.acquire(URL)
+    controller.new_run()
+    assert controller.remaining(URL) == 2
+    assert controller.snapshot()['practiscore.com']['rate_per_minute'] == 6000
+    controller.on_challenge(URL)
+    controller.new_run()
+    # Throttling outlives the run
+    assert controller.snapshot()['practiscore.com']['rate_per_minute'] == 3000
+
+def test_budget_is_per_run():
+    """A long-lived registrar gets a fresh budget every run_check"""
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with standin_env(server, directory, COOKIE_CACHE='off', REGISTRATION_MAX_PER_RUN='0',
+                         RATE_BUDGET_PER_RUN='7', PROBE_SCHEDULING='off'):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            registrar = PractiscoreRegistrar()
+            registrar._launch_driver = HttpDriver
+            registrar._settle = lambda *args: None
+            registrar.login = lambda driver: True
+            registrar._notifier = NullNotifier()
+            for run in range(2):
+                started = time.time()
+                registrar.run_check()
+                results = registrar.report.sections['results']
+                print(f"Run {run + 1}: {results}")
+                assert results and 'error' not in results.values()
+                # Each run reports only itself (a daemon sleeps between runs)
+                assert registrar.report.started_at >= started
+                time.sleep(0.2)
+
+def test_session_goes_through_controller():
+    with StandinServer() as server:
+        controller = RateController(base_rate=6000, burst=10, budget=10, cooldown=0)
+        session = rate_limited_session(controller)
+        session.get(server.url + CLUB_PATH)
+        host = server.url.split('//')[1]
+        assert controller.snapshot()[host]['requests'] == 1
+
+        print("A session request that would wait past the run deadline stops instead")
+        from deadline import Deadline, DeadlineExceeded
+        controller.on_challenge(server.url, retry_after=30)
+        session = rate_limited_session(controller, lambda: Deadline(1))
+        start = time.monotonic()
+        try:
+            session.get(server.url + CLUB_PATH)
+            raise AssertionError("the wait should not outlast the deadline")
+        except DeadlineExceeded:
+            assert time.monotonic() - start < 1
+
+if __name__ == "__main__":
+    print("🧪 Testing rate controller")
+    print("=" * 50)
+    test_token_bucket_paces_requests()
+    test_challenge_slows_down_and_boost_is_refused()
+    test_budget_is_enforced()
+    test_zero_budget_is_kept()
+    test_new_run_renews_budget_and_drops_boost()
+    test_budget_is_per_run()
+    test_session_goes_through_controller()
@@ -3,7 +3,7 @@
 Test registration status checking
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_registration_status():
     """Test checking registration status for found matches"""
@@ -46,6 +46,7 @@ def test_registration_status():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing registration status checking...")
     print("=" * 50)
     test_registration_status()
\ No newline at end of file
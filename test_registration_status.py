@@ -3,7 +3,7 @@
 Test registration status checking with duplicate prevention
 """
 
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_registration_checking():
     """Test complete registration status checking"""
@@ -64,6 +64,7 @@ def test_registration_checking():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing registration status with duplicate prevention...")
     print("=" * 60)
     test_registration_checking()
\ No newline at end of file
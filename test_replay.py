@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test recording a run and replaying it offline (no Chrome needed)
+"""
+
+import os
+import tempfile
+from practiscore_standin import StandinServer
+from replay import replay_run, summarize, load_archive
+from testing_support import HttpDriver, standin_env
+
+def test_record_then_replay():
+    with StandinServer(latency=0.02) as server, tempfile.TemporaryDirectory() as directory:
+        archive = os.path.join(directory, 'run.jsonl.gz')
+        with standin_env(server, directory, COOKIE_CACHE='off', REGISTRATION_MAX_PER_RUN='0',
+                         MATCHREG_RECORD=archive):
+            from match_registrar import PractiscoreRegistrar
+            from replay import NullNotifier
+
+            print("1️⃣ Record a run against the stand-in")
+            registrar = PractiscoreRegistrar()
+            registrar._launch_driver = HttpDriver
+            registrar._settle = lambda *args: None
+            registrar.login = lambda driver: True
+            registrar._notifier = NullNotifier()
+            registrar.run_check()
+            registrar.recorder.close()
+            recorded = {entry['title']: entry.get('status') for entry in registrar.state.data['matches'].values()}
+            summary = summarize(load_archive(archive))
+            print(f"   {summary['records']}, {summary['load_seconds']:.2f}s of loads")
+            assert summary['records']['navigation'] == registrar.report.counters['page_loads']
+
+            print("2️⃣ Replay it with the stand-in stopped")
+            server.stop()
+            del os.environ['MATCHREG_RECORD']
+            results = replay_run(archive)
+            print(f"   replayed in {results['wall_time']:.2f}s: {results['statuses']}")
+            probed = {title: status for title, status in results['statuses'].items() if status}
+            assert probed and all(recorded[title] == status for title, status in probed.items())
+            assert set(probed.values()) >= {'open', 'not_open', 'full'}
+            # Nothing after the replay stays in replay mode
+            assert 'MATCHREG_REPLAY' not in os.environ
+            assert os.environ['MATCH_STATE_PATH'] == os.path.join(directory, 'match_state.json')
+            print("✅ Replay reproduces the recorded statuses")
+
+if __name__ == "__main__":
+    print("🧪 Testing record and replay")
+    print("=" * 50)
+    test_record_then_replay()
@@ -4,7 +4,7 @@ Test script for PractiScore scraper
 """
 
 import os
-from match_registrar import PractiscoreRegistrar
+from match_registrar import PractiscoreRegistrar, setup_logging
 
 def test_basic_functionality():
     """Test basic scraper functionality"""
@@ -32,6 +32,7 @@ def test_basic_functionality():
         return False
 
 if __name__ == "__main__":
+    setup_logging()
     print("🧪 Testing PractiScore scraper functionality...")
     print("=" * 50)
     
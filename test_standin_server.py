@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test the local PractiScore stand-in server used by the offline benchmarks
+"""
+
+import re
+import requests
+from practiscore_standin import StandinServer, CLUB_PATH
+
+def test_standin_flow():
+    """Walk the club page, login, registration form and success page"""
+    with StandinServer(cloudflare_challenges=1) as server:
+        session = requests.Session()
+
+        print("1️⃣ Club page with one Cloudflare challenge...")
+        blocked = session.get(server.url + CLUB_PATH)
+        assert "cloudflare" in blocked.text.lower()
+        club = session.get(server.url + CLUB_PATH)
+        assert club.status_code == 200 and len(club.text) > 10000
+        print(f"   ✅ Club page served ({len(club.text)} characters)")
+
+        print("2️⃣ Logging in...")
+        response = session.post(server.url + "/login", data={'email': 'a@b.c', 'password': 'x'})
+        assert response.url.endswith("/dashboard/home")
+        print("   ✅ Redirected to dashboard")
+
+        print("3️⃣ Registering for an open match...")
+        open_match = next(m for m in server.matches if m['status'] == 'open')
+        match_url = f"{server.url}/{open_match['slug']}/register"
+        assert "button" in session.get(match_url).text
+        form = session.get(match_url + "/form").text
+        token = re.search(r'name="_token" value="(\w+)"', form).group(1)
+        refused = session.post(match_url + "/form", data={'_token': token, 'power_factor': 'minor'})
+        assert "waiver must be accepted" in refused.text
+        token = re.search(r'name="_token" value="(\w+)"', refused.text).group(1)
+        success = session.post(match_url + "/form", data={'_token': token, 'power_factor': 'minor', 'waiver': 'accepted'})
+        assert "you are registered" in success.text.lower()
+        assert "withdraw" in session.get(match_url).text.lower()
+        print("   ✅ Registration recorded")
+
+def test_standin_full_rosters():
+    """Full roster mode hides the register button"""
+    with StandinServer(full_rosters=True) as server:
+        open_match = next(m for m in server.matches if m['status'] == 'open')
+        text = requests.get(f"{server.url}/{open_match['slug']}/register").text.lower()
+        assert "roster full" in text and "button" not in text
+        print("✅ Full roster page served")
+
+if __name__ == "__main__":
+    print("🧪 Testing PractiScore stand-in server")
+    print("=" * 50)
+    test_standin_flow()
+    test_standin_full_rosters()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Test that importing the registrar stays lightweight
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHECK_SCRIPT = """
+import sys
+from match_registrar import PractiscoreRegistrar
+PractiscoreRegistrar()
+print(','.join(m for m in ('selenium', 'bs4', 'requests', 'notifications') if m in sys.modules))
+"""
+
+def test_import_is_lazy():
+    """Importing and constructing the registrar loads no heavy modules and opens no log file"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, PYTHONPATH=REPO_DIR, PRACTISCORE_USERNAME='user', PRACTISCORE_PASSWORD='pass')
+        result = subprocess.run([sys.executable, '-c', CHECK_SCRIPT], cwd=directory, env=env,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        print(f"Heavy modules loaded: {result.stdout.strip() or 'none'}")
+        assert result.stdout.strip() == ""
+        assert not os.path.exists(os.path.join(directory, 'match_registrar.log'))
+
+if __name__ == "__main__":
+    print("🧪 Testing lazy startup")
+    print("=" * 50)
+    test_import_is_lazy()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test wait timeouts tuned from step latency history (no Chrome needed)
+"""
+
+import time
+import tempfile
+from step_timeouts import StepTimeouts, wait_until_stable, percentile
+from testing_support import standin_env
+
+def test_timeouts_follow_history():
+    timeouts = StepTimeouts({})
+    print("1️⃣ Without history the fixed wait is used")
+    assert timeouts.timeout('match_page') == 3 and timeouts.timeout('register_button') == 10
+
+    print("2️⃣ Fast days shrink the timeout to the floor, slow days grow it up to the ceiling")
+    for seconds in (0.3, 0.4, 0.35, 0.5, 0.45):
+        timeouts.observe('match_page', seconds)
+    assert timeouts.timeout('match_page') == 1.0
+    for seconds in (4, 4.5, 5, 4.2, 3.9):
+        timeouts.observe('register_button', seconds)
+    assert timeouts.timeout('register_button') == 7.5
+    for _ in range(60):
+        timeouts.observe('register_button', 25)
+    assert timeouts.timeout('register_button') == 30
+    assert len(timeouts.history['register_button']) == 50
+
+    summary = timeouts.summary()
+    print(f"   {summary['match_page']}")
+    assert summary['match_page']['samples'] == 5 and summary['match_page']['p95'] == 0.5
+    assert percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 90) == 9
+    print("✅ Timeouts follow history")
+
+def test_wait_until_stable():
+    start = time.monotonic()
+    read = lambda: int((time.monotonic() - start) / 0.1) if time.monotonic() - start < 0.5 else 'rendered'
+    print("3️⃣ A page that stops changing settles early")
+    elapsed, settled = wait_until_stable(read, timeout=3, minimum=0.2, poll=0.1)
+    assert settled and 0.5 <= elapsed < 1.0
+
+    print("4️⃣ A page that never settles waits out the timeout")
+    elapsed, settled = wait_until_stable(time.monotonic, timeout=0.4, minimum=0.2, poll=0.1)
+    assert not settled and 0.4 <= elapsed < 0.6
+    print("✅ Render waits working")
+
+def test_history_is_kept_between_runs():
+    with tempfile.TemporaryDirectory() as directory:
+        with standin_env(directory=directory, COOKIE_CACHE='off'):
+            from match_registrar import PractiscoreRegistrar
+
+            class StaticPage:
+                page_source = '<html>match</html>'
+
+            print("5️⃣ Render waits are timed, reported and saved with the match state")
+            registrar = PractiscoreRegistrar()
+            registrar._settle(3, StaticPage(), 'match_page')
+            observed = registrar.timeouts.observed['match_page'][0]
+            assert 1.0 <= observed < 1.5  # the floor, not the fixed 3 seconds
+            registrar.state.save()
+            assert PractiscoreRegistrar().state.step_latency() == {'match_page': [observed]}
+            print("✅ Step history kept")
+
+if __name__ == "__main__":
+    print("🧪 Testing tuned step timeouts")
+    print("=" * 50)
+    test_timeouts_follow_history()
+    test_wait_until_stable()
+    test_history_is_kept_between_runs()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the full-roster watcher against the local stand-in (no Chrome needed)
+"""
+
+import os
+import json
+import time
+import tempfile
+from deadline import Deadline
+from practiscore_standin import StandinServer
+from match_registrar import PractiscoreRegistrar
+from testing_support import CookieDriver, RecordingNotifier, browser_login, standin_env
+
+def _environment(server, directory):
+    return standin_env(server, directory, WAITLIST_REPORT_PATH=os.path.join(directory, 'waitlist_report.json'))
+
+def _watching(server, directory):
+    """A registrar with the full match in its state, its form learned and the login shared"""
+    registrar = PractiscoreRegistrar()
+    registrar._notifier = RecordingNotifier()
+    full = next(m for m in server.matches if m['status'] == 'full')
+    url = f"/{full['slug']}/register"
+    registrar.state.update_catalog([{'title': full['title'], 'url': url}])
+    registrar.state.record_status(url, full['title'], 'full')
+
+    # Learn the form and share the login so the trigger submits over HTTP
+    browser, cookies = browser_login(server)
+    full['status'] = 'open'
+    form = browser.get(f"{server.url}{url}/form")
+    full['status'] = 'full'
+    registrar._learn_form_schema(url, form.text, form.url)
+    registrar._copy_cookies_to_session(CookieDriver(cookies))
+
+    def no_browser(*args, **kwargs):
+        raise AssertionError("the watcher should not start a browser")
+    registrar.check_registration_status = registrar._launch_driver = no_browser
+    return registrar, full, url
+
+def test_watcher_registers_when_slot_frees():
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory):
+            from waitlist_watcher import RosterWatcher
+            registrar, full, url = _watching(server, directory)
+            watcher = RosterWatcher(registrar, min_interval=60, max_interval=600)
+            print("1️⃣ First poll - page fetched, still full")
+            assert watcher.refresh() == [url]
+            assert watcher.poll(url) == 'full'
+
+            print("2️⃣ Unchanged page - 304 and the interval backs off")
+            assert watcher.poll(url) is None
+            assert watcher.stats['not_modified'] == 1 and watcher.watched[url]['interval'] == 90
+
+            print("3️⃣ Slot frees up - registered on the next poll")
+            full['status'] = 'open'
+            watcher.watched[url]['due'] = 0
+            assert watcher.run_once() == [full['title']]
+            assert len(server.registrations[full['slug']]) == 1
+            assert registrar.state.is_registered(url)
+            assert watcher.report.sections['waitlist']['registered'] == 1
+            with open(os.environ['WAITLIST_REPORT_PATH']) as f:
+                assert json.load(f)['sections']['waitlist']['registered'] == 1
+            assert 'waitlist' not in registrar.report.sections
+
+            print("4️⃣ Registered - no longer watched")
+            assert watcher.refresh() == []
+
+            print("5️⃣ The per-run limit applies to each watch window, not the watcher's lifetime")
+            assert registrar.registration_blocked(full['title'], url, watcher.window_registered)
+            watcher.run(until=0)
+            assert watcher.window_registered == 0 and watcher.stats['registered'] == 1
+            assert registrar.registration_blocked(full['title'], url, watcher.window_registered) is None
+
+            print("6️⃣ A blocked trigger returns without probing or registering")
+            watcher.watched[url] = {'title': full['title'], 'interval': 60, 'due': 0.0}
+            watcher.window_registered = 1
+            assert watcher.trigger(url) is False and len(server.registrations[full['slug']]) == 1
+            print(f"✅ Watcher stats: {watcher.stats}")
+
+def test_watch_outlasting_run_deadline():
+    """The daemon watches long after run_check's deadline has passed"""
+    with StandinServer() as server, tempfile.TemporaryDirectory() as directory:
+        with _environment(server, directory):
+            from waitlist_watcher import RosterWatcher
+            registrar, full, url = _watching(server, directory)
+            expired = registrar.deadline = Deadline(0.01)
+            time.sleep(0.02)
+            watcher = RosterWatcher(registrar, min_interval=60, max_interval=600)
+            full['status'] = 'open'
+
+            print("1️⃣ A registration that runs out of time is logged, not fatal")
+            os.environ['RUN_DEADLINE_SECONDS'] = '0.000001'
+            assert watcher.run_once() == []
+            assert watcher.report.sections['deadline']['exceeded'] == [full['title']]
+            assert not server.registrations.get(full['slug'])
+
+            print("2️⃣ The next slot is registered with a fresh deadline")
+            os.environ['RUN_DEADLINE_SECONDS'] = '60'
+            registrar.state.record_status(url, full['title'], 'full')
+            watcher.watched.clear()
+            watcher.run(until=time.time() + 1)
+            assert len(server.registrations[full['slug']]) == 1
+            assert registrar.deadline is expired
+
+if __name__ == "__main__":
+    print("🧪 Testing full-roster watcher")
+    print("=" * 50)
+    test_watcher_registers_when_slot_frees()
+    test_watch_outlasting_run_deadline()
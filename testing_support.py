@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Shared fakes for the tests that run against the local stand-in (no Chrome needed)
+"""
+
+import os
+import requests
+from unittest import mock
+from practiscore_standin import SESSION_COOKIE
+
+class HttpDriver:
+    """A 'browser' that fetches pages with requests - enough to run a check against the stand-in"""
+
+    def __init__(self):
+        self.http = requests.Session()
+        self.current_url = 'data:,'
+        self.title = ''
+        self.page_source = ''
+
+    def get(self, url):
+        response = self.http.get(url)
+        self.current_url = response.url
+        self.page_source = response.text
+        start = self.page_source.find('<title>')
+        self.title = self.page_source[start + 7:self.page_source.find('</title>')] if start >= 0 else ''
+
+    def execute_script(self, *args):
+        return None
+
+    def quit(self):
+        pass
+
+class CookieDriver:
+    """Stands in for a logged-in browser when copying cookies to the session"""
+
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def get_cookies(self):
+        return self.cookies
+
+class RecordingNotifier:
+    def __init__(self):
+        self.sent = []
+
+    def notify_registration_success(self, match_title, match_url):
+        self.sent.append(('registered', match_title))
+
+    def notify_match_found(self, match_title, match_url, is_paid=False):
+        self.sent.append(('paid' if is_paid else 'found', match_title))
+
+def standin_env(server=None, directory=None, **values):
+    """Patch os.environ for a registrar (against the stand-in, with its files in directory)
+
+    Use as a with block; the environment is restored afterwards, including anything the
+    test sets itself.
+    """
+    env = {
+        'PRACTISCORE_USERNAME': 'shooter@example.com',
+        'PRACTISCORE_PASSWORD': 'secret',
+        'RATE_LIMIT_PER_MINUTE': '6000',
+    }
+    if server is not None:
+        env['PRACTISCORE_BASE_URL'] = server.url
+    if directory is not None:
+        env.update({
+            'MATCH_STATE_PATH': os.path.join(directory, 'match_state.json'),
+            'RUN_REPORT_PATH': os.path.join(directory, 'run_report.json'),
+            'COOKIE_CACHE_PATH': os.path.join(directory, 'cookies.json'),
+        })
+    env.update(values)
+    return mock.patch.dict(os.environ, env)
+
+def browser_login(server):
+    """Log in like the browser would and return the session and its cookies"""
+    browser = requests.Session()
+    browser.post(server.url + '/login', data={'email': 'shooter@example.com', 'password': 'secret'})
+    cookie = browser.cookies.get(SESSION_COOKIE)
+    return browser, [{'name': SESSION_COOKIE, 'value': cookie, 'domain': server.host, 'path': '/'}]
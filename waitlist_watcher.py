@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Watch full matches for a freed slot and register as soon as one appears
+
+Full matches from match_state.json are polled over the shared requests
+session with conditional GETs (ETag / Last-Modified), so an unchanged page
+costs a 304 and no browser is kept open. The poll interval per match backs
+off while the page stays the same and resets when it changes. When a page
+shows registration open again the normal registration flow runs.
+"""
+
+import os
+import time
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from match_info import parse_match_date, local_timezone
+from deadline import Deadline, DeadlineExceeded
+from match_registrar import probe_page_status
+from run_report import RunReport
+
+logger = logging.getLogger(__name__)
+
+class RosterWatcher:
+    def __init__(self, registrar, min_interval: float = None, max_interval: float = None):
+        self.registrar = registrar
+        self.min_interval = min_interval or float(os.getenv('WAITLIST_MIN_SECONDS', 60))
+        self.max_interval = max_interval or float(os.getenv('WAITLIST_MAX_SECONDS', 1800))
+        self.backoff = float(os.getenv('WAITLIST_BACKOFF', 1.5))
+        self.watched: Dict[str, Dict] = {}
+        self.stats = {'polls': 0, 'not_modified': 0, 'changed': 0, 'triggered': 0, 'registered': 0}
+        # Registrations in the current watch window, against REGISTRATION_MAX_PER_RUN (stats are lifetime)
+        self.window_registered = 0
+        self.report = RunReport()
+        self.report_path = os.getenv('WAITLIST_REPORT_PATH', 'waitlist_report.json')
+
+    def refresh(self) -> List[str]:
+        """Watch every full, unregistered, upcoming match in the state store; returns watched URLs"""
+        state = self.registrar.state
+        today = datetime.now(local_timezone()).replace(hour=0, minute=0, second=0, microsecond=0)
+        for match in state.catalog():
+            url, title = match.get('url', ''), match.get('title', '')
+            entry = state.get(url)
+            match_date = parse_match_date(title, url)
+            if entry.get('status') != 'full' or state.is_registered(url) or (match_date and match_date < today):
+                self.watched.pop(url, None)
+                continue
+            self.watched.setdefault(url, {'title': title, 'interval': self.min_interval, 'due': 0.0})
+        return list(self.watched)
+
+    def poll(self, url: str) -> Optional[str]:
+        """Conditional GET of a match page; the page's status if it changed, else None"""
+        watch = self.watched[url]
+        headers = {}
+        if watch.get('etag'):
+            headers['If-None-Match'] = watch['etag']
+        if watch.get('last_modified'):
+            headers['If-Modified-Since'] = watch['last_modified']
+        response = self.registrar.session.get(self.registrar._full_url(url), headers=headers, timeout=30)
+        self.stats['polls'] += 1
+
+        digest = hashlib.sha1(response.content).hexdigest() if response.status_code == 200 else None
+        if response.status_code == 304 or (digest and digest == watch.get('digest')):
+            self.stats['not_modified'] += 1
+            watch['interval'] = min(self.max_interval, watch['interval'] * self.backoff)
+            return None
+        if response.status_code != 200:
+            logger.debug(f"Roster poll of {url} returned {response.status_code}")
+            watch['interval'] = min(self.max_interval, watch['interval'] * self.backoff)
+            return None
+
+        watch.update(etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified'),
+                     digest=digest, interval=self.min_interval)
+        self.stats['changed'] += 1
+        return probe_page_status(response.text, self.registrar._session_logged_in)
+
+    def trigger(self, url: str) -> bool:
+        """Run the registration flow for a match whose polled page shows registration open"""
+        registrar = self.registrar
+        title = self.watched[url]['title']
+        self.stats['triggered'] += 1
+        logger.info(f"🎟️  Slot opened up: {title}")
+        # The polled page is the probe - no second browser and login while racing for the slot
+        registrar.state.record_status(url, title, "open")
+        blocked = registrar.registration_blocked(title, url, self.window_registered)
+        if blocked:
+            logger.info(f"Not registering: {blocked}")
+            return False
+        # Each registration gets a full RUN_DEADLINE_SECONDS - the watch outlasts the run's deadline
+        window_deadline, registrar.deadline = registrar.deadline, Deadline.from_env()
+        try:
+            success = registrar.register_for_match(url)
+        finally:
+            registrar.deadline = window_deadline
+        registrar.record_registration(title, url, success)
+        self.stats['registered'] += bool(success)
+        self.window_registered += bool(success)
+        return success
+
+    def run_once(self) -> List[str]:
+        """Poll every due match once; returns the titles registered for"""
+        registered = []
+        # Each sweep gets its own request budget, so a long watch never runs dry
+        self.registrar.rate.new_run()
+        now = time.time()
+        for url in self.refresh():
+            watch = self.watched[url]
+            if watch['due'] > now:
+                continue
+            try:
+                status = self.poll(url)
+                if status == "open" and self.trigger(url):
+                    registered.append(watch['title'])
+            except DeadlineExceeded as e:
+                logger.warning(f"⏰ Registration for {watch['title']} ran out of time during {e.phase}")
+                self.report.section('deadline').setdefault('exceeded', []).append(watch['title'])
+            except Exception as e:
+                logger.warning(f"Roster poll failed for {watch['title']}: {e}")
+            watch['due'] = time.time() + watch['interval']
+        self.registrar.state.save()
+        self.report.sections['waitlist'] = dict(self.stats, watching=len(self.watched))
+        self.report.write(self.report_path)
+        return registered
+
+    def run(self, until: float = None) -> None:
+        """Keep polling until the deadline (or until nothing is left to watch)
+        
+        The window has its own report (WAITLIST_REPORT_PATH, default waitlist_report.json);
+        page loads of registrations it triggers are counted there too. The run's deadline
+        has usually passed by now, so polls run without one (the window ends at until).
+        """
+        self.window_registered = 0
+        self.report = RunReport()
+        run_report, self.registrar.report = self.registrar.report, self.report
+        run_deadline, self.registrar.deadline = self.registrar.deadline, Deadline()
+        try:
+            while until is None or time.time() < until:
+                self.run_once()
+                if not self.watched:
+                    logger.info("No full matches left to watch")
+                    return
+                wakeup = min(watch['due'] for watch in self.watched.values())
+                if until is not None:
+                    wakeup = min(wakeup, until)
+                time.sleep(max(0.0, wakeup - time.time()))
+        finally:
+            self.registrar.report = run_report
+            self.registrar.deadline = run_deadline
+            self.report.finish()
+            self.report.write(self.report_path)
+
+if __name__ == "__main__":
+    import argparse
+    from logging_setup import setup_logging
+    from match_registrar import PractiscoreRegistrar
+
+    parser = argparse.ArgumentParser(description="Watch full matches for freed slots")
+    parser.add_argument('--once', action='store_true', help="Poll each full match once and exit")
+    parser.add_argument('--hours', type=float, default=None, help="Stop after this many hours")
+    args = parser.parse_args()
+    setup_logging()
+
+    watcher = RosterWatcher(PractiscoreRegistrar())
+    if not watcher.refresh():
+        print("⚪ No full matches to watch - run match_registrar.py to refresh the catalog")
+    elif args.once:
+        print(f"Registered: {watcher.run_once() or 'none'}")
+    else:
+        print(f"👀 Watching {len(watcher.watched)} full match(es)")
+        watcher.run(until=time.time() + args.hours * 3600 if args.hours else None)